@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Offline analytics for Snake Game
+Streams recorded games through generator stages and reports score
+distributions, causes of death and how long snakes survived after their
+last meal:
+
+    replay files -> decode + re-simulate (process pool) -> Summary
+    high-score rows --------------------------------------> Summary
+
+Replay paths are found lazily and handed to the workers in chunks; each
+worker reduces its chunk to a Summary, and at most ``max_pending`` chunks
+are in flight. Memory therefore depends on the number of distinct scores
+and timings, never on the number of games.
+
+Usage: python analytics.py REPLAY_DIR... [--scores DB] [--workers N] [--json FILE]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import DEATH_WALL, DEATH_SELF
+from highscores import HighScores
+from replay import Replay, ReplayError
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Death causes as reported; None (the player quit) is shown as 'quit'
+DEATH_NAMES = {DEATH_WALL: 'wall', DEATH_SELF: 'self', None: 'quit'}
+
+
+class Summary:
+    """Mergeable aggregate of many games.
+
+    Scores and food-to-death timings are kept as value counts, so the
+    size of a summary does not grow with the number of games.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.errors = 0
+        self.scores = Counter()
+        self.deaths = Counter()
+        self.difficulties = Counter()
+        self.food_to_death = Counter()
+
+    def add(self, score, death, difficulty, food_to_death=None):
+        self.games += 1
+        self.scores[score] += 1
+        self.deaths[DEATH_NAMES.get(death, death)] += 1
+        self.difficulties[difficulty] += 1
+        if food_to_death is not None:
+            self.food_to_death[food_to_death] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        self.errors += other.errors
+        self.scores.update(other.scores)
+        self.deaths.update(other.deaths)
+        self.difficulties.update(other.difficulties)
+        self.food_to_death.update(other.food_to_death)
+        return self
+
+    def to_dict(self):
+        return {
+            'games': self.games,
+            'errors': self.errors,
+            'score': distribution(self.scores),
+            'deaths': dict(self.deaths),
+            'difficulties': dict(self.difficulties),
+            'food_to_death_ticks': distribution(self.food_to_death),
+        }
+
+
+def distribution(counts):
+    """Mean and percentiles of a value -> count mapping."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    result = {'mean': sum(v * n for v, n in counts.items()) / total}
+    wanted = [('p50', 0.5), ('p90', 0.9), ('p99', 0.99)]
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        while wanted and seen >= wanted[0][1] * total:
+            result[wanted.pop(0)[0]] = value
+    result['max'] = max(counts)
+    return result
+
+
+def iter_replay_paths(sources):
+    """Yield replay files under the given files and directories, lazily."""
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        else:
+            yield source
+
+
+def chunked(iterable, size):
+    """Yield lists of up to ``size`` items."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def simulate(replay):
+    """Re-simulate a replay; returns (score, death, food_to_death).
+
+    ``food_to_death`` is the number of ticks between the last food eaten
+    (or the start) and the death, or None if the player quit.
+    """
+    game = replay.new_game()
+    step = game.step
+    turns = dict(replay.events)
+    end_tick = replay.end_tick
+    last_food = 0
+    while game.ticks < end_tick and step(turns.get(game.ticks)):
+        if game.ate:
+            last_food = game.ticks
+    food_to_death = game.ticks - last_food if game.death else None
+    return game.score, game.death, food_to_death
+
+
+def summarize_replays(paths):
+    """Worker stage: decode and re-simulate a chunk of replay files."""
+    summary = Summary()
+    for path in paths:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ReplayError):
+            summary.errors += 1
+            continue
+        score, death, food_to_death = simulate(replay)
+        summary.add(score, death, replay.difficulty, food_to_death)
+    return summary
+
+
+def summarize_scores(rows):
+    """Summary of high-score records (no food timings: no replay)."""
+    summary = Summary()
+    for row in rows:
+        summary.add(row['score'], row['death'], row['difficulty'])
+    return summary
+
+
+def bounded_map(pool, fn, iterable, max_pending):
+    """``pool.map`` that keeps at most ``max_pending`` tasks in flight.
+
+    Results come back in order. The input is only read as far as the
+    in-flight limit allows, so an endless generator is fine.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def analyze_replays(sources, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None):
+    """Summary of every replay under ``sources``."""
+    chunks = chunked(iter_replay_paths(sources), chunk_size)
+    total = Summary()
+    if workers == 1:
+        for chunk in chunks:
+            total.merge(summarize_replays(chunk))
+        return total
+    limit = max_pending or 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in bounded_map(pool, summarize_replays, chunks, limit):
+            total.merge(summary)
+    return total
+
+
+def format_summary(title, summary):
+    lines = [f"{title}: {summary.games} games"
+             + (f" ({summary.errors} unreadable)" if summary.errors else "")]
+    if not summary.games:
+        return "\n".join(lines)
+    score = distribution(summary.scores)
+    lines.append(f"  score: mean {score['mean']:.1f}, median {score['p50']}, "
+                 f"p90 {score['p90']}, p99 {score['p99']}, max {score['max']}")
+    deaths = ", ".join(f"{name} {n} ({100 * n / summary.games:.1f}%)"
+                       for name, n in summary.deaths.most_common())
+    lines.append(f"  deaths: {deaths}")
+    timing = distribution(summary.food_to_death)
+    if timing:
+        lines.append(f"  ticks from last food to death: mean {timing['mean']:.1f}, "
+                     f"median {timing['p50']}, p90 {timing['p90']}, p99 {timing['p99']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze recorded Snake Game games")
+    parser.add_argument("replays", nargs="*", help="replay files or directories of them")
+    parser.add_argument("--scores", metavar="DB", help="also summarize a high-score database")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="replays per work unit")
+    parser.add_argument("--json", metavar="FILE", help="also write the summaries as JSON")
+    args = parser.parse_args(argv)
+    if not args.replays and not args.scores:
+        parser.error("give replay files or directories, or --scores DB")
+
+    report = {}
+    if args.replays:
+        summary = analyze_replays(args.replays, args.workers, args.chunk_size)
+        print(format_summary("Replays", summary))
+        report['replays'] = summary.to_dict()
+    if args.scores:
+        if not os.path.exists(os.path.expanduser(args.scores)):
+            print(f"Error: no database at {args.scores}")
+            sys.exit(1)
+        with HighScores(args.scores) as scores:
+            summary = summarize_scores(scores.games())
+        print(format_summary("High-score table", summary))
+        report['scores'] = summary.to_dict()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Multi-snake arena for Snake Game
+Hundreds or thousands of snakes share one board and move simultaneously
+under the single-player rules (walls, growth, food margin, scoring).
+
+All collisions go through two shared arrays: ``grid`` holds the content of
+every cell and ``owner`` the id of the snake lying on it. Each tick the
+snakes' target cells are collected in a dict, so head-to-head collisions
+and contested food are found by counting, and a tick costs time in the
+number of snakes, not in the number of body segments.
+
+Usage: python arena.py --snakes 1000 --height 200 --width 400 --ticks 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+from config import FOOD_MARGIN, INITIAL_SNAKE_LENGTH, SCORE_INCREMENT
+from engine import (
+    FreeCells, DIRECTIONS, OPPOSITE, UP, DOWN, LEFT, RIGHT,
+    EMPTY, BODY, HEAD, FOOD, WALL, DEATH_WALL, DEATH_SELF,
+)
+from rng import GameRng
+
+# Death causes besides the single-player ones
+DEATH_HEAD = 'head'  # two heads entered the same cell
+DEATH_BODY = 'body'  # ran into another snake
+
+# Random positions tried per snake before giving up on placing it
+PLACE_RETRIES = 100
+
+
+class ArenaSnake:
+    """One snake of an arena."""
+
+    __slots__ = ('id', 'body', 'direction', 'alive', 'death', 'score', 'ate', 'removed')
+
+    def __init__(self, snake_id, body, direction):
+        self.id = snake_id
+        self.body = deque(body)
+        self.direction = direction
+        self.alive = True
+        self.death = None
+        self.score = 0
+        self.ate = False
+        self.removed = None
+
+    @property
+    def head(self):
+        return self.body[0]
+
+    def __len__(self):
+        return len(self.body)
+
+
+class Arena:
+    """Board shared by many snakes moving in lockstep.
+
+    ``snakes`` snakes of the initial length are placed at random with
+    random headings, and ``food`` food items (default one per two snakes)
+    are kept on the board. Placement draws from the arena's ``GameRng``,
+    so a seed and the actions fully determine a battle.
+    """
+
+    def __init__(self, height, width, snakes=0, food=None, food_value=SCORE_INCREMENT,
+                 seed=None, rng=None):
+        self.height = height
+        self.width = width
+        self.rng = rng if rng is not None else GameRng(seed)
+        self.food_value = food_value
+        self.food_target = food if food is not None else max(1, snakes // 2)
+        self.offsets = {UP: -width, DOWN: width, LEFT: -1, RIGHT: 1}
+
+        size = height * width
+        self.grid = bytearray(size)
+        for x in range(width):
+            self.grid[x] = WALL
+            self.grid[(height - 1) * width + x] = WALL
+        for y in range(height):
+            self.grid[y * width] = WALL
+            self.grid[y * width + width - 1] = WALL
+        self.owner = array('i', [-1]) * size
+
+        self.free = FreeCells(size, (
+            y * width + x
+            for y in range(FOOD_MARGIN, height - FOOD_MARGIN)
+            for x in range(FOOD_MARGIN, width - FOOD_MARGIN)
+        ))
+        self.snakes = []
+        self.living = []
+        self.foods = set()
+        self.ticks = 0
+
+        for _ in range(snakes):
+            self.place_snake()
+        self.spawn_food()
+
+    def cell(self, y, x):
+        return y * self.width + x
+
+    def pos(self, cell):
+        return divmod(cell, self.width)
+
+    def add_snake(self, cells, direction):
+        """Put a snake on the given cells (head first); returns it."""
+        snake = ArenaSnake(len(self.snakes), cells, direction)
+        for cell in cells:
+            self.grid[cell] = BODY
+            self.owner[cell] = snake.id
+            self.free.discard(cell)
+        self.grid[cells[0]] = HEAD
+        self.snakes.append(snake)
+        self.living.append(snake)
+        return snake
+
+    def place_snake(self):
+        """Add a snake of the initial length at a random free spot."""
+        for _ in range(PLACE_RETRIES):
+            head = self.free.sample(self.rng)
+            if head is None:
+                break
+            direction = DIRECTIONS[self.rng.below(4)]
+            back = self.offsets[OPPOSITE[direction]]
+            cells = [head + i * back for i in range(INITIAL_SNAKE_LENGTH)]
+            # Leave the cell ahead free too, so no snake starts doomed
+            ahead = head + self.offsets[direction]
+            if all(c in self.free for c in cells) and self.grid[ahead] == EMPTY:
+                return self.add_snake(cells, direction)
+        raise ValueError("no room left to place another snake")
+
+    def place_food(self, cell):
+        self.grid[cell] = FOOD
+        self.foods.add(cell)
+        self.free.discard(cell)
+
+    def spawn_food(self):
+        """Top the food back up to the target count."""
+        while len(self.foods) < self.food_target:
+            cell = self.free.sample(self.rng)
+            if cell is None:
+                break
+            self.place_food(cell)
+
+    def release(self, cell):
+        self.grid[cell] = EMPTY
+        self.owner[cell] = -1
+        self.free.add(cell)
+
+    def step(self, actions=None):
+        """Move every living snake by one cell at the same time.
+
+        ``actions`` maps snake ids to directions (a dict or a list indexed
+        by id); missing or None entries keep going, reverse turns are
+        ignored. Returns the number of snakes still alive.
+        """
+        grid = self.grid
+        owner = self.owner
+        offsets = self.offsets
+        self.ticks += 1
+
+        # Every head's target cell, counted to find head-to-head collisions
+        moves = []
+        targets = {}
+        for snake in self.living:
+            if actions is not None:
+                direction = actions[snake.id] if not isinstance(actions, dict) else actions.get(snake.id)
+                if direction is not None and direction != OPPOSITE[snake.direction]:
+                    snake.direction = direction
+            target = snake.body[0] + offsets[snake.direction]
+            moves.append((snake, target))
+            targets[target] = targets.get(target, 0) + 1
+
+        # A snake eats when it reaches food alone; its tail then stays put
+        for snake, target in moves:
+            snake.ate = grid[target] == FOOD and targets[target] == 1
+            snake.removed = None
+
+        survivors = []
+        dead = []
+        snakes = self.snakes
+        for snake, target in moves:
+            content = grid[target]
+            if targets[target] > 1:
+                snake.death = DEATH_HEAD
+            elif content == WALL:
+                snake.death = DEATH_WALL
+            elif content == BODY or content == HEAD:
+                other = snakes[owner[target]]
+                # Following a tail is fine unless that snake grows this tick
+                if target != other.body[-1] or other.ate:
+                    snake.death = DEATH_SELF if other is snake else DEATH_BODY
+            if snake.death:
+                snake.alive = False
+                snake.ate = False
+                dead.append(snake)
+            else:
+                survivors.append((snake, target))
+
+        # Free dead bodies and moving tails before any head moves in
+        release = self.release
+        for snake in dead:
+            for cell in snake.body:
+                release(cell)
+        for snake, target in survivors:
+            if not snake.ate:
+                tail = snake.body.pop()
+                snake.removed = tail
+                release(tail)
+
+        foods = self.foods
+        for snake, target in survivors:
+            body = snake.body
+            grid[body[0]] = BODY
+            body.appendleft(target)
+            grid[target] = HEAD
+            owner[target] = snake.id
+            self.free.discard(target)
+            if snake.ate:
+                foods.discard(target)
+                snake.score += self.food_value
+
+        self.living = [snake for snake, _ in survivors]
+        if len(foods) < self.food_target:
+            self.spawn_food()
+        return len(self.living)
+
+
+def cautious_policy(arena, snake, rng=random):
+    """Keep going unless the next cell is taken, then turn to a free one."""
+    grid = arena.grid
+    ahead = snake.body[0] + arena.offsets[snake.direction]
+    if grid[ahead] in (EMPTY, FOOD):
+        return None
+    choices = [d for d in DIRECTIONS if d != OPPOSITE[snake.direction]
+               and grid[snake.body[0] + arena.offsets[d]] in (EMPTY, FOOD)]
+    return rng.choice(choices) if choices else None
+
+
+def battle(arena, policy=cautious_policy, max_ticks=1000):
+    """Run the arena until one snake is left or ``max_ticks`` pass."""
+    actions = [None] * len(arena.snakes)
+    while len(arena.living) > 1 and arena.ticks < max_ticks:
+        for snake in arena.living:
+            actions[snake.id] = policy(arena, snake)
+        arena.step(actions)
+    return arena
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Snake Game bot battle")
+    parser.add_argument("--snakes", type=int, default=1000)
+    parser.add_argument("--height", type=int, default=200)
+    parser.add_argument("--width", type=int, default=400)
+    parser.add_argument("--food", type=int, help="food items on the board (default snakes/2)")
+    parser.add_argument("--ticks", type=int, default=1000, help="maximum ticks")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        arena = Arena(args.height, args.width, args.snakes, args.food, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    battle(arena, lambda a, s: cautious_policy(a, s, rng), args.ticks)
+    elapsed = time.perf_counter() - start
+
+    deaths = {}
+    for snake in arena.snakes:
+        deaths[snake.death or 'alive'] = deaths.get(snake.death or 'alive', 0) + 1
+    print(f"{args.snakes} snakes on {args.width}x{args.height}: {arena.ticks} ticks in "
+          f"{elapsed:.2f} s ({arena.ticks / elapsed:,.0f} ticks/sec)")
+    print("  " + ", ".join(f"{k}={v}" for k, v in sorted(deaths.items())))
+    best = sorted(arena.snakes, key=lambda s: (-s.score, s.id))[:5]
+    print("  top scores: " + ", ".join(f"#{s.id} {s.score} (len {len(s)})" for s in best))
+
+
+if __name__ == "__main__":
+    main()
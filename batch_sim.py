@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Vectorized batch simulator for Snake Game
+Steps many independent games in lockstep with NumPy, applying the same
+wall, self-collision and food rules as engine.SnakeEngine.
+"""
+
+from config import (
+    FOOD_MARGIN,
+    INITIAL_SNAKE_LENGTH,
+    SCORE_INCREMENT,
+    SNAKE_START_X_RATIO,
+    SNAKE_START_Y_RATIO,
+)
+from engine import UP, DOWN, LEFT, RIGHT, EMPTY, BODY, HEAD, FOOD, WALL
+from rng import BatchRng, random_seed
+
+# NumPy is optional; only the batch simulator needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Death causes as stored in BatchSnakeSim.death
+ALIVE = 0
+DIED_WALL = 1
+DIED_SELF = 2
+
+# Attempts at vectorized rejection sampling before falling back to an
+# exact per-game scan of the free cells
+FOOD_RETRIES = 8
+
+
+class BatchSnakeSim:
+    """N games of the same board size stepped with one ``step()`` call.
+
+    Per-game state is held in arrays indexed by game number:
+
+    - ``grid``: (N, height * width) uint8 cell contents, as in SnakeEngine
+    - ``body``: (N, height * width) int32 ring buffer of body cells
+    - ``head_slot``: ring position of each head; the tail sits
+      ``length - 1`` slots behind it
+    - ``direction``, ``food``, ``score``, ``ticks``, ``alive``, ``death``
+
+    Every game draws food from its own random stream (``seeds``, or
+    ``seed + i`` for game ``i``), so a game's outcome depends only on its
+    seed and actions, not on the rest of the batch.
+
+    Food placement does not match SnakeEngine: the batch samples cells by
+    rejection, while the engine draws from its ordered free-cell list, so
+    the same seed and actions give different food and games here than in
+    SnakeEngine or a replay. Compare the two only statistically.
+    """
+
+    def __init__(self, n, height, width, seed=None, seeds=None):
+        if np is None:
+            raise RuntimeError("BatchSnakeSim requires NumPy (pip install numpy)")
+        self.n = n
+        self.height = height
+        self.width = width
+        self.size = height * width
+        if seeds is None:
+            base = random_seed() if seed is None else seed
+            seeds = [base + i for i in range(n)]
+        self.rng = BatchRng(seeds)
+
+        self.offsets = np.array([0, 0, 0, 0], dtype=np.int32)
+        self.offsets[[UP, DOWN, LEFT, RIGHT]] = [-width, width, -1, 1]
+        self.opposite = np.array([0, 0, 0, 0], dtype=np.int8)
+        self.opposite[[UP, DOWN, LEFT, RIGHT]] = [DOWN, UP, RIGHT, LEFT]
+
+        # Template board shared by every fresh game
+        template = np.zeros((height, width), dtype=np.uint8)
+        template[[0, -1], :] = WALL
+        template[:, [0, -1]] = WALL
+        self.template = template.reshape(-1)
+
+        region = np.zeros((height, width), dtype=bool)
+        region[FOOD_MARGIN:height - FOOD_MARGIN, FOOD_MARGIN:width - FOOD_MARGIN] = True
+        self.food_region = region.reshape(-1)
+        self.region_cells = np.flatnonzero(self.food_region).astype(np.int32)
+
+        start_y = height // SNAKE_START_Y_RATIO
+        start_x = width // SNAKE_START_X_RATIO
+        # Ring slots 0..L-1 hold the initial body from tail to head
+        self.start_body = np.array(
+            [start_y * width + start_x - i for i in reversed(range(INITIAL_SNAKE_LENGTH))],
+            dtype=np.int32,
+        )
+        self.start_food = (height // 2) * width + width // 2
+
+        self.grid = np.empty((n, self.size), dtype=np.uint8)
+        self.body = np.zeros((n, self.size), dtype=np.int32)
+        self.head_slot = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.alive = np.zeros(n, dtype=bool)
+        self.death = np.zeros(n, dtype=np.int8)
+        self.ate = np.zeros(n, dtype=bool)
+        self.reset()
+
+    def reset(self, games=None, seeds=None):
+        """Start fresh games; ``games`` is an index array or boolean mask.
+
+        Restarted games continue their random streams unless new ``seeds``
+        are given.
+        """
+        if games is None:
+            games = np.arange(self.n)
+        elif games.dtype == bool:
+            games = np.flatnonzero(games)
+        if len(games) == 0:
+            return
+        if seeds is not None:
+            self.rng.reseed(games, seeds)
+        length = len(self.start_body)
+        self.grid[games] = self.template
+        self.body[games, :length] = self.start_body
+        self.grid[games[:, None], self.start_body[None, :-1]] = BODY
+        self.grid[games, self.start_body[-1]] = HEAD
+        self.head_slot[games] = length - 1
+        self.length[games] = length
+        self.direction[games] = RIGHT
+        self.score[games] = 0
+        self.ticks[games] = 0
+        self.alive[games] = True
+        self.death[games] = ALIVE
+        self.ate[games] = False
+
+        # Initial food sits in the middle of the board when it is free
+        middle_free = self.grid[games, self.start_food] == EMPTY
+        placed = games[middle_free]
+        self.food[placed] = self.start_food
+        self.grid[placed, self.start_food] = FOOD
+        self.spawn_food(games[~middle_free])
+
+    def spawn_food(self, games):
+        """Place food on a random empty cell inside the margin for each game."""
+        pending = np.asarray(games)
+        for _ in range(FOOD_RETRIES):
+            if len(pending) == 0:
+                return
+            picks = self.region_cells[self.rng.below(pending, len(self.region_cells))]
+            ok = self.grid[pending, picks] == EMPTY
+            placed = pending[ok]
+            self.food[placed] = picks[ok]
+            self.grid[placed, picks[ok]] = FOOD
+            pending = pending[~ok]
+
+        # Nearly full boards: pick exactly among the remaining free cells
+        for game in pending:
+            free = np.flatnonzero((self.grid[game] == EMPTY) & self.food_region)
+            if len(free):
+                cell = free[self.rng.below([game], len(free))[0]]
+                self.food[game] = cell
+                self.grid[game, cell] = FOOD
+            else:
+                self.food[game] = -1
+
+    def step(self, actions=None):
+        """Advance every live game by one tick.
+
+        ``actions`` is an array of directions, with -1 meaning "keep going";
+        reverse turns are ignored as in SnakeEngine. Dead games are left
+        untouched. Returns the ``alive`` mask.
+        """
+        grid, body = self.grid, self.body
+        if actions is not None:
+            actions = np.asarray(actions)
+            turn = (actions >= 0) & (actions != self.opposite[self.direction])
+            self.direction[turn] = actions[turn]
+
+        games = np.flatnonzero(self.alive)
+        self.ate[:] = False
+        if len(games) == 0:
+            return self.alive
+        self.ticks[games] += 1
+
+        head_slot = self.head_slot[games]
+        head = body[games, head_slot]
+        new_head = head + self.offsets[self.direction[games]]
+        content = grid[games, new_head]
+
+        hit_wall = content == WALL
+        eat = content == FOOD
+        move = ~hit_wall & ~eat
+
+        # Free the tails of moving snakes so heads may follow them
+        tail = body[games, (head_slot - self.length[games] + 1) % self.size]
+        grid[games[move], tail[move]] = EMPTY
+        hit_self = move & (grid[games, new_head] != EMPTY)
+        grid[games[hit_self], tail[hit_self]] = BODY
+
+        ok = ~hit_wall & ~hit_self
+        live = games[ok]
+        grid[live, head[ok]] = BODY
+        slot = (head_slot[ok] + 1) % self.size
+        self.head_slot[live] = slot
+        body[live, slot] = new_head[ok]
+        grid[live, new_head[ok]] = HEAD
+
+        eaters = games[eat]
+        self.length[eaters] += 1
+        self.score[eaters] += SCORE_INCREMENT
+        self.ate[eaters] = True
+
+        self.alive[games[hit_wall]] = False
+        self.death[games[hit_wall]] = DIED_WALL
+        self.alive[games[hit_self]] = False
+        self.death[games[hit_self]] = DIED_SELF
+
+        self.spawn_food(eaters)
+        return self.alive
+
+    def snake(self, game):
+        """Return the body cells of one game, head first."""
+        length = self.length[game]
+        slots = (self.head_slot[game] - np.arange(length)) % self.size
+        return self.body[game, slots]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Analytics pipeline benchmark for Snake Game
+Writes a directory of recorded games, then streams it through
+analytics.analyze_replays and reports games per second and the memory the
+main process needed, which should stay flat as the number of games grows.
+
+Usage: python benchmarks/bench_analytics.py [--games N] [--workers N]
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze_replays, format_summary
+from engine import DIRECTIONS
+from replay import Replay
+from rng import GameRng
+from tournament import greedy_policy
+
+
+def write_replays(folder, games):
+    """Record seeded games of a greedy bot that sometimes slips."""
+    for seed in range(games):
+        replay = Replay(seed, 24, 80, 'NORMAL')
+        game = replay.new_game()
+        turns = GameRng(seed)
+        while True:
+            if turns.below(20) == 0:
+                direction = DIRECTIONS[turns.below(4)]
+            else:
+                direction = greedy_policy(game)
+            if direction is not None:
+                replay.record(game.ticks, direction)
+            if not game.step(direction):
+                break
+        replay.end_tick = game.ticks
+        sub = os.path.join(folder, str(seed // 1000))
+        os.makedirs(sub, exist_ok=True)
+        replay.save(os.path.join(sub, f"{seed}.rep"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analytics games/sec and memory")
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        write_replays(folder, args.games)
+        print(f"wrote {args.games:,} replays in {time.perf_counter() - start:.1f} s")
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        summary = analyze_replays([folder], workers=args.workers)
+        elapsed = time.perf_counter() - start
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(format_summary("Replays", summary))
+    print(f"{summary.games / elapsed:,.0f} games/sec with {args.workers} workers; "
+          f"main process peak memory grew by {(after - before) / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Arena scaling benchmark for Snake Game
+Times arena ticks for growing numbers of snakes and growing snake lengths.
+The snakes run side by side in their own rows, so none of them dies during
+the measurement; the cost per tick should follow the number of snakes and
+stay flat as the total number of segments grows.
+
+Usage: python benchmarks/bench_arena.py [--ticks N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import Arena
+from engine import RIGHT
+
+CASES = [(100, 3), (1000, 3), (1000, 100), (1000, 1000), (5000, 3)]
+
+
+def lanes_arena(snakes, length, ticks):
+    """Arena with one snake per row, heads pointing at empty space."""
+    arena = Arena(snakes + 2, length + ticks + 3, food=0, seed=0)
+    for y in range(1, snakes + 1):
+        arena.add_snake([arena.cell(y, x) for x in range(length, 0, -1)], RIGHT)
+    return arena
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arena tick cost by snakes and length")
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'snakes':>7} {'length':>7} {'segments':>10} {'us/tick':>10} {'us/snake':>9}")
+    for snakes, length in CASES:
+        arena = lanes_arena(snakes, length, args.ticks)
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            arena.step()
+        elapsed = (time.perf_counter() - start) / args.ticks
+        assert len(arena.living) == snakes
+        print(f"{snakes:>7} {length:>7} {snakes * length:>10,} {elapsed * 1e6:>10.0f} "
+              f"{elapsed * 1e6 / snakes:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Autopilot planning benchmark for Snake Game
+Plays seeded games with the autopilot and reports the time each move took
+to plan, against the 50 ms tick of EXPERT and the 1 ms planning target.
+
+Percentiles are CPU time of the planning thread, which is what the search
+budget bounds. Wall time is shown too: on a busy or virtualised host it
+also counts the milliseconds the process was descheduled, which swamps
+the tail of the distribution.
+
+Usage: python benchmarks/bench_autopilot.py [--ticks N] [--seeds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopilot import Autopilot
+from engine import SnakeEngine
+
+# (height, width) terminal sizes; the last one has no Hamiltonian cycle
+BOARDS = [(24, 80), (60, 200), (61, 201)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Autopilot time per move")
+    parser.add_argument("--ticks", type=int, default=50000, help="ticks per game")
+    parser.add_argument("--seeds", type=int, default=3, help="games per board")
+    args = parser.parse_args(argv)
+
+    print(f"{'board':>8} {'mode':>5} {'p50 us':>7} {'p99 us':>7} {'p99.9 us':>9} "
+          f"{'max ms':>7} {'wall p99.9':>10} {'score':>6} {'deaths':>6}")
+    for height, width in BOARDS:
+        samples = []
+        walls = []
+        score = deaths = 0
+        for seed in range(args.seeds):
+            game = SnakeEngine(height, width, seed=seed)
+            pilot = Autopilot(game)
+            cpu = time.thread_time
+            wall = time.perf_counter
+            alive = True
+            while alive and game.ticks < args.ticks:
+                start_wall = wall()
+                start = cpu()
+                direction = pilot(game)
+                samples.append(cpu() - start)
+                walls.append(wall() - start_wall)
+                alive = game.step(direction)
+            score += game.score
+            deaths += not alive
+        samples.sort()
+        walls.sort()
+        p = [samples[min(len(samples) - 1, int(len(samples) * q))] * 1e6
+             for q in (0.5, 0.99, 0.999)]
+        wall_p = walls[min(len(walls) - 1, int(len(walls) * 0.999))] * 1e6
+        mode = "cycle" if pilot.order is not None else "path"
+        print(f"{f'{width}x{height}':>8} {mode:>5} {p[0]:>7.1f} {p[1]:>7.1f} {p[2]:>9.1f} "
+              f"{samples[-1] * 1e3:>7.2f} {wall_p:>10.1f} {score / args.seeds:>6.0f} {deaths:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Batch simulator benchmark for Snake Game
+Reports game-ticks per second for BatchSnakeSim with random actions,
+restarting games as they die.
+
+Usage: python benchmarks/bench_batch_sim.py [--games N] [--steps S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batch_sim import BatchSnakeSim
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch simulator benchmark")
+    parser.add_argument("--games", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--width", type=int, default=40)
+    args = parser.parse_args()
+
+    sim = BatchSnakeSim(args.games, args.height, args.width, seed=0)
+    rng = np.random.default_rng(1)
+    # Mostly keep going, sometimes turn, like a weak bot
+    actions = rng.integers(-4, 4, size=(args.steps, args.games)).clip(-1)
+
+    ticks = 0
+    start = time.perf_counter()
+    for step in range(args.steps):
+        ticks += int(sim.alive.sum())
+        sim.step(actions[step])
+        sim.reset(~sim.alive)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games} games of {args.width}x{args.height}, {args.steps} steps")
+    print(f"{ticks} game-ticks in {elapsed:.2f}s: {ticks / elapsed:,.0f} ticks/sec")
+
+
+if __name__ == "__main__":
+    main()
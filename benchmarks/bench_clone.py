@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Snapshot benchmark for Snake Game
+Times ``clone()`` and ``advance()``/``undo()`` pairs for snakes of growing
+length, the two ways a search bot can explore futures from one position.
+Clones copy the board, so they cost more on big boards; an advance/undo
+pair should cost the same whatever the length.
+
+Usage: python benchmarks/bench_clone.py [--seconds S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopilot import hamiltonian_cycle
+from engine import DIRECTIONS
+from run_benchmarks import cycle_game, cycle_turns
+
+# (length, height, width): each board is the smallest usual size that fits
+CASES = [(10, 24, 80), (1000, 40, 80), (100000, 402, 402)]
+
+
+def rate(fn, seconds):
+    """Calls of ``fn`` per second, measured for about ``seconds``."""
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for _ in range(100):
+            fn()
+        calls += 100
+        now = time.perf_counter()
+        if now >= deadline:
+            return calls / (now - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="clone() and advance()/undo() rates")
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    print(f"{'length':>7} {'board':>9} {'clones/sec':>12} {'advance+undo/sec':>17}")
+    for length, height, width in CASES:
+        cycle = hamiltonian_cycle(height, width)
+        game = cycle_game(cycle, cycle_turns(cycle, height, width), height, width, length)
+        del cycle
+        clones = rate(game.clone, args.seconds)
+
+        def probe():
+            # One ply of search: try every direction and take it back
+            for direction in DIRECTIONS:
+                game.undo(game.advance(direction)[1])
+
+        probes = rate(probe, args.seconds) * len(DIRECTIONS)
+        print(f"{len(game):>7} {f'{height}x{width}':>9} {clones:>12,.0f} {probes:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Environment throughput benchmark for Snake Game
+Compares SnakeEnv, whose observations are views of the engine grid, with
+rebuilding an observation array from the body list every step, and
+reports env-steps per second for VectorSnakeEnv.
+
+Usage: python benchmarks/bench_env.py [--steps N] [--envs N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine import BODY, FOOD, HEAD, WALL
+from env import SnakeEnv, VectorSnakeEnv
+
+
+def rebuilt_obs(game):
+    """Observation built from scratch, as a wrapper without views would."""
+    obs = np.zeros((game.height, game.width), dtype=np.uint8)
+    obs[0, :] = obs[-1, :] = obs[:, 0] = obs[:, -1] = WALL
+    ys, xs = np.divmod(np.fromiter(game.body, dtype=np.int64), game.width)
+    obs[ys, xs] = BODY
+    obs[ys[0], xs[0]] = HEAD
+    if game.food is not None:
+        obs[game.pos(game.food)] = FOOD
+    return obs
+
+
+def run_single(steps, actions, rebuild):
+    env = SnakeEnv(24, 80)
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for i in range(steps):
+        _, _, done, _ = env.step(actions[i])
+        if rebuild:
+            rebuilt_obs(env.game)
+        if done:
+            env.reset(seed=i)
+    return steps / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Environment steps per second")
+    parser.add_argument("--steps", type=int, default=200000)
+    parser.add_argument("--envs", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(1)
+    # Mostly keep going, sometimes turn
+    actions = rng.integers(-4, 4, size=args.steps).clip(-1).tolist()
+    print(f"SnakeEnv, view observations:     {run_single(args.steps, actions, False):>12,.0f} steps/sec")
+    print(f"SnakeEnv, rebuilt observations:  {run_single(args.steps, actions, True):>12,.0f} steps/sec")
+
+    env = VectorSnakeEnv(args.envs, 24, 80)
+    env.reset(seed=0)
+    rounds = max(1, args.steps // args.envs)
+    batch = rng.integers(-4, 4, size=(rounds, args.envs)).clip(-1)
+    start = time.perf_counter()
+    for i in range(rounds):
+        env.step(batch[i])
+    rate = rounds * args.envs / (time.perf_counter() - start)
+    print(f"VectorSnakeEnv x {args.envs}:           {rate:>12,.0f} env-steps/sec")
+
+
+if __name__ == "__main__":
+    main()
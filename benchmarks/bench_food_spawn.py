@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Food spawn benchmark for Snake Game
+Measures the cost of placing food as the board fills up, comparing the
+free-cell index used by the engine with the old retry loop.
+
+Usage: python benchmarks/bench_food_spawn.py [--height H] [--width W]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FOOD_MARGIN
+from engine import SnakeEngine, BODY
+
+FILL_LEVELS = (0.01, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99)
+
+
+def filled_engine(height, width, fill, rng):
+    """Return an engine whose food area is occupied to the given fraction."""
+    game = SnakeEngine(height, width, rng=rng)
+    game.grid[game.food] = 0
+    game.free.add(game.food)
+    game.food = None
+    cells = list(game.free.cells)
+    rng.shuffle(cells)
+    for cell in cells[:int(len(cells) * fill)]:
+        game.grid[cell] = BODY
+        game.free.discard(cell)
+    return game
+
+
+def time_index(game, rounds):
+    """Average seconds per spawn through the free-cell index."""
+    grid = game.grid
+    start = time.perf_counter()
+    for _ in range(rounds):
+        cell = game.spawn_food()
+        # Give the cell back so every round sees the same fill level
+        grid[cell] = 0
+        game.free.add(cell)
+    return (time.perf_counter() - start) / rounds
+
+
+def time_retry(game, rng, rounds):
+    """Average seconds per spawn with the old draw-until-empty loop."""
+    height, width, grid = game.height, game.width, game.grid
+    snake = [game.pos(c) for c in range(len(grid)) if grid[c] == BODY]
+    snake = [list(p) for p in snake]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        food = None
+        while food is None:
+            nf = [
+                rng.randint(FOOD_MARGIN, height - 1 - FOOD_MARGIN),
+                rng.randint(FOOD_MARGIN, width - 1 - FOOD_MARGIN),
+            ]
+            food = nf if nf not in snake else None
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Food spawn benchmark")
+    parser.add_argument("--height", type=int, default=60)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--retry-rounds", type=int, default=20,
+                        help="rounds for the old retry loop (0 to skip)")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(f"Board {args.width}x{args.height}")
+    print(f"{'fill':>6} {'index (us)':>12} {'retry (us)':>12}")
+    for fill in FILL_LEVELS:
+        game = filled_engine(args.height, args.width, fill, rng)
+        index_us = time_index(game, args.rounds) * 1e6
+        if args.retry_rounds:
+            retry_us = time_retry(game, rng, args.retry_rounds) * 1e6
+            retry = f"{retry_us:12.1f}"
+        else:
+            retry = f"{'-':>12}"
+        print(f"{fill:6.0%} {index_us:12.2f} {retry}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+High-score store benchmark for Snake Game
+Fills a temporary database with many recorded games, then times inserts,
+top-N and per-player best lookups.
+
+Usage: python benchmarks/bench_highscores.py [--games N] [--players P]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DIFFICULTY_LEVELS
+from highscores import HighScores
+
+BATCH = 10000
+
+
+def timed(fn, rounds):
+    """Average seconds per call of ``fn``."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="High-score store benchmark")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--players", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    difficulties = list(DIFFICULTY_LEVELS)
+    with tempfile.TemporaryDirectory() as tmp, HighScores(os.path.join(tmp, "bench.db")) as scores:
+        start = time.perf_counter()
+        for done in range(0, args.games, BATCH):
+            scores.record_many([
+                {'player': f"player{rng.randrange(args.players)}",
+                 'score': int(rng.expovariate(0.05)), 'length': 3, 'ticks': 100,
+                 'difficulty': rng.choice(difficulties)}
+                for _ in range(min(BATCH, args.games - done))
+            ])
+        fill = time.perf_counter() - start
+        print(f"{args.games:,} games recorded in {fill:.1f} s "
+              f"({args.games / fill:,.0f} games/sec in batches of {BATCH:,})")
+
+        single = timed(lambda: scores.record({'player': 'solo', 'score': 1, 'length': 3,
+                                              'ticks': 10, 'difficulty': 'NORMAL'}), 200)
+        print(f"  single-game record: {single * 1e6:8.1f} us")
+        top = timed(lambda: scores.top(10), 1000)
+        print(f"  top 10:             {top * 1e6:8.1f} us")
+        top_hard = timed(lambda: scores.top(10, 'HARD'), 1000)
+        print(f"  top 10 of HARD:     {top_hard * 1e6:8.1f} us")
+        best = timed(lambda: scores.best(f"player{rng.randrange(args.players)}"), 1000)
+        print(f"  player best:        {best * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Render backend benchmark for Snake Game
+Plays the same seeded games through the curses renderer used by
+snake_game.main and through the raw ANSI renderer, each inside its own
+pseudo-terminal, and compares bytes sent to the terminal, write calls
+and render time per frame.
+
+Usage: python benchmarks/bench_render.py [--frames N] [--height H] [--width W]
+"""
+
+import argparse
+import curses
+import fcntl
+import json
+import os
+import pty
+import select
+import struct
+import sys
+import termios
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import SnakeEngine
+from render import AnsiRenderer, CursesRenderer
+from tournament import greedy_policy
+
+
+def render_frames(backend, frames, height, width):
+    """Child side: render a scripted game and return timing figures."""
+    curses.initscr()
+    curses.curs_set(0)
+    w = curses.newwin(height, width, 0, 0)
+    w.refresh()
+    if backend == "ansi":
+        renderer = AnsiRenderer(sys.stdout.fileno(), height, width)
+    else:
+        renderer = CursesRenderer(w)
+
+    seed = 0
+    game = SnakeEngine(height, width, seed=seed)
+    renderer.draw_board(game)
+    renderer.flush()
+    render_time = 0.0
+    for _ in range(frames):
+        if not game.step(greedy_policy(game)):
+            seed += 1
+            game = SnakeEngine(height, width, seed=seed)
+            renderer.cells.update({(y, x): ' ' for y in range(1, height - 1) for x in range(1, width - 1)})
+            renderer.draw_board(game)
+        else:
+            renderer.draw_tick(game)
+            if game.ate:
+                renderer.text(0, 2, f"SNAKE GAME - Score: {game.score}")
+        start = time.perf_counter()
+        renderer.flush()
+        render_time += time.perf_counter() - start
+    curses.endwin()
+    return {'render_time': render_time, 'writes': getattr(renderer, 'writes', None)}
+
+
+def run_in_pty(backend, frames, height, width):
+    """Run one backend in a pseudo-terminal and count what it writes."""
+    result_r, result_w = os.pipe()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.close(result_r)
+        os.environ.setdefault("TERM", "xterm")
+        fcntl.ioctl(0, termios.TIOCSWINSZ, struct.pack("HHHH", height, width, 0, 0))
+        result = render_frames(backend, frames, height, width)
+        os.write(result_w, json.dumps(result).encode())
+        os._exit(0)
+    os.close(result_w)
+    total = 0
+    while True:
+        ready, _, _ = select.select([fd], [], [], 5)
+        if not ready:
+            break
+        try:
+            data = os.read(fd, 1 << 16)
+        except OSError:
+            break
+        if not data:
+            break
+        total += len(data)
+    os.waitpid(pid, 0)
+    result = json.loads(os.read(result_r, 4096) or b"{}")
+    os.close(result_r)
+    result['bytes'] = total
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render backend benchmark")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--height", type=int, default=40)
+    parser.add_argument("--width", type=int, default=120)
+    args = parser.parse_args()
+
+    print(f"{args.frames} frames on a {args.width}x{args.height} terminal")
+    print(f"{'backend':>8} {'bytes/frame':>12} {'writes/frame':>13} {'us/frame':>9}")
+    for backend in ("curses", "ansi"):
+        r = run_in_pty(backend, args.frames, args.height, args.width)
+        writes = "n/a" if r.get('writes') is None else f"{r['writes'] / args.frames:.2f}"
+        print(f"{backend:>8} {r['bytes'] / args.frames:12.1f} {writes:>13} "
+              f"{r['render_time'] / args.frames * 1e6:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
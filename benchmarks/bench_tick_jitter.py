@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tick jitter benchmark for Snake Game
+Runs the fixed-timestep scheduler against the real monotonic clock with
+the same wait strategy as the curses loop (coarse millisecond waits, then
+a short sleep for the remainder) and reports how late ticks ran.
+
+Usage: python benchmarks/bench_tick_jitter.py [--ticks N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DIFFICULTY_LEVELS
+from scheduler import FixedTimestep
+
+
+def run(step_ms, ticks):
+    """Run the scheduler for a number of ticks and return its jitter stats."""
+    timestep = FixedTimestep(step_ms)
+    done = 0
+    while done < ticks:
+        remaining = timestep.timeout()
+        if remaining >= 0.001:
+            # Stand-in for getch() with a whole-millisecond timeout
+            time.sleep(int(remaining * 1000) / 1000.0)
+        elif remaining > 0:
+            time.sleep(remaining)
+        done += timestep.due()
+    return timestep.jitter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick jitter benchmark")
+    parser.add_argument("--ticks", type=int, default=100)
+    args = parser.parse_args()
+
+    speeds = [(name, level['speed']) for name, level in DIFFICULTY_LEVELS.items()]
+    speeds += [("20ms", 20), ("10ms", 10)]
+    for name, step_ms in speeds:
+        jitter = run(step_ms, args.ticks)
+        print(f"{name:>7} ({step_ms:>3} ms): {jitter}")
+
+
+if __name__ == "__main__":
+    main()
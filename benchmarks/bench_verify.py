@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Replay verification benchmark for Snake Game
+Records games of a greedy bot that sometimes slips, then verifies them as
+leaderboard submissions on one core and on a process pool, and reports
+verifications per second, per core, along with how fast forged claims
+are turned away.
+
+Usage: python benchmarks/bench_verify.py [--games N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import DIRECTIONS
+from replay import Replay
+from rng import GameRng
+from tournament import greedy_policy
+from verify import verify_many
+
+
+def honest_submissions(games):
+    """Submissions with truthful claims, as the game client would send."""
+    submissions = []
+    for seed in range(games):
+        replay = Replay(seed, 24, 80, 'NORMAL')
+        game = replay.new_game()
+        turns = GameRng(seed)
+        while True:
+            if turns.below(20) == 0:
+                direction = DIRECTIONS[turns.below(4)]
+            else:
+                direction = greedy_policy(game)
+            if direction is not None:
+                replay.record(game.ticks, direction)
+            if not game.step(direction):
+                break
+        replay.end_tick = game.ticks
+        submissions.append({'player': f"bot{seed}", 'score': game.score, 'death': game.death,
+                            'ticks': game.ticks, 'replay': replay.encode()})
+    return submissions
+
+
+def rate(submissions, workers):
+    start = time.perf_counter()
+    verdicts = list(verify_many(submissions, workers))
+    return len(verdicts) / (time.perf_counter() - start), verdicts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay verifications per second")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    submissions = honest_submissions(args.games)
+    ticks = sum(s['ticks'] for s in submissions) / len(submissions)
+    print(f"{len(submissions):,} games, {ticks:.0f} ticks on average")
+
+    single, verdicts = rate(submissions, 1)
+    assert all(v.ok for v in verdicts)
+    print(f"1 core:      {single:>10,.0f} verifications/sec")
+    pooled, _ = rate(submissions, args.workers)
+    print(f"{args.workers} workers:  {pooled:>10,.0f} verifications/sec "
+          f"({pooled / args.workers:,.0f} per core)")
+
+    # Forged claims: a score ten points too high is only out of reach
+    # near the end, so rejecting it costs about as much as accepting
+    forged = [dict(s, score=s['score'] + 10) for s in submissions]
+    forged_rate, verdicts = rate(forged, 1)
+    assert not any(v.ok for v in verdicts)
+    print(f"forged, 1 core: {forged_rate:>7,.0f} rejections/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Huge-world benchmark for Snake Game
+Measures memory and tick rate of WorldEngine with a very long snake lying
+in rows across a large world, next to the memory SnakeEngine would need
+for the same board.
+
+Usage: python benchmarks/bench_world.py [--size N] [--length L]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import DOWN, LEFT, RIGHT
+from world import CellRing, WorldEngine
+
+
+def zigzag(game):
+    """Yield cells row by row, alternating direction, from the top left."""
+    for y in range(2, game.height - 2):
+        xs = range(2, game.width - 2) if y % 2 == 0 else range(game.width - 3, 1, -1)
+        for x in xs:
+            yield game.cell(y, x)
+
+
+def long_snake(game, length):
+    """Replace the snake with one of ``length`` cells zigzagging in rows."""
+    for cell in game.body:
+        game.clear(cell)
+    # Tail first, so the last cell becomes the head
+    game.body = CellRing(length)
+    for cell, _ in zip(zigzag(game), range(length)):
+        game.body.appendleft(cell)
+        game.set(cell)
+    game.direction = RIGHT if game.pos(game.head)[0] % 2 == 0 else LEFT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WorldEngine memory and tick benchmark")
+    parser.add_argument("--size", type=int, default=10000, help="world height and width")
+    parser.add_argument("--length", type=int, default=1000000, help="snake length")
+    parser.add_argument("--ticks", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    game = WorldEngine(args.size, args.size, seed=1)
+    long_snake(game, args.length)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"world {args.size}x{args.size}, snake length {len(game):,}")
+    print(f"  occupancy bits: {len(game.bits) / 2**20:8.2f} MB")
+    print(f"  body ring:      {game.body.nbytes() / 2**20:8.2f} MB")
+    print(f"  peak traced:    {peak / 2**20:8.2f} MB")
+    print(f"  SnakeEngine would need at least {args.size * args.size * 9 / 2**20:,.0f} MB "
+          f"for its grid and free-cell index alone")
+
+    # Walk down the free rows below the snake, turning at the sides
+    step = game.step
+    turns = 0
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        y, x = game.pos(game.head)
+        direction = None
+        if game.direction in (LEFT, RIGHT) and not 2 < x < game.width - 3:
+            direction = DOWN
+        elif game.direction == DOWN:
+            direction = LEFT if x > game.width // 2 else RIGHT
+        if not step(direction):
+            break
+        turns += direction is not None
+    elapsed = time.perf_counter() - start
+    print(f"  {game.ticks:,} ticks in {elapsed:.2f} s -> {game.ticks / elapsed:,.0f} ticks/sec "
+          f"({'alive' if game.alive else game.death}, {turns} turns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tick-throughput benchmark suite for Snake Game
+Drives the real SnakeEngine headlessly over a matrix of board sizes and
+snake lengths, and reports ticks/sec, food-spawn latency percentiles and
+peak memory. Results can be written as JSON and checked against a stored
+baseline; the run fails when a case regresses past the tolerance.
+
+The snake follows a Hamiltonian cycle of the board, so it never dies; it
+starts at the case's fill level and keeps eating (and growing) as it goes.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--quick] [--output results.json]
+    python benchmarks/run_benchmarks.py --check            (compare to baseline)
+    python benchmarks/run_benchmarks.py --update-baseline  (store new baseline)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopilot import hamiltonian_cycle
+from engine import SnakeEngine, UP, DOWN, LEFT, RIGHT, EMPTY, BODY, HEAD
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# (height, width) board sizes, smallest terminal up to a huge virtual board
+BOARD_SIZES = [(10, 20), (24, 80), (60, 200), (1000, 2000)]
+QUICK_BOARD_SIZES = [(10, 20), (24, 80), (60, 200)]
+# Snake length as a fraction of the playable cells (0 = initial length)
+FILL_LEVELS = [0.0, 0.1, 0.5, 0.9]
+
+# Timed runs per case; the fastest one is reported
+RUNS = 3
+
+# Relative slowdown (or memory growth) tolerated before a case fails
+DEFAULT_TOLERANCE = 0.25
+
+
+def cycle_turns(cycle, height, width):
+    """Return a bytearray giving the direction to take from every cycle cell."""
+    offsets = {-width: UP, width: DOWN, -1: LEFT, 1: RIGHT}
+    turn = bytearray(height * width)
+    for i, cell in enumerate(cycle):
+        turn[cell] = offsets[cycle[(i + 1) % len(cycle)] - cell]
+    return turn
+
+
+def cycle_game(cycle, turn, height, width, length, seed=0):
+    """Return an engine with a snake of ``length`` cells lying on the cycle."""
+    game = SnakeEngine(height, width, seed=seed)
+    for cell in list(game.body) + [game.food]:
+        game.grid[cell] = EMPTY
+        game.free.add(cell)
+    game.body.clear()
+    length = max(3, min(length, len(cycle) - 1))
+    for cell in reversed(cycle[:length]):
+        game.body.append(cell)
+        game.grid[cell] = BODY
+        game.free.discard(cell)
+    game.grid[game.head] = HEAD
+    game.direction = turn[cycle[length - 2]]
+    game.food = None
+    game.spawn_food()
+    return game
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def run_case(height, width, fill, seconds):
+    """Benchmark one board size and fill level; returns a result dict."""
+    playable = (height - 2) * (width - 2)
+    length = int(playable * fill)
+
+    cycle = hamiltonian_cycle(height, width)
+    turn = cycle_turns(cycle, height, width)
+
+    # Peak memory of building the game state only
+    tracemalloc.start()
+    game = cycle_game(cycle, turn, height, width, length)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cycle
+    start_length = len(game)
+
+    # Ticks per second along the cycle, best of a few runs to damp noise
+    step = game.step
+    ticks_per_sec = 0.0
+    for _ in range(RUNS):
+        ticks = 0
+        start = time.perf_counter()
+        deadline = start + seconds / RUNS
+        while True:
+            for _ in range(1000):
+                step(turn[game.body[0]])
+            ticks += 1000
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+        ticks_per_sec = max(ticks_per_sec, ticks / (now - start))
+
+    # Food-spawn latency; the cell is handed back so the fill stays put
+    latencies = []
+    grid, free = game.grid, game.free
+    if game.food is not None:
+        grid[game.food] = EMPTY
+        free.add(game.food)
+    for _ in range(2000):
+        t0 = time.perf_counter()
+        cell = game.spawn_food()
+        latencies.append(time.perf_counter() - t0)
+        if cell is None:
+            break
+        grid[cell] = EMPTY
+        free.add(cell)
+
+    return {
+        'case': f"{width}x{height}@{fill:.0%}",
+        'board': [height, width],
+        'length': start_length,
+        'ticks_per_sec': ticks_per_sec,
+        'spawn_p50_us': percentile(latencies, 50) * 1e6,
+        'spawn_p99_us': percentile(latencies, 99) * 1e6,
+        'peak_memory_bytes': peak,
+    }
+
+
+def check(results, baseline, tolerance):
+    """Return a list of regression messages against a baseline."""
+    reference = {r['case']: r for r in baseline.get('results', [])}
+    failures = []
+    for r in results:
+        base = reference.get(r['case'])
+        if base is None:
+            continue
+        if r['ticks_per_sec'] < base['ticks_per_sec'] * (1 - tolerance):
+            failures.append(f"{r['case']}: {r['ticks_per_sec']:,.0f} ticks/sec vs "
+                            f"baseline {base['ticks_per_sec']:,.0f}")
+        if r['spawn_p50_us'] > base['spawn_p50_us'] * (1 + tolerance):
+            failures.append(f"{r['case']}: food spawn p50 {r['spawn_p50_us']:.2f} us vs "
+                            f"baseline {base['spawn_p50_us']:.2f} us")
+        if r['peak_memory_bytes'] > base['peak_memory_bytes'] * (1 + tolerance):
+            failures.append(f"{r['case']}: peak memory {r['peak_memory_bytes']:,} B vs "
+                            f"baseline {base['peak_memory_bytes']:,} B")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snake Game tick-throughput benchmarks")
+    parser.add_argument("--quick", action="store_true", help="skip the huge board")
+    parser.add_argument("--seconds", type=float, default=0.3, help="timed run per case")
+    parser.add_argument("--output", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_BOARD_SIZES if args.quick else BOARD_SIZES
+    results = []
+    print(f"{'case':>18} {'length':>9} {'ticks/sec':>12} {'spawn p50':>10} "
+          f"{'spawn p99':>10} {'peak mem':>12}")
+    for height, width in sizes:
+        for fill in FILL_LEVELS:
+            r = run_case(height, width, fill, args.seconds)
+            results.append(r)
+            print(f"{r['case']:>18} {r['length']:>9} {r['ticks_per_sec']:>12,.0f} "
+                  f"{r['spawn_p50_us']:>8.2f}us {r['spawn_p99_us']:>8.2f}us "
+                  f"{r['peak_memory_bytes']:>12,}")
+
+    report = {'python': sys.version.split()[0], 'results': results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    if args.check:
+        try:
+            with open(args.baseline, encoding="utf-8") as fh:
+                baseline = json.load(fh)
+        except OSError as e:
+            print(f"Could not read baseline: {e}")
+            sys.exit(2)
+        failures = check(results, baseline, args.tolerance)
+        if failures:
+            print("\nRegressions:")
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,9 +20,11 @@ SNAKE_HEAD_CHAR = '#'
 SNAKE_BODY_CHAR = '#'
 FOOD_CHAR = '*'
 EMPTY_CHAR = ' '
+WALL_CHAR = '+'  # World edge, only drawn when the world is larger than the screen
 
 # Game Speed
 GAME_SPEED_MS = 100  # Milliseconds between game updates
+TURBO_REFRESH_HZ = 30  # Screen updates per second with --turbo (logic is uncapped)
 
 # Controls
 QUIT_KEYS = ['q', 'Q']
@@ -32,6 +34,7 @@ ARROW_KEYS = {
     'LEFT': 'KEY_LEFT',
     'RIGHT': 'KEY_RIGHT'
 }
+INPUT_BUFFER_SIZE = 3  # Turns queued ahead for later ticks
 
 # Scoring
 SCORE_INCREMENT = 1
@@ -77,8 +80,8 @@ DIFFICULTY_LEVELS = {
 # Default difficulty
 DEFAULT_DIFFICULTY = 'NORMAL'
 
-# High Score Settings (future feature)
-HIGH_SCORE_FILE = 'high_scores.txt'
+# High Score Settings (see highscores.py)
+HIGH_SCORE_FILE = '~/.snake_game_scores.db'  # SQLite database
 MAX_HIGH_SCORES = 10
 
 # Sound Settings (future feature)
@@ -94,7 +97,9 @@ DEBUG_MODE = False
 DEBUG_INFO = {
     'show_fps': False,
     'show_coordinates': False,
-    'show_collision_boxes': False
+    'show_collision_boxes': False,
+    'metrics_file': 'snake_metrics.prom',  # .jsonl appends JSON lines instead
+    'metrics_interval': 5.0  # Seconds between metrics exports
 }
 
 # Version Information
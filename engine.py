@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Headless game engine for Snake Game
+Holds the board, the snake and the food without touching curses, so the
+same rules can drive the terminal game, bots and simulations.
+"""
+
+import copy
+from collections import deque
+
+from config import (
+    FOOD_MARGIN,
+    INITIAL_SNAKE_LENGTH,
+    SCORE_INCREMENT,
+    SNAKE_START_X_RATIO,
+    SNAKE_START_Y_RATIO,
+)
+from rng import GameRng
+
+# Directions
+UP = 0
+DOWN = 1
+LEFT = 2
+RIGHT = 3
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Cell contents of the occupancy grid
+EMPTY = 0
+BODY = 1
+HEAD = 2
+FOOD = 3
+WALL = 4
+
+# Death causes
+DEATH_WALL = 'wall'
+DEATH_SELF = 'self'
+
+
+class FreeCells:
+    """Set of empty cells with O(1) add, remove and uniform sampling.
+
+    Free cells live in a dense list; ``index`` maps every cell of the board
+    to its position in that list, -1 when the cell is occupied, or
+    ``OUTSIDE`` when the cell is never eligible (e.g. outside the food
+    margin). Removal swaps the last entry into the hole.
+    """
+
+    OUTSIDE = -2
+
+    def __init__(self, size, cells):
+        self.index = [self.OUTSIDE] * size
+        self.cells = list(cells)
+        for i, cell in enumerate(self.cells):
+            self.index[cell] = i
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return self.index[cell] >= 0
+
+    def add(self, cell):
+        """Mark an eligible cell as free again."""
+        index = self.index
+        if index[cell] == -1:
+            index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def discard(self, cell):
+        """Mark a cell as occupied; no-op if it is not a free cell.
+
+        Returns the list position the cell had (negative if it was not
+        free), which ``undo_discard()`` needs to put it back.
+        """
+        index = self.index
+        i = index[cell]
+        if i >= 0:
+            cells = self.cells
+            last = cells.pop()
+            if last != cell:
+                cells[i] = last
+                index[last] = i
+            index[cell] = -1
+        return i
+
+    def undo_discard(self, cell, i):
+        """Reverse ``discard(cell)``, given the position it returned."""
+        if i < 0:
+            return
+        cells = self.cells
+        if i < len(cells):
+            last = cells[i]
+            cells[i] = cell
+            self.index[last] = len(cells)
+            cells.append(last)
+        else:
+            cells.append(cell)
+        self.index[cell] = i
+
+    def undo_add(self, cell):
+        """Reverse ``add(cell)``, which must be the latest addition."""
+        if self.index[cell] >= 0:
+            self.cells.pop()
+            self.index[cell] = -1
+
+    def copy(self):
+        """Return an independent copy."""
+        other = FreeCells.__new__(FreeCells)
+        other.index = self.index[:]
+        other.cells = self.cells[:]
+        return other
+
+    def sample(self, rng):
+        """Return a uniformly chosen free cell, or None if there is none."""
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
+
+
+class SnakeEngine:
+    """Snake game state with constant-time moves and collision checks.
+
+    Cells are addressed by a single integer ``y * width + x``. The body is a
+    deque of cells (head first) and ``grid`` is a bytearray holding the
+    content of every cell, with the outer border marked as wall.
+
+    Food placement draws from the game's own ``GameRng`` built from
+    ``seed`` (random if None), unless another generator is passed as ``rng``.
+    """
+
+    def __init__(self, height, width, rng=None, food_value=SCORE_INCREMENT, seed=None):
+        self.height = height
+        self.width = width
+        self.rng = rng if rng is not None else GameRng(seed)
+        self.food_value = food_value
+        self.offsets = {UP: -width, DOWN: width, LEFT: -1, RIGHT: 1}
+
+        # Border cells are walls, matching the rows/columns the original
+        # loop treated as fatal (0 and size - 1).
+        self.grid = bytearray(height * width)
+        for x in range(width):
+            self.grid[x] = WALL
+            self.grid[(height - 1) * width + x] = WALL
+        for y in range(height):
+            self.grid[y * width] = WALL
+            self.grid[y * width + width - 1] = WALL
+
+        # Initialize snake heading right, head at the start position
+        start_y = height // SNAKE_START_Y_RATIO
+        start_x = width // SNAKE_START_X_RATIO
+        self.body = deque()
+        for i in range(INITIAL_SNAKE_LENGTH):
+            cell = self.cell(start_y, start_x - i)
+            self.body.append(cell)
+            self.grid[cell] = BODY
+        self.grid[self.body[0]] = HEAD
+        self.direction = RIGHT
+
+        # Empty cells food may spawn on
+        self.free = FreeCells(height * width, (
+            self.cell(y, x)
+            for y in range(FOOD_MARGIN, height - FOOD_MARGIN)
+            for x in range(FOOD_MARGIN, width - FOOD_MARGIN)
+        ))
+        for cell in self.body:
+            self.free.discard(cell)
+
+        self.score = 0
+        self.ticks = 0
+        self.alive = True
+        self.death = None
+        self.ate = False
+        self.removed = None
+
+        # Initial food sits in the middle of the board
+        self.food = None
+        self.food_index = -1
+        middle = self.cell(height // 2, width // 2)
+        if self.grid[middle] == EMPTY:
+            self.place_food(middle)
+        else:
+            self.spawn_food()
+
+    def cell(self, y, x):
+        """Return the cell index of a board position."""
+        return y * self.width + x
+
+    def pos(self, cell):
+        """Return the (y, x) board position of a cell index."""
+        return divmod(cell, self.width)
+
+    @property
+    def head(self):
+        """Cell index of the snake's head."""
+        return self.body[0]
+
+    def __len__(self):
+        return len(self.body)
+
+    def place_food(self, cell):
+        """Put the food on a specific cell."""
+        self.food = cell
+        self.grid[cell] = FOOD
+        self.food_index = self.free.discard(cell)
+
+    def spawn_food(self):
+        """Place food on a random empty cell inside the food margin.
+
+        Returns the chosen cell, or None when no eligible cell is left.
+        """
+        cell = self.free.sample(self.rng)
+        if cell is not None:
+            self.place_food(cell)
+        return cell
+
+    def step(self, direction=None):
+        """Advance the game by one tick.
+
+        ``direction`` is ignored when it would reverse the snake. Returns
+        True while the snake is alive. After the call, ``removed`` holds the
+        freed tail cell (None when the snake grew) and ``ate`` tells whether
+        food was eaten.
+
+        A tick runs three phases, ``collide()``, ``move()`` and, after
+        eating, ``spawn_food()``, which subclasses may wrap.
+        """
+        if not self.alive:
+            return False
+        if direction is not None and direction != OPPOSITE[self.direction]:
+            self.direction = direction
+
+        new_head = self.collide()
+        if new_head is None:
+            return False
+        self.move(new_head)
+        if self.ate:
+            self.food = None
+            self.spawn_food()
+        return True
+
+    def collide(self):
+        """Collision phase of ``step()``: look at the cell ahead.
+
+        Eats the food there, or frees the tail so the head may follow it
+        into its cell. Returns the new head cell, or None when the snake
+        died.
+        """
+        grid = self.grid
+        body = self.body
+        new_head = body[0] + self.offsets[self.direction]
+        content = grid[new_head]
+        self.removed = None
+        self.ate = False
+        self.ticks += 1
+
+        if content == WALL:
+            self.alive = False
+            self.death = DEATH_WALL
+            return None
+
+        if content == FOOD:
+            self.ate = True
+            self.score += self.food_value
+        else:
+            tail = body.pop()
+            grid[tail] = EMPTY
+            if grid[new_head] != EMPTY:
+                body.append(tail)
+                grid[tail] = BODY
+                self.alive = False
+                self.death = DEATH_SELF
+                return None
+            self.removed = tail
+        return new_head
+
+    def move(self, new_head):
+        """Move phase of ``step()``: put the head on ``new_head``."""
+        grid = self.grid
+        if self.removed is not None:
+            self.free.add(self.removed)
+        grid[self.body[0]] = BODY
+        self.body.appendleft(new_head)
+        grid[new_head] = HEAD
+        self.free.discard(new_head)
+
+    def advance(self, direction=None):
+        """``step()`` that can be taken back with ``undo()``.
+
+        Returns ``(alive, record)``. Undoing records in reverse order
+        restores the exact state, free-cell order and generator included,
+        in constant time whatever the snake's length, so a search can walk
+        a tree of futures on one engine.
+        """
+        if direction is None or direction == OPPOSITE[self.direction]:
+            turn = self.direction
+        else:
+            turn = direction
+        new_head = self.body[0] + self.offsets[turn]
+        tail = self.body[-1]
+        record = (self.direction, self.food, self.food_index, self.score, self.ticks,
+                  self.alive, self.death, self.ate, self.removed, self.rng.getstate(),
+                  new_head, self.free.index[new_head], tail)
+        return self.step(direction), record
+
+    def undo(self, record):
+        """Take back the ``advance()`` that returned ``record``."""
+        (direction, food, food_index, score, ticks, alive, death, ate, removed, rng_state,
+         new_head, head_index, tail) = record
+        if alive and self.alive:
+            grid = self.grid
+            body = self.body
+            free = self.free
+            # Reverse of: add(tail), discard(new_head), place_food(new food)
+            if self.ate and self.food is not None:
+                grid[self.food] = EMPTY
+                free.undo_discard(self.food, self.food_index)
+            body.popleft()
+            grid[new_head] = FOOD if self.ate else EMPTY
+            grid[body[0]] = HEAD
+            free.undo_discard(new_head, head_index)
+            if not self.ate:
+                body.append(tail)
+                grid[tail] = BODY
+                free.undo_add(tail)
+        self.direction = direction
+        self.food = food
+        self.food_index = food_index
+        self.score = score
+        self.ticks = ticks
+        self.alive = alive
+        self.death = death
+        self.ate = ate
+        self.removed = removed
+        self.rng.setstate(rng_state)
+
+    def clone(self):
+        """Return an independent copy of the game.
+
+        Costs a copy of the board and the free-cell index, so on big boards
+        ``advance()``/``undo()`` is the cheaper way to look ahead. The
+        generator continues from the same state in both games.
+        """
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other.grid = self.grid[:]
+        other.body = self.body.copy()
+        other.free = self.free.copy()
+        other.rng = copy.copy(self.rng)
+        return other
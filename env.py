@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Reinforcement-learning environments for Snake Game
+Gym-style ``reset(seed)`` and ``step(action) -> (obs, reward, done, info)``
+over the engine rules, for training and scripted play without curses.
+
+Observations are NumPy views of the engines' own occupancy grids (cell
+codes EMPTY, BODY, HEAD, FOOD, WALL from engine.py), shaped
+``(height, width)``. The engines update those grids in place every tick,
+so building an observation costs nothing. The returned array is live:
+copy it if you keep it past the next ``step()`` or ``reset()``.
+
+Actions are engine directions (UP, DOWN, LEFT, RIGHT); -1 or None keeps
+the snake going straight.
+"""
+
+from batch_sim import BatchSnakeSim
+from config import SCORE_INCREMENT
+from engine import SnakeEngine, DIRECTIONS
+
+# NumPy is optional; only the environments need it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FOOD_REWARD = 1.0
+DEATH_REWARD = -1.0
+
+
+class SnakeEnv:
+    """One game behind a Gym-style interface.
+
+    ``done`` is set when the snake dies, when no food is left to eat, or
+    after ``max_ticks`` ticks (``info['truncated']``).
+    """
+
+    n_actions = len(DIRECTIONS)
+
+    def __init__(self, height=24, width=80, food_value=SCORE_INCREMENT, max_ticks=None,
+                 food_reward=FOOD_REWARD, death_reward=DEATH_REWARD, step_reward=0.0):
+        if np is None:
+            raise RuntimeError("SnakeEnv requires NumPy (pip install numpy)")
+        self.height = height
+        self.width = width
+        self.food_value = food_value
+        self.max_ticks = max_ticks
+        self.food_reward = food_reward
+        self.death_reward = death_reward
+        self.step_reward = step_reward
+        self.game = None
+        self.obs = None
+
+    @property
+    def observation_shape(self):
+        return (self.height, self.width)
+
+    def reset(self, seed=None):
+        """Start a new game; returns the first observation."""
+        self.game = SnakeEngine(self.height, self.width, food_value=self.food_value, seed=seed)
+        self.obs = np.frombuffer(self.game.grid, dtype=np.uint8).reshape(self.height, self.width)
+        return self.obs
+
+    def step(self, action):
+        """Advance one tick; returns ``(obs, reward, done, info)``."""
+        game = self.game
+        alive = game.step(None if action is None or action < 0 else action)
+        reward = self.step_reward
+        if game.ate:
+            reward += self.food_reward
+        if not alive:
+            reward += self.death_reward
+        truncated = self.max_ticks is not None and game.ticks >= self.max_ticks
+        info = {
+            'score': game.score,
+            'length': len(game),
+            'ticks': game.ticks,
+            'death': game.death,
+            'truncated': truncated and alive,
+        }
+        return self.obs, reward, not alive or game.food is None or truncated, info
+
+
+class VectorSnakeEnv:
+    """``n`` games stepped together on a ``BatchSnakeSim``.
+
+    ``obs`` is an ``(n, height, width)`` view of the simulator's grids.
+    Games that finish are restarted inside ``step()``, so their slice of
+    the returned observation already shows the next game; ``infos``
+    holds the final score, length and ticks of the finished ones.
+    """
+
+    n_actions = len(DIRECTIONS)
+
+    def __init__(self, n, height=24, width=80, max_ticks=None,
+                 food_reward=FOOD_REWARD, death_reward=DEATH_REWARD, step_reward=0.0):
+        if np is None:
+            raise RuntimeError("VectorSnakeEnv requires NumPy (pip install numpy)")
+        self.n = n
+        self.height = height
+        self.width = width
+        self.max_ticks = max_ticks
+        self.food_reward = food_reward
+        self.death_reward = death_reward
+        self.step_reward = step_reward
+        self.sim = None
+        self.obs = None
+
+    @property
+    def observation_shape(self):
+        return (self.n, self.height, self.width)
+
+    def reset(self, seed=None):
+        """Start ``n`` new games seeded ``seed``, ``seed + 1``, ..."""
+        self.sim = BatchSnakeSim(self.n, self.height, self.width, seed=seed)
+        self.obs = self.sim.grid.reshape(self.n, self.height, self.width)
+        return self.obs
+
+    def step(self, actions):
+        """Step every game; returns ``(obs, rewards, dones, infos)``.
+
+        ``rewards`` and ``dones`` are arrays. ``infos`` maps 'score',
+        'length', 'ticks', 'death' (batch_sim codes) and 'truncated' to
+        arrays with the final values of the games that ended (zero
+        elsewhere).
+        """
+        sim = self.sim
+        alive = sim.step(actions)
+        rewards = np.where(sim.ate, self.food_reward, 0.0) + self.step_reward
+        died = ~alive
+        rewards[died] += self.death_reward
+        dones = died | (sim.food < 0)
+        truncated = np.zeros(self.n, dtype=bool)
+        if self.max_ticks is not None:
+            truncated = (sim.ticks >= self.max_ticks) & ~dones
+            dones |= truncated
+        infos = {
+            'score': np.where(dones, sim.score, 0),
+            'length': np.where(dones, sim.length, 0),
+            'ticks': np.where(dones, sim.ticks, 0),
+            'death': np.where(dones, sim.death, 0),
+            'truncated': truncated,
+        }
+        if dones.any():
+            sim.reset(dones)
+        return self.obs, rewards, dones, infos
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+In-memory curses stand-in for Snake Game tests
+Lets the unmodified ``snake_game.main`` loop run without a terminal: windows
+are character buffers, keys come from a script, and time is a virtual
+clock that only moves when the game waits for input or sleeps. A full
+game therefore takes as long as its logic and rendering, not its ticks.
+
+Only the parts of curses the game uses are provided. Writes outside a
+window raise ``curses.error``, as real curses does, so drawing bugs show
+up in tests.
+
+    term = FakeTerminal(24, 80)
+    term.press(curses.KEY_UP, at=0.35)
+    term.press('q', at=2.0)
+    with term.install():
+        snake_game.main(['--seed', '1'])
+    print(term.screen())
+"""
+
+import bisect
+import contextlib
+import curses
+
+import render
+import snake_game
+
+# Key codes are the real ones, so KEY_DIRECTIONS in the game matches
+KEY_UP = curses.KEY_UP
+KEY_DOWN = curses.KEY_DOWN
+KEY_LEFT = curses.KEY_LEFT
+KEY_RIGHT = curses.KEY_RIGHT
+error = curses.error
+
+# Shortest virtual wait; like a real clock, time always moves on
+CLOCK_RESOLUTION = 1e-6
+
+
+class FakeWindow:
+    """A curses window backed by a list of character rows."""
+
+    def __init__(self, term, height, width, top=0, left=0):
+        self.term = term
+        self.height = height
+        self.width = width
+        self.top = top
+        self.left = left
+        self.rows = [[' '] * width for _ in range(height)]
+        # Rows written since the last noutrefresh, as curses tracks them
+        self.touched = set(range(height))
+        self.delay = -1
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def addch(self, y, x, ch, attr=0):
+        # Like curses, the lower-right cell cannot be written with addch
+        if not (0 <= y < self.height and 0 <= x < self.width) or (
+                y == self.height - 1 and x == self.width - 1):
+            raise error("addch() returned ERR")
+        self.rows[y][x] = ch if isinstance(ch, str) else chr(ch)
+        self.touched.add(y)
+
+    def addstr(self, y, x, s, attr=0):
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise error("addstr() returned ERR")
+        # Text wraps onto the following lines, as in curses
+        for ch in s:
+            if x == self.width:
+                y, x = y + 1, 0
+                if y == self.height:
+                    raise error("addstr() returned ERR")
+            self.rows[y][x] = ch
+            self.touched.add(y)
+            x += 1
+
+    def keypad(self, flag):
+        pass
+
+    def nodelay(self, flag):
+        self.delay = 0 if flag else -1
+
+    def timeout(self, delay):
+        self.delay = delay
+
+    def getch(self):
+        return self.term.next_key(self.delay)
+
+    def redrawwin(self):
+        self.touched.update(range(self.height))
+
+    def noutrefresh(self):
+        self.term.stage(self)
+
+    def refresh(self):
+        self.term.stage(self)
+        self.term.doupdate()
+
+
+class FakeWakeup:
+    """snake_game.Wakeup on the virtual clock: sleeps until the next key
+    or resize. ``term.idle_waits`` counts the waits."""
+
+    def __init__(self, term):
+        self.term = term
+
+    def wait(self):
+        term = self.term
+        term.idle_waits += 1
+        if term.resize_times and (not term.key_times or term.resize_times[0] <= term.key_times[0]):
+            term.now = max(term.now, term.resize_times.pop(0))
+            return True
+        if not term.key_times:
+            raise RuntimeError("wait() would block forever: no keys left")
+        term.now = max(term.now, term.key_times[0])
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeTerminal:
+    """A virtual terminal: screen, scripted keyboard and clock.
+
+    Installed with ``install()``, it stands in for the ``curses`` module
+    in snake_game and render, and for ``time`` and ``Wakeup`` in
+    snake_game.
+    ``frames`` counts screen updates; with ``keep_frames`` every frame is
+    also kept in ``history`` as a list of lines.
+    """
+
+    def __init__(self, height=24, width=80, keep_frames=False, time_limit=None):
+        self.height = height
+        self.width = width
+        self.keep_frames = keep_frames
+        self.time_limit = time_limit
+        self.now = 0.0
+        self.key_times = []
+        self.keys = []
+        self.resize_times = []
+        self.idle_waits = 0
+        self.cells = [[' '] * width for _ in range(height)]
+        self.frames = 0
+        self.history = []
+        self.started = False
+        self.ended = False
+
+    # Keyboard and clock
+
+    def press(self, key, at=None):
+        """Queue a key (a curses key code or a character) at virtual time ``at``."""
+        if isinstance(key, str):
+            key = ord(key)
+        at = self.now if at is None else at
+        i = bisect.bisect_right(self.key_times, at)
+        self.key_times.insert(i, at)
+        self.keys.insert(i, key)
+
+    def resize(self, at):
+        """Send a resize signal at virtual time ``at`` (seen while paused)."""
+        bisect.insort(self.resize_times, at)
+
+    def next_key(self, delay):
+        """``getch()``: a due key, or -1 once ``delay`` ms have passed.
+
+        Past ``time_limit`` the player presses Ctrl-C, which the game
+        treats as quitting.
+        """
+        if self.time_limit is not None and self.now >= self.time_limit:
+            raise KeyboardInterrupt
+        if self.key_times and self.key_times[0] <= self.now:
+            self.key_times.pop(0)
+            return self.keys.pop(0)
+        if delay < 0:
+            if not self.key_times:
+                raise RuntimeError("getch() would block forever: no keys left")
+            wake = self.key_times[0]
+        else:
+            wake = self.now + max(delay / 1000, CLOCK_RESOLUTION)
+        if self.key_times and self.key_times[0] <= wake:
+            self.now = max(self.now, self.key_times.pop(0))
+            return self.keys.pop(0)
+        self.now = wake
+        return -1
+
+    def monotonic(self):
+        return self.now
+
+    perf_counter = monotonic
+
+    def sleep(self, seconds):
+        self.now += max(seconds, CLOCK_RESOLUTION)
+
+    # curses module functions
+
+    def initscr(self):
+        self.started = True
+        self.ended = False
+        return FakeWindow(self, self.height, self.width)
+
+    def newwin(self, height, width, top=0, left=0):
+        return FakeWindow(self, height, width, top, left)
+
+    def noecho(self):
+        pass
+
+    def curs_set(self, visibility):
+        pass
+
+    def endwin(self):
+        self.ended = True
+
+    def stage(self, window):
+        """Copy a window's changed rows to the screen (``noutrefresh``)."""
+        width = min(window.width, self.width - window.left)
+        for y in window.touched:
+            if window.top + y < self.height:
+                self.cells[window.top + y][window.left:window.left + width] = window.rows[y][:width]
+        window.touched.clear()
+
+    def doupdate(self):
+        self.frames += 1
+        if self.keep_frames:
+            self.history.append(self.screen())
+
+    def screen(self):
+        """The screen as a list of lines."""
+        return [''.join(row) for row in self.cells]
+
+    @contextlib.contextmanager
+    def install(self):
+        """Make snake_game and render use this terminal instead of curses."""
+        saved = snake_game.curses, snake_game.time, snake_game.Wakeup, render.curses
+        snake_game.curses = snake_game.time = render.curses = self
+        snake_game.Wakeup = lambda: FakeWakeup(self)
+        try:
+            yield self
+        finally:
+            snake_game.curses, snake_game.time, snake_game.Wakeup, render.curses = saved
+
+    # The key codes the game reads from the curses module
+    KEY_UP = KEY_UP
+    KEY_DOWN = KEY_DOWN
+    KEY_LEFT = KEY_LEFT
+    KEY_RIGHT = KEY_RIGHT
+    error = error
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+High-score store for Snake Game
+Every finished game is one row of an SQLite database in WAL mode, so any
+number of game processes and server sessions can record scores at the
+same time while others read. Indexes on score and on (player, score)
+make top-N and per-player best lookups O(log n), however many games have
+been recorded.
+
+Usage: python highscores.py [--top N] [--player NAME] [--db FILE]
+"""
+
+import argparse
+import getpass
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from config import HIGH_SCORE_FILE, MAX_HIGH_SCORES
+from rng import MASK64, SEED_LIMIT
+
+# Milliseconds a writer waits for another writer's transaction
+BUSY_TIMEOUT_MS = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    ticks INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    seed INTEGER,
+    death TEXT,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC, id);
+CREATE INDEX IF NOT EXISTS games_by_difficulty ON games (difficulty, score DESC, id);
+CREATE INDEX IF NOT EXISTS games_by_player ON games (player, score DESC, id);
+"""
+
+
+def default_player():
+    """Name recorded for local games unless one is given."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "player"
+
+
+def signed_seed(seed):
+    """Return a seed as the signed 64-bit integer SQLite can store.
+
+    GameRng only uses the low 64 bits of a seed, so the stored value
+    still reproduces the game.
+    """
+    if seed is None:
+        return None
+    seed &= MASK64
+    return seed - (1 << 64) if seed >= SEED_LIMIT else seed
+
+
+def game_record(game, player, difficulty, seed=None):
+    """Return the record of a finished engine, ready for ``record()``."""
+    return {
+        'player': player,
+        'score': game.score,
+        'length': len(game),
+        'ticks': game.ticks,
+        'difficulty': difficulty,
+        'seed': seed,
+        'death': game.death,
+    }
+
+
+class HighScores:
+    """SQLite-backed log of finished games.
+
+    Writes use ``BEGIN IMMEDIATE`` so concurrent writers queue on the
+    database lock (for up to ``BUSY_TIMEOUT_MS``) instead of failing
+    halfway through. ``synchronous=NORMAL`` keeps the WAL crash-safe: a
+    crash may lose the last commits, never corrupt the file.
+    """
+
+    def __init__(self, path=HIGH_SCORE_FILE):
+        self.path = os.path.expanduser(path)
+        self.db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000,
+                                  isolation_level=None)
+        self.db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.row_factory = sqlite3.Row
+        # executescript() would commit on its own, so run the schema
+        # statement by statement inside one transaction
+        with self.transaction():
+            for statement in SCHEMA.split(';'):
+                if statement.strip():
+                    self.db.execute(statement)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        """``BEGIN IMMEDIATE`` ... ``COMMIT``, rolled back on error."""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("COMMIT")
+
+    def record(self, record):
+        """Store one finished game; returns its id."""
+        return self.record_many([record])[0]
+
+    def record_many(self, records):
+        """Store several finished games in one transaction; returns their ids.
+
+        Seeds are stored through ``signed_seed()``.
+        """
+        now = time.time()
+        ids = []
+        with self.transaction():
+            for r in records:
+                cursor = self.db.execute(
+                    "INSERT INTO games (player, score, length, ticks, difficulty, seed, death,"
+                    " played_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (r['player'], r['score'], r['length'], r['ticks'], r['difficulty'],
+                     signed_seed(r.get('seed')), r.get('death'), r.get('played_at', now)))
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def top(self, n=MAX_HIGH_SCORES, difficulty=None):
+        """The ``n`` best games, earliest first among equal scores."""
+        if difficulty is None:
+            rows = self.db.execute(
+                "SELECT * FROM games ORDER BY score DESC, id LIMIT ?", (n,))
+        else:
+            rows = self.db.execute(
+                "SELECT * FROM games WHERE difficulty = ? ORDER BY score DESC, id LIMIT ?",
+                (difficulty, n))
+        return [dict(row) for row in rows]
+
+    def best(self, player):
+        """A player's best game, or None if they have not played."""
+        row = self.db.execute(
+            "SELECT * FROM games WHERE player = ? ORDER BY score DESC, id LIMIT 1",
+            (player,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def qualifies(self, score, n=MAX_HIGH_SCORES):
+        """True if ``score`` would make it into the top ``n``."""
+        row = self.db.execute(
+            "SELECT score FROM games ORDER BY score DESC, id LIMIT 1 OFFSET ?",
+            (n - 1,)).fetchone()
+        return row is None or score > row[0]
+
+    def games(self):
+        """Iterate over every recorded game, oldest first, row by row."""
+        for row in self.db.execute("SELECT * FROM games ORDER BY id"):
+            yield dict(row)
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show Snake Game high scores")
+    parser.add_argument("--db", default=HIGH_SCORE_FILE, help="high-score database")
+    parser.add_argument("--top", type=int, default=MAX_HIGH_SCORES)
+    parser.add_argument("--difficulty", help="only games of this difficulty")
+    parser.add_argument("--player", help="show this player's best game")
+    args = parser.parse_args(argv)
+
+    with HighScores(args.db) as scores:
+        if args.player:
+            best = scores.best(args.player)
+            if best is None:
+                print(f"{args.player} has no recorded games")
+            else:
+                print(f"{args.player}: best score {best['score']} ({best['difficulty']}, "
+                      f"length {best['length']}, {best['ticks']} ticks)")
+            return
+        print(f"{'#':>3} {'player':<16} {'score':>6} {'length':>6} {'difficulty':<10} played")
+        for rank, r in enumerate(scores.top(args.top, args.difficulty), 1):
+            played = time.strftime("%Y-%m-%d %H:%M", time.localtime(r['played_at']))
+            print(f"{rank:>3} {r['player']:<16} {r['score']:>6} {r['length']:>6} "
+                  f"{r['difficulty']:<10} {played}")
+
+
+if __name__ == "__main__":
+    main()
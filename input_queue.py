@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Buffered input for Snake Game
+Queues turns read between ticks so quick key sequences are not lost.
+"""
+
+import time
+from collections import deque
+
+from config import INPUT_BUFFER_SIZE
+from engine import OPPOSITE
+from scheduler import JitterStats
+
+
+class InputQueue:
+    """Bounded FIFO of turns, applied at most one per tick.
+
+    Each turn is checked against the direction the snake will have when
+    the turn is reached (the last queued turn, or the current direction),
+    so repeats and reversals are dropped up front. Turns are timestamped on
+    arrival; ``rendered()`` records the input-to-render latency of turns
+    applied since the previous frame.
+    """
+
+    def __init__(self, size=INPUT_BUFFER_SIZE, clock=time.monotonic):
+        self.size = size
+        self.clock = clock
+        self.pending = deque()
+        self.applied = []
+        self.latency = JitterStats("input latency")
+
+    def __len__(self):
+        return len(self.pending)
+
+    def push(self, direction, current):
+        """Queue a turn; returns False if it was dropped."""
+        last = self.pending[-1][0] if self.pending else current
+        if direction == last or direction == OPPOSITE[last]:
+            return False
+        if len(self.pending) >= self.size:
+            return False
+        self.pending.append((direction, self.clock()))
+        return True
+
+    def pop(self, current):
+        """Return the turn for this tick, or None to keep going."""
+        while self.pending:
+            direction, stamp = self.pending.popleft()
+            if direction != current and direction != OPPOSITE[current]:
+                self.applied.append(stamp)
+                return direction
+        return None
+
+    def rendered(self):
+        """Record latency for turns that just reached the screen."""
+        if self.applied:
+            now = self.clock()
+            for stamp in self.applied:
+                self.latency.add(now - stamp)
+            self.applied.clear()
+
+    def clear(self):
+        self.pending.clear()
+        self.applied.clear()
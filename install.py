@@ -76,6 +76,16 @@ def install_game():
     files_to_copy = [
         "snake_game.py",
         "config.py",
+        "engine.py",
+        "rng.py",
+        "scheduler.py",
+        "input_queue.py",
+        "render.py",
+        "replay.py",
+        "metrics.py",
+        "world.py",
+        "highscores.py",
+        "autopilot.py",
         "README.md",
         "LICENSE"
     ]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Hot-path instrumentation for Snake Game
+Per-phase timing histograms for the game loop, exportable as JSON lines
+or in the Prometheus text format. Instrumentation is off unless enabled
+(DEBUG_MODE or --metrics); the plain loop then pays only a None check per
+phase.
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+
+from engine import SnakeEngine
+
+# Phases of one frame of the game loop
+PHASES = ('input', 'direction', 'collision', 'move', 'food', 'render')
+
+# Histogram bucket upper bounds in seconds (1 us .. 1 s)
+BUCKETS = (
+    1e-6, 2e-6, 5e-6,
+    1e-5, 2e-5, 5e-5,
+    1e-4, 2e-4, 5e-4,
+    1e-3, 2e-3, 5e-3,
+    1e-2, 2e-2, 5e-2,
+    1e-1, 2e-1, 5e-1,
+    1.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    __slots__ = ('counts', 'count', 'sum')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self):
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(BUCKETS + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (0-1)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for bound, total in self.cumulative():
+            if total >= target:
+                return bound
+        return float('inf')
+
+
+class PhaseMetrics:
+    """One histogram per game loop phase."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+    def observe(self, phase, seconds):
+        self.phases[phase].observe(seconds)
+
+    def snapshot(self):
+        """Return the current metrics as a JSON-friendly dict."""
+        return {
+            'time': time.time(),
+            'phases': {
+                name: {
+                    'count': h.count,
+                    'sum': h.sum,
+                    'p50': h.quantile(0.5),
+                    'p99': h.quantile(0.99),
+                    'buckets': h.counts,
+                }
+                for name, h in self.phases.items()
+            },
+        }
+
+    def to_json_line(self):
+        return json.dumps(self.snapshot(), separators=(',', ':'))
+
+    def to_prometheus(self):
+        lines = [
+            "# HELP snake_phase_seconds Time spent in each phase of the game loop.",
+            "# TYPE snake_phase_seconds histogram",
+        ]
+        for name, h in self.phases.items():
+            for bound, total in h.cumulative():
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'snake_phase_seconds_bucket{{phase="{name}",le="{le}"}} {total}')
+            lines.append(f'snake_phase_seconds_sum{{phase="{name}"}} {h.sum!r}')
+            lines.append(f'snake_phase_seconds_count{{phase="{name}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write a snapshot; ``.jsonl`` files are appended, anything else is
+        replaced atomically with the Prometheus text format."""
+        if path.endswith('.jsonl'):
+            with open(path, 'a', encoding='utf-8') as fh:
+                fh.write(self.to_json_line() + "\n")
+        else:
+            tmp = f"{path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                fh.write(self.to_prometheus())
+            os.replace(tmp, path)
+
+    def summary(self):
+        """One line per phase for the end-of-game report."""
+        return "\n".join(
+            f"{name:>9}: {h.count:7d} samples, mean {h.sum / h.count * 1e6 if h.count else 0:8.2f} us, "
+            f"p99 <= {h.quantile(0.99) * 1e6:.0f} us"
+            for name, h in self.phases.items()
+        )
+
+
+class InstrumentedEngine(SnakeEngine):
+    """SnakeEngine that times the collision, move and food phases of ``step``.
+
+    Each phase method of the plain engine is wrapped with a timer, so the
+    rules stay in one place and disabled metrics cost nothing per tick.
+    The initial food is timed too when it cannot go in the middle.
+    """
+
+    def __init__(self, *args, metrics=None, **kwargs):
+        self.metrics = metrics if metrics is not None else PhaseMetrics()
+        super().__init__(*args, **kwargs)
+
+    def collide(self):
+        clock = self.metrics.clock
+        t0 = clock()
+        new_head = super().collide()
+        self.metrics.phases['collision'].observe(clock() - t0)
+        return new_head
+
+    def move(self, new_head):
+        clock = self.metrics.clock
+        t0 = clock()
+        super().move(new_head)
+        self.metrics.phases['move'].observe(clock() - t0)
+
+    def spawn_food(self):
+        clock = self.metrics.clock
+        t0 = clock()
+        cell = super().spawn_food()
+        self.metrics.phases['food'].observe(clock() - t0)
+        return cell
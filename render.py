@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Rendering for Snake Game
+Collects the cells that changed during a frame and writes them to the
+terminal in a single batched update, either through curses or as raw
+ANSI escape sequences.
+"""
+
+import curses
+import os
+import time
+from collections import deque
+
+from config import EMPTY_CHAR, FOOD_CHAR, SNAKE_BODY_CHAR, SNAKE_HEAD_CHAR, WALL_CHAR
+from engine import EMPTY, BODY, HEAD, FOOD, WALL
+
+
+class FrameStats:
+    """Frame rate, render time and output size of recent frames."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.frames = deque()
+        self.frame_time = 0.0
+        self.frame_bytes = 0
+
+    def add(self, started, frame_bytes):
+        now = self.clock()
+        self.frame_time = now - started
+        self.frame_bytes = frame_bytes
+        self.frames.append(now)
+        while self.frames and now - self.frames[0] > 1.0:
+            self.frames.popleft()
+
+    @property
+    def fps(self):
+        return len(self.frames)
+
+    def overlay(self):
+        return (f" {self.fps:3d} fps {self.frame_time * 1000:6.2f} ms "
+                f"{self.frame_bytes:5d} B ")
+
+
+def move_cost(y, x):
+    """Bytes of the escape sequence that moves the cursor to (y, x)."""
+    return len(f"\x1b[{y + 1};{x + 1}H")
+
+
+def cursor_move(cursor, y, x):
+    """Return the shortest escape sequence taking the cursor to (y, x).
+
+    ``cursor`` is the current (y, x) position, or None when unknown.
+    """
+    best = b'\x1b[%d;%dH' % (y + 1, x + 1)
+    if cursor is None:
+        return best
+    cy, cx = cursor
+    if cy == y:
+        if cx == x:
+            return b''
+        if x > cx:
+            move = b'\x1b[C' if x - cx == 1 else b'\x1b[%dC' % (x - cx)
+        elif cx - x <= 3:
+            move = b'\b' * (cx - x)
+        else:
+            move = b'\x1b[%dD' % (cx - x)
+    elif cx == x:
+        if y > cy:
+            move = b'\x1b[B' if y - cy == 1 else b'\x1b[%dB' % (y - cy)
+        else:
+            move = b'\x1b[A' if cy - y == 1 else b'\x1b[%dA' % (cy - y)
+    else:
+        return best
+    return move if len(move) < len(best) else best
+
+
+class Renderer:
+    """Base dirty-cell renderer.
+
+    Drawing calls only record what changed; ``flush()`` writes the frame.
+    Several ticks drawn within one frame collapse to the final content of
+    each cell. Subclasses implement ``flush()`` for an output backend.
+    """
+
+    def __init__(self, height, width, show_fps=False, clock=time.perf_counter):
+        self.height = height
+        self.width = width
+        self.show_fps = show_fps
+        self.clock = clock
+        self.cells = {}
+        self.texts = {}
+        self.stats = FrameStats(clock)
+
+    def cell(self, y, x, ch):
+        """Mark one cell as changed."""
+        self.cells[(y, x)] = ch
+
+    def text(self, y, x, s):
+        """Mark a line of text as changed."""
+        self.texts[(y, x)] = s
+
+    def draw_board(self, game):
+        """Draw the whole snake and the food."""
+        for cell in game.body:
+            self.cell(*game.pos(cell), SNAKE_BODY_CHAR)
+        self.cell(*game.pos(game.head), SNAKE_HEAD_CHAR)
+        if game.food is not None:
+            self.cell(*game.pos(game.food), FOOD_CHAR)
+
+    def draw_tick(self, game):
+        """Draw the changes of the tick the engine just ran."""
+        if game.removed is not None:
+            self.cell(*game.pos(game.removed), EMPTY_CHAR)
+        if len(game.body) > 1:
+            self.cell(*game.pos(game.body[1]), SNAKE_BODY_CHAR)
+        self.cell(*game.pos(game.head), SNAKE_HEAD_CHAR)
+        if game.ate and game.food is not None:
+            self.cell(*game.pos(game.food), FOOD_CHAR)
+
+    @property
+    def dirty(self):
+        return bool(self.cells or self.texts)
+
+    def flush(self):
+        raise NotImplementedError
+
+    def repaint(self):
+        """Draw the whole screen again, e.g. after the terminal was resized."""
+        raise NotImplementedError
+
+
+class CursesRenderer(Renderer):
+    """Dirty-cell renderer on top of a curses window.
+
+    ``flush()`` applies the frame to the window and pushes it to the
+    terminal with one ``noutrefresh()``/``doupdate()`` pass.
+    ``frame_bytes`` is an estimate (cursor move plus glyphs per change), as
+    curses does not report what it actually wrote.
+    """
+
+    def __init__(self, window, show_fps=False, clock=time.perf_counter):
+        height, width = window.getmaxyx()
+        super().__init__(height, width, show_fps, clock)
+        self.window = window
+
+    def flush(self):
+        """Write the frame's changes and update the terminal once."""
+        started = self.clock()
+        w = self.window
+        frame_bytes = 0
+        for (y, x), ch in self.cells.items():
+            w.addch(y, x, ch)
+            frame_bytes += move_cost(y, x) + 1
+        for (y, x), s in self.texts.items():
+            w.addstr(y, x, s)
+            frame_bytes += move_cost(y, x) + len(s)
+        self.cells.clear()
+        self.texts.clear()
+        if self.show_fps:
+            overlay = self.stats.overlay()
+            w.addstr(self.height - 1, 2, overlay[:self.width - 3])
+            frame_bytes += move_cost(self.height - 1, 2) + len(overlay)
+        w.noutrefresh()
+        curses.doupdate()
+        self.stats.add(started, frame_bytes)
+
+    def repaint(self):
+        """Send the window's whole content to the terminal again."""
+        self.window.redrawwin()
+        self.window.noutrefresh()
+        curses.doupdate()
+
+
+class AnsiRenderer(Renderer):
+    """Dirty-cell renderer writing raw ANSI escape sequences.
+
+    Each frame becomes one bytearray of cursor moves and glyphs, sent with
+    a single ``os.write()``. Changes are written in screen order and the
+    cursor position is tracked across frames, so each change costs the
+    shortest absolute or relative cursor move. A shadow copy of what was
+    written lets short forward gaps be crossed by re-sending the glyphs
+    already on screen, which is cheaper than an escape sequence.
+    ``frame_bytes`` is the exact size of what was written.
+    """
+
+    def __init__(self, fd, height, width, show_fps=False, clock=time.perf_counter):
+        super().__init__(height, width, show_fps, clock)
+        self.fd = fd
+        self.glyphs = {}
+        self.writes = 0
+        self.cursor = None
+        self.shadow = [[None] * width for _ in range(height)]
+
+    def move(self, buf, cursor, y, x):
+        """Append the cheapest way of moving from ``cursor`` to (y, x)."""
+        if cursor is not None and cursor[0] == y and 0 < x - cursor[1] <= 3:
+            gap = self.shadow[y][cursor[1]:x]
+            if None not in gap:
+                buf += b''.join(gap)
+                return
+        buf += cursor_move(cursor, y, x)
+
+    def encode(self, ch):
+        glyph = self.glyphs.get(ch)
+        if glyph is None:
+            glyph = self.glyphs[ch] = ch.encode('utf-8')
+        return glyph
+
+    def flush(self):
+        """Write the frame's changes with one system call."""
+        started = self.clock()
+        buf = bytearray()
+        cursor = self.cursor
+        width = self.width
+        shadow = self.shadow
+        for (y, x) in sorted(self.cells):
+            self.move(buf, cursor, y, x)
+            glyph = self.encode(self.cells[(y, x)])
+            buf += glyph
+            shadow[y][x] = glyph
+            # Past the last column the terminal's cursor position is fuzzy
+            cursor = (y, x + 1) if x + 1 < width else None
+        texts = list(self.texts.items())
+        if self.show_fps:
+            texts.append(((self.height - 1, 2), self.stats.overlay()[:self.width - 3]))
+        for (y, x), s in texts:
+            self.move(buf, cursor, y, x)
+            for i, ch in enumerate(s[:width - x]):
+                glyph = self.encode(ch)
+                buf += glyph
+                shadow[y][x + i] = glyph
+            cursor = (y, x + len(s)) if x + len(s) < width else None
+        self.cursor = cursor
+        self.cells.clear()
+        self.texts.clear()
+        self.write(buf)
+        self.stats.add(started, len(buf))
+
+    def repaint(self):
+        """Clear the terminal and send everything on the shadow screen again."""
+        buf = bytearray(b'\x1b[2J')
+        cursor = None
+        for y, row in enumerate(self.shadow):
+            for x, glyph in enumerate(row):
+                if glyph is not None and glyph != b' ':
+                    self.move(buf, cursor, y, x)
+                    buf += glyph
+                    cursor = (y, x + 1) if x + 1 < self.width else None
+        self.cursor = cursor
+        self.write(buf)
+
+    def write(self, buf):
+        """Write a buffer to the terminal, however many calls it takes."""
+        view = memoryview(buf)
+        while view:
+            written = os.write(self.fd, view)
+            view = view[written:]
+            self.writes += 1
+
+
+class Camera:
+    """Scrolling view of a world larger than the screen.
+
+    Shows a ``height`` x ``width`` window of the world on screen rows
+    ``top`` onwards of a renderer, and takes ``draw_board``/``draw_tick``
+    calls in place of it. When the head comes within ``margin`` cells of
+    an edge the view jumps to re-center on it; a jump only redraws the
+    screen cells whose glyph changed, which on a mostly empty world is
+    little more than what scrolled in. The game must provide
+    ``content(cell)`` (see world.WorldEngine).
+    """
+
+    GLYPHS = {EMPTY: EMPTY_CHAR, BODY: SNAKE_BODY_CHAR, HEAD: SNAKE_HEAD_CHAR,
+              FOOD: FOOD_CHAR, WALL: WALL_CHAR}
+
+    def __init__(self, renderer, top, height, width, margin=None):
+        self.renderer = renderer
+        self.top = top
+        self.height = height
+        self.width = width
+        self.margin = margin if margin is not None else min(height, width) // 4
+        self.y = 0
+        self.x = 0
+        self.jumps = 0
+        # Cell codes currently on screen (the screen starts blank)
+        self.screen = [bytearray(width) for _ in range(height)]
+
+    def put(self, game, cell):
+        """Draw one world cell if it is in view and its glyph changed."""
+        y, x = game.pos(cell)
+        sy = y - self.y
+        sx = x - self.x
+        if 0 <= sy < self.height and 0 <= sx < self.width:
+            code = game.content(cell)
+            if self.screen[sy][sx] != code:
+                self.screen[sy][sx] = code
+                self.renderer.cell(self.top + sy, sx, self.GLYPHS[code])
+
+    def follow(self, game):
+        """Re-center on the head if it is too close to an edge.
+
+        Returns True when the view moved.
+        """
+        hy, hx = game.pos(game.head)
+        y, x = self.y, self.x
+        if not self.margin <= hy - y < self.height - self.margin:
+            y = min(max(hy - self.height // 2, 0), max(game.height - self.height, 0))
+        if not self.margin <= hx - x < self.width - self.margin:
+            x = min(max(hx - self.width // 2, 0), max(game.width - self.width, 0))
+        if (y, x) == (self.y, self.x):
+            return False
+        self.y, self.x = y, x
+        self.jumps += 1
+        return True
+
+    def redraw(self, game):
+        """Bring every screen cell up to date with the world."""
+        content = game.content
+        glyphs = self.GLYPHS
+        cell = self.renderer.cell
+        rows = min(self.height, game.height - self.y)
+        cols = min(self.width, game.width - self.x)
+        for sy in range(self.height):
+            line = self.screen[sy]
+            base = (self.y + sy) * game.width + self.x
+            for sx in range(self.width):
+                code = content(base + sx) if sy < rows and sx < cols else EMPTY
+                if line[sx] != code:
+                    line[sx] = code
+                    cell(self.top + sy, sx, glyphs[code])
+
+    def draw_board(self, game):
+        """Center the view on the head and draw it."""
+        self.follow(game)
+        self.redraw(game)
+
+    def draw_tick(self, game):
+        """Draw the changes of the tick the engine just ran."""
+        if self.follow(game):
+            self.redraw(game)
+            return
+        if game.removed is not None:
+            self.put(game, game.removed)
+        if len(game.body) > 1:
+            self.put(game, game.body[1])
+        self.put(game, game.head)
+        if game.ate and game.food is not None:
+            self.put(game, game.food)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Compact replays for Snake Game
+A replay is the RNG seed, board size, difficulty and the list of turns,
+which is enough to re-simulate a whole game through the headless engine.
+
+File layout (all integers are unsigned LEB128 varints):
+
+    b'SNKR' version seed height width difficulty end_tick count
+    count x (tick_delta << 2 | direction)
+
+``tick_delta`` is the number of ticks since the previous turn and
+``direction`` is the engine direction passed to ``step()`` on that tick.
+
+Usage: python replay.py FILE...    (fast-forward and print the outcome)
+"""
+
+import argparse
+import sys
+import time
+
+from config import DEFAULT_DIFFICULTY, DIFFICULTY_LEVELS, MIN_TERMINAL_HEIGHT, MIN_TERMINAL_WIDTH
+from engine import SnakeEngine
+
+MAGIC = b'SNKR'
+VERSION = 2
+DIFFICULTIES = list(DIFFICULTY_LEVELS)
+
+
+class ReplayError(ValueError):
+    """Raised for data that is not a valid replay."""
+
+
+def write_varint(buf, value):
+    """Append an unsigned varint to a bytearray."""
+    if value < 0:
+        raise ReplayError(f"cannot encode negative value {value}")
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def read_varint(data, pos):
+    """Read an unsigned varint; returns (value, new position)."""
+    value = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+    except IndexError:
+        raise ReplayError("truncated replay") from None
+
+
+class Replay:
+    """Seed, settings and turn log of one game."""
+
+    def __init__(self, seed, height, width, difficulty=DEFAULT_DIFFICULTY,
+                 events=None, end_tick=0):
+        self.seed = seed
+        self.height = height
+        self.width = width
+        self.difficulty = difficulty
+        self.events = events if events is not None else []
+        self.end_tick = end_tick
+
+    def __eq__(self, other):
+        return isinstance(other, Replay) and self.__dict__ == other.__dict__
+
+    def record(self, tick, direction):
+        """Log the direction passed to ``step()`` on a tick."""
+        self.events.append((tick, direction))
+
+    def new_game(self, engine=SnakeEngine, **kwargs):
+        """Return a fresh engine set up like the recorded game.
+
+        ``engine`` may be a SnakeEngine subclass; extra keyword arguments
+        are passed to its constructor.
+        """
+        food_value = DIFFICULTY_LEVELS[self.difficulty]['food_value']
+        return engine(self.height, self.width, food_value=food_value, seed=self.seed, **kwargs)
+
+    def encode(self):
+        buf = bytearray(MAGIC)
+        for value in (VERSION, self.seed, self.height, self.width,
+                      DIFFICULTIES.index(self.difficulty), self.end_tick, len(self.events)):
+            write_varint(buf, value)
+        last = 0
+        for tick, direction in self.events:
+            write_varint(buf, (tick - last) << 2 | direction)
+            last = tick
+        return bytes(buf)
+
+    @classmethod
+    def decode(cls, data):
+        if data[:4] != MAGIC:
+            raise ReplayError("not a replay file")
+        pos = 4
+        header = []
+        for _ in range(7):
+            value, pos = read_varint(data, pos)
+            header.append(value)
+        version, seed, height, width, difficulty, end_tick, count = header
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        if difficulty >= len(DIFFICULTIES):
+            raise ReplayError(f"unknown difficulty {difficulty}")
+        # The game never records a board smaller than the smallest terminal
+        if height < MIN_TERMINAL_HEIGHT or width < MIN_TERMINAL_WIDTH:
+            raise ReplayError(f"board too small: {width}x{height}")
+        events = []
+        tick = 0
+        for _ in range(count):
+            value, pos = read_varint(data, pos)
+            tick += value >> 2
+            events.append((tick, value & 3))
+        return cls(seed, height, width, DIFFICULTIES[difficulty], events, end_tick)
+
+    def save(self, path):
+        with open(path, "wb") as fh:
+            fh.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as fh:
+            return cls.decode(fh.read())
+
+
+def fast_forward(replay):
+    """Re-simulate a replay as fast as possible; returns the final engine."""
+    game = replay.new_game()
+    step = game.step
+    end_tick = replay.end_tick
+    for tick, direction in replay.events:
+        # Ticks without a turn just keep going
+        while game.ticks < tick:
+            if not step():
+                return game
+        if not step(direction):
+            return game
+    while game.ticks < end_tick and step():
+        pass
+    return game
+
+
+def playback(replay, realtime=False, clock=time.monotonic, sleep=time.sleep):
+    """Yield the engine after every tick of a replay.
+
+    With ``realtime`` the ticks are paced at the replay's difficulty speed;
+    otherwise they run as fast as the consumer takes them.
+    """
+    game = replay.new_game()
+    turns = dict(replay.events)
+    step_time = DIFFICULTY_LEVELS[replay.difficulty]['speed'] / 1000.0
+    next_tick = clock() + step_time
+    while game.alive and game.ticks < replay.end_tick:
+        if realtime:
+            delay = next_tick - clock()
+            if delay > 0:
+                sleep(delay)
+            next_tick += step_time
+        game.step(turns.get(game.ticks))
+        yield game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fast-forward Snake Game replays")
+    parser.add_argument("files", nargs="+", help="replay files")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ReplayError) as e:
+            print(f"{path}: {e}")
+            sys.exit(1)
+        start = time.perf_counter()
+        game = fast_forward(replay)
+        elapsed = time.perf_counter() - start
+        outcome = f"died ({game.death})" if game.death else "quit"
+        print(f"{path}: {replay.width}x{replay.height} {replay.difficulty} seed {replay.seed}, "
+              f"{len(replay.events)} turns -> score {game.score} after {game.ticks} ticks, "
+              f"{outcome} [{elapsed * 1000:.2f} ms]")
+
+
+if __name__ == "__main__":
+    main()
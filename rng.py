@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Deterministic random numbers for Snake Game
+Every game owns a small seedable generator, so a seed and the player's
+inputs fully determine a game no matter which process runs it.
+
+The generator is SplitMix64. Its n-th output depends only on the seed and
+n, so draws can also be produced in bulk with NumPy, for one game or for
+many games at once, without a Python call per number.
+"""
+
+import os
+from array import array
+
+# NumPy is optional; only bulk generation uses it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MASK64 = (1 << 64) - 1
+GAMMA = 0x9E3779B97F4A7C15
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+
+# Seeds are stored in signed 64-bit SQLite columns, so they stay below 2**63
+SEED_LIMIT = 1 << 63
+
+
+def mix64(z):
+    """SplitMix64 output function."""
+    z = ((z ^ (z >> 30)) * MIX1) & MASK64
+    z = ((z ^ (z >> 27)) * MIX2) & MASK64
+    return z ^ (z >> 31)
+
+
+def random_seed():
+    """Return a fresh seed from the OS.
+
+    63 bits, so the seed fits a signed SQLite INTEGER in the high-score
+    table.
+    """
+    return int.from_bytes(os.urandom(8), 'little') >> 1
+
+
+class GameRng:
+    """Seedable per-game generator.
+
+    ``below(n)`` maps the top 32 bits of a draw onto ``range(n)`` with a
+    multiply and shift, which the vectorized versions reproduce exactly.
+    """
+
+    __slots__ = ('seed', 'state')
+
+    def __init__(self, seed=None):
+        self.seed = random_seed() if seed is None else seed & MASK64
+        self.state = self.seed
+
+    def next64(self):
+        """Return the next raw 64-bit draw."""
+        self.state = (self.state + GAMMA) & MASK64
+        return mix64(self.state)
+
+    def below(self, n):
+        """Return a number in ``range(n)`` for 0 < n < 2**32."""
+        return ((self.next64() >> 32) * n) >> 32
+
+    def randrange(self, n):
+        """``random.Random.randrange`` compatible single-argument form."""
+        return self.below(n)
+
+    def randint(self, a, b):
+        return a + self.below(b - a + 1)
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
+
+    def __copy__(self):
+        other = GameRng.__new__(GameRng)
+        other.seed = self.seed
+        other.state = self.state
+        return other
+
+    def fill(self, count):
+        """Pre-generate the next ``count`` raw draws.
+
+        Returns a NumPy uint64 array when NumPy is available, otherwise an
+        ``array('Q')``. The generator advances past the returned draws.
+        """
+        if np is not None:
+            steps = np.arange(1, count + 1, dtype=np.uint64)
+            draws = mix64_array(np.uint64(self.state) + steps * np.uint64(GAMMA))
+        else:
+            draws = array('Q', (mix64((self.state + i * GAMMA) & MASK64)
+                                for i in range(1, count + 1)))
+        self.state = (self.state + count * GAMMA) & MASK64
+        return draws
+
+
+def mix64_array(z):
+    """Vectorized SplitMix64 output function over a uint64 array."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(MIX1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(MIX2)
+    return z ^ (z >> np.uint64(31))
+
+
+class BatchRng:
+    """One GameRng stream per game, advanced with NumPy.
+
+    Game ``i`` seeded with ``s`` produces exactly the draws of
+    ``GameRng(s)``, whatever else is in the batch.
+    """
+
+    def __init__(self, seeds):
+        if np is None:
+            raise RuntimeError("BatchRng requires NumPy (pip install numpy)")
+        self.state = np.array([s & MASK64 for s in seeds], dtype=np.uint64)
+
+    def reseed(self, games, seeds):
+        self.state[games] = np.array([s & MASK64 for s in seeds], dtype=np.uint64)
+
+    def next64(self, games):
+        """Return one raw draw for each selected game."""
+        state = self.state[games] + np.uint64(GAMMA)
+        self.state[games] = state
+        return mix64_array(state)
+
+    def below(self, games, n):
+        """Return one number in ``range(n)`` per selected game (n may vary)."""
+        top = self.next64(games) >> np.uint64(32)
+        return ((top * np.asarray(n, dtype=np.uint64)) >> np.uint64(32)).astype(np.int64)
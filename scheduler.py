@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Fixed-timestep scheduler for Snake Game
+Runs game logic at a steady rate from a monotonic clock, independent of
+how often the loop wakes up for input or rendering.
+"""
+
+import time
+from collections import deque
+
+from config import TURBO_REFRESH_HZ
+
+# Never run more than this many ticks to catch up after a stall (e.g. the
+# process was suspended); the rest of the backlog is dropped.
+MAX_CATCHUP_TICKS = 5
+
+# Turbo mode runs this many ticks between checks for keys and frames
+TURBO_BATCH = 64
+
+# Ticks per second are measured over at least this many seconds
+RATE_WINDOW = 0.5
+
+
+class JitterStats:
+    """Running statistics of timing samples, e.g. how late ticks ran.
+
+    Mean and max cover every tick; percentiles cover the most recent
+    ``window`` ticks.
+    """
+
+    def __init__(self, label="tick jitter", window=1000):
+        self.label = label
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, lateness):
+        self.count += 1
+        self.total += lateness
+        if lateness > self.max:
+            self.max = lateness
+        self.recent.append(lateness)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Return the p-th percentile (0-100) of recent lateness."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def __str__(self):
+        return (f"{self.label} over {self.count} samples: "
+                f"mean {self.mean * 1000:.3f} ms, p50 {self.percentile(50) * 1000:.3f} ms, "
+                f"p99 {self.percentile(99) * 1000:.3f} ms, max {self.max * 1000:.3f} ms")
+
+
+class FixedTimestep:
+    """Accumulator-based fixed timestep.
+
+    Elapsed clock time is added to an accumulator; every whole ``step``
+    in it is one tick of game logic. What remains in the accumulator after
+    the ticks are taken is how late the last tick ran, which is recorded
+    in ``jitter``.
+    """
+
+    def __init__(self, step_ms, clock=time.monotonic):
+        self.step = step_ms / 1000.0
+        self.clock = clock
+        self.last = clock()
+        self.accumulator = 0.0
+        self.jitter = JitterStats()
+
+    def due(self):
+        """Return how many ticks are due now and consume them."""
+        now = self.clock()
+        self.accumulator += now - self.last
+        self.last = now
+        if self.accumulator < self.step:
+            return 0
+        ticks = int(self.accumulator // self.step)
+        self.accumulator -= ticks * self.step
+        self.jitter.add(self.accumulator)
+        if ticks > MAX_CATCHUP_TICKS:
+            ticks = MAX_CATCHUP_TICKS
+        return ticks
+
+    def timeout(self):
+        """Seconds left until the next tick is due (never negative)."""
+        remaining = self.step - self.accumulator - (self.clock() - self.last)
+        return remaining if remaining > 0 else 0.0
+
+    def reset(self):
+        """Restart the schedule from now, discarding any backlog."""
+        self.last = self.clock()
+        self.accumulator = 0.0
+
+
+class TurboPacer:
+    """Uncapped pacing for bot and soak runs, with decimated rendering.
+
+    A drop-in for FixedTimestep in the game loop: ``timeout()`` is always
+    zero and ``due()`` hands out a batch of ticks at once, so logic runs as
+    fast as the CPU allows. ``frame_due()`` decides which batches end with
+    a frame: every ``render_every`` ticks or, without it, ``refresh_hz``
+    times per second. ``rate`` is the measured ticks per second and
+    ``jitter`` records how late frames were drawn.
+    """
+
+    def __init__(self, render_every=None, refresh_hz=TURBO_REFRESH_HZ, clock=time.monotonic):
+        self.batch = render_every or TURBO_BATCH
+        self.interval = None if render_every else 1.0 / refresh_hz
+        self.clock = clock
+        now = clock()
+        self.next_frame = now + (self.interval or 0.0)
+        self.mark = now
+        self.mark_ticks = 0
+        self.rate = 0.0
+        self.jitter = JitterStats("frame lateness")
+
+    def due(self):
+        """Return how many ticks to run before the next check."""
+        return self.batch
+
+    def timeout(self):
+        return 0.0
+
+    def reset(self):
+        """Restart frame pacing and rate measurement from now."""
+        now = self.clock()
+        self.next_frame = now + (self.interval or 0.0)
+        self.mark = None
+
+    def frame_due(self, ticks):
+        """Whether to draw after the batch that brought the game to ``ticks``."""
+        now = self.clock()
+        if self.interval is not None:
+            if now < self.next_frame:
+                return False
+            self.jitter.add(now - self.next_frame)
+            self.next_frame += self.interval
+            if self.next_frame <= now:
+                # After a stall, pace from now rather than drawing a burst
+                self.next_frame = now + self.interval
+        if self.mark is None:
+            self.mark = now
+            self.mark_ticks = ticks
+        elapsed = now - self.mark
+        if elapsed >= RATE_WINDOW:
+            self.rate = (ticks - self.mark_ticks) / elapsed
+            self.mark = now
+            self.mark_ticks = ticks
+        return True
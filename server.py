@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Game server for Snake Game
+Hosts many independent games in one asyncio event loop. Every session has
+its own engine and input queue, but all sessions of one speed are stepped
+by a single shared timer, so an idle server costs one wakeup per tick per
+difficulty, not one per player.
+
+Protocol, over TCP or a Unix socket:
+
+    client -> server  one hello line "DIFFICULTY [SEED [PLAYER]]\\n" (empty
+                      line for the defaults), then one byte per command:
+                      u d l r to turn, q to quit
+    server -> client  binary messages, little endian:
+                      START  kind=1 height:u16 width:u16 seed:u64 game:u32
+                             food:i32 count:u16 then count x body cell:u32
+                             (head first)
+                      TICK   kind=2 tick:u32 head:u32 removed:i32 food:i32 score:u32
+                      END    kind=3 tick:u32 score:u32 death:u8 (0 quit, 1 wall, 2 self)
+
+Cells are ``y * width + x``; -1 means none (no tail removed, no food).
+
+A spectator sends the hello line "WATCH GAME" instead and receives the
+spectate.py feed of that game until it ends.
+
+Usage:
+    python server.py serve [--port 7777 | --unix PATH] [--scores FILE]
+    python server.py load --sessions 2000 [--port 7777 | --unix PATH] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import socket
+import sqlite3
+import struct
+import sys
+import time
+
+from config import DEFAULT_DIFFICULTY, DIFFICULTY_LEVELS
+from engine import SnakeEngine, UP, DOWN, LEFT, RIGHT, DEATH_WALL, DEATH_SELF
+from highscores import HighScores, game_record
+from input_queue import InputQueue
+from rng import SEED_LIMIT, random_seed
+from scheduler import FixedTimestep
+from spectate import Broadcaster, SpectatorEncoder
+
+DEFAULT_PORT = 7777
+BOARD_HEIGHT = 24
+BOARD_WIDTH = 80
+
+# A client this far behind on reading is dropped instead of buffering more
+MAX_WRITE_BUFFER = 64 * 1024
+# Longest hello line accepted
+MAX_HELLO = 64
+
+MSG_START = 1
+MSG_TICK = 2
+MSG_END = 3
+START = struct.Struct('<BHHQIiH')
+TICK = struct.Struct('<BIIiiI')
+END = struct.Struct('<BIIB')
+
+COMMANDS = {ord('u'): UP, ord('d'): DOWN, ord('l'): LEFT, ord('r'): RIGHT}
+DEATH_CODES = {None: 0, DEATH_WALL: 1, DEATH_SELF: 2}
+
+
+def encode_start(game, game_id=0):
+    body = list(game.body)
+    food = -1 if game.food is None else game.food
+    return (START.pack(MSG_START, game.height, game.width, game.rng.seed, game_id,
+                       food, len(body))
+            + struct.pack(f'<{len(body)}I', *body))
+
+
+class MessageReader:
+    """Incremental parser for server messages (used by clients)."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes; returns the list of complete messages.
+
+        Messages are tuples starting with their kind; START carries the
+        body cells as a tuple in last position.
+        """
+        buf = self.buffer
+        buf += data
+        messages = []
+        pos = 0
+        while pos < len(buf):
+            kind = buf[pos]
+            if kind == MSG_TICK:
+                if len(buf) - pos < TICK.size:
+                    break
+                messages.append(TICK.unpack_from(buf, pos))
+                pos += TICK.size
+            elif kind == MSG_START:
+                if len(buf) - pos < START.size:
+                    break
+                header = START.unpack_from(buf, pos)
+                end = pos + START.size + 4 * header[-1]
+                if len(buf) < end:
+                    break
+                body = struct.unpack_from(f'<{header[-1]}I', buf, pos + START.size)
+                messages.append(header + (body,))
+                pos = end
+            elif kind == MSG_END:
+                if len(buf) - pos < END.size:
+                    break
+                messages.append(END.unpack_from(buf, pos))
+                pos += END.size
+            else:
+                raise ValueError(f"unknown message kind {kind}")
+        del buf[:pos]
+        return messages
+
+
+class Session(asyncio.Protocol):
+    """One connected player: an engine, its input queue and a transport.
+
+    Spectators of the game are served from ``broadcaster``, created when
+    the first one arrives. A spectator's own session only has ``watching``.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.hello = bytearray()
+        self.game = None
+        self.id = None
+        self.difficulty = None
+        self.player = None
+        self.inputs = InputQueue()
+        self.scheduler = None
+        self.encoder = None
+        self.broadcaster = None
+        self.watching = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connections += 1
+
+    def data_received(self, data):
+        if self.watching is not None:
+            return
+        if self.game is None:
+            self.hello += data
+            line, newline, rest = self.hello.partition(b'\n')
+            if not newline:
+                if len(self.hello) > MAX_HELLO:
+                    self.transport.close()
+                return
+            try:
+                words = line.decode('ascii').split()
+                if words and words[0].upper() == 'WATCH':
+                    self.server.watch(self, words[1:])
+                    return
+                self.server.start(self, words)
+            except (ValueError, UnicodeDecodeError):
+                self.transport.close()
+                return
+            data = rest
+        for byte in data:
+            direction = COMMANDS.get(byte)
+            if direction is not None:
+                self.inputs.push(direction, self.game.direction)
+            elif byte == ord('q'):
+                self.finish()
+                return
+
+    def tick(self):
+        """Step the game once and send the result; False once it is over."""
+        game = self.game
+        alive = game.step(self.inputs.pop(game.direction))
+        if not alive:
+            self.finish()
+            return False
+        if self.broadcaster is not None:
+            self.broadcaster.publish(self.encoder.frame())
+        transport = self.transport
+        if transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.server.dropped += 1
+            transport.abort()
+            return False
+        transport.write(TICK.pack(
+            MSG_TICK, game.ticks, game.body[0],
+            -1 if game.removed is None else game.removed,
+            -1 if game.food is None else game.food,
+            game.score))
+        return True
+
+    def finish(self):
+        """Send the final message and close the connection."""
+        game = self.game
+        if not self.transport.is_closing():
+            self.transport.write(END.pack(MSG_END, game.ticks, game.score,
+                                          DEATH_CODES[game.death]))
+            self.transport.close()
+        if self.broadcaster is not None:
+            self.broadcaster.publish(self.encoder.end())
+            self.broadcaster.close()
+            self.broadcaster = None
+        if self.scheduler is not None:
+            self.scheduler.remove(self)
+            self.scheduler = None
+            self.server.game_over(self)
+        self.server.players.pop(self.id, None)
+
+    def spectate(self, transport):
+        """Add a spectator transport to this game's feed."""
+        if self.broadcaster is None:
+            self.encoder = SpectatorEncoder(self.game)
+            self.broadcaster = Broadcaster(max_buffer=MAX_WRITE_BUFFER)
+            self.broadcaster.publish(self.encoder.keyframe())
+        self.broadcaster.subscribe(transport)
+
+    def connection_lost(self, exc):
+        self.server.connections -= 1
+        if self.watching is not None:
+            if self.watching.broadcaster is not None:
+                self.watching.broadcaster.unsubscribe(self.transport)
+            self.watching = None
+        if self.game is not None and self.scheduler is not None:
+            self.finish()
+
+
+class TickScheduler:
+    """Steps every session of one speed from a single event-loop timer.
+
+    The timer runs only while there are sessions. Ticks follow a
+    ``FixedTimestep`` on the loop's clock, so the schedule does not drift
+    with the time spent stepping. ``cpu`` is the process CPU time spent in
+    ticks, which stays meaningful when clients share the machine.
+    """
+
+    def __init__(self, loop, step_ms):
+        self.loop = loop
+        self.timestep = FixedTimestep(step_ms, clock=loop.time)
+        self.sessions = {}
+        self.handle = None
+        self.ticks = 0
+        self.session_ticks = 0
+        self.cpu = 0.0
+
+    def add(self, session):
+        self.sessions[session] = None
+        session.scheduler = self
+        if self.handle is None:
+            self.timestep.reset()
+            self.handle = self.loop.call_at(self.loop.time() + self.timestep.step, self.run)
+
+    def remove(self, session):
+        self.sessions.pop(session, None)
+
+    def run(self):
+        started = time.process_time()
+        for _ in range(self.timestep.due()):
+            self.ticks += 1
+            for session in list(self.sessions):
+                session.tick()
+            self.session_ticks += len(self.sessions)
+        self.cpu += time.process_time() - started
+        if self.sessions:
+            self.handle = self.loop.call_later(self.timestep.timeout(), self.run)
+        else:
+            self.handle = None
+
+
+class GameServer:
+    """Accepts connections and hands each session to its speed's scheduler.
+
+    ``levels`` maps difficulty names to ``{'speed': ms, 'food_value': n}``
+    like ``DIFFICULTY_LEVELS``. With a ``HighScores`` store as ``scores``,
+    games that end during the same loop iteration are recorded together
+    in one transaction.
+    """
+
+    def __init__(self, height=BOARD_HEIGHT, width=BOARD_WIDTH, levels=DIFFICULTY_LEVELS,
+                 default=DEFAULT_DIFFICULTY, scores=None):
+        self.height = height
+        self.width = width
+        self.levels = levels
+        self.default = default
+        self.schedulers = {}
+        self.connections = 0
+        self.games = 0
+        self.dropped = 0
+        self.players = {}
+        self.scores = scores
+        self.finished = []
+        self.servers = []
+
+    def start(self, session, words):
+        """Begin a session's game from its hello line."""
+        difficulty = words[0].upper() if words else self.default
+        if difficulty not in self.levels:
+            raise ValueError(f"unknown difficulty {difficulty}")
+        seed = int(words[1]) if len(words) > 1 else random_seed()
+        if not 0 <= seed < SEED_LIMIT:
+            raise ValueError(f"seed out of range: {seed}")
+        session.player = words[2] if len(words) > 2 else "guest"
+        session.difficulty = difficulty
+        level = self.levels[difficulty]
+        session.game = SnakeEngine(self.height, self.width, food_value=level['food_value'],
+                                   seed=seed)
+        self.games += 1
+        session.id = self.games
+        self.players[session.id] = session
+        session.transport.write(encode_start(session.game, session.id))
+        speed = level['speed']
+        scheduler = self.schedulers.get(speed)
+        if scheduler is None:
+            scheduler = self.schedulers[speed] = TickScheduler(asyncio.get_running_loop(), speed)
+        scheduler.add(session)
+
+    def game_over(self, session):
+        """Queue a finished game for the high-score store."""
+        if self.scores is None:
+            return
+        if not self.finished:
+            asyncio.get_running_loop().call_soon(self.save_scores)
+        self.finished.append(game_record(session.game, session.player, session.difficulty,
+                                         session.game.rng.seed))
+
+    def save_scores(self):
+        records, self.finished = self.finished, []
+        try:
+            self.scores.record_many(records)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not save {len(records)} scores: {e}")
+
+    def watch(self, session, words):
+        """Attach a spectator session to a running game."""
+        player = self.players.get(int(words[0])) if words else None
+        if player is None:
+            raise ValueError("no such game")
+        session.watching = player
+        player.spectate(session.transport)
+
+    async def listen_tcp(self, host='127.0.0.1', port=DEFAULT_PORT):
+        server = await asyncio.get_running_loop().create_server(
+            lambda: Session(self), host, port, backlog=4096)
+        for sock in server.sockets:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.servers.append(server)
+        return server
+
+    async def listen_unix(self, path):
+        server = await asyncio.get_running_loop().create_unix_server(
+            lambda: Session(self), path, backlog=4096)
+        self.servers.append(server)
+        return server
+
+    def close(self):
+        for server in self.servers:
+            server.close()
+
+    def stats(self):
+        sessions = sum(len(s.sessions) for s in self.schedulers.values())
+        parts = [f"{sessions} sessions, {self.games} games, {self.dropped} dropped"]
+        for speed, s in sorted(self.schedulers.items()):
+            per_tick = s.cpu / s.session_ticks * 1e6 if s.session_ticks else 0.0
+            parts.append(f"{speed} ms: {s.ticks} ticks, {s.session_ticks} session ticks, "
+                         f"{per_tick:.1f} us CPU per session tick")
+            parts.append(str(s.timestep.jitter))
+        return "\n  ".join(parts)
+
+
+class LoadClient(asyncio.Protocol):
+    """Loopback client that steers in a small square to stay alive."""
+
+    def __init__(self, load, side):
+        self.load = load
+        self.side = side
+        self.reader = MessageReader()
+        self.transport = None
+        self.turn = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.write(self.load.hello)
+
+    def data_received(self, data):
+        load = self.load
+        for message in self.reader.feed(data):
+            if message[0] == MSG_TICK:
+                load.ticks += 1
+                if message[1] % self.side == 0:
+                    self.transport.write(b'rdlu'[self.turn % 4:self.turn % 4 + 1])
+                    self.turn += 1
+            elif message[0] == MSG_END:
+                load.ended += 1
+
+    def connection_lost(self, exc):
+        self.load.closed(self)
+
+
+class LoadGenerator:
+    """Keeps ``sessions`` loopback games running and counts their ticks."""
+
+    def __init__(self, sessions, difficulty, connect):
+        self.sessions = sessions
+        self.hello = f"{difficulty}\n".encode('ascii')
+        self.connect = connect
+        self.clients = set()
+        self.ticks = 0
+        self.ended = 0
+        self.running = True
+
+    async def open(self, i):
+        _, client = await self.connect(lambda: LoadClient(self, 3 + i % 5))
+        self.clients.add(client)
+
+    def closed(self, client):
+        self.clients.discard(client)
+        if self.running:
+            # Replace finished games so the load stays constant
+            asyncio.ensure_future(self.open(len(self.clients)))
+
+    async def run(self, seconds):
+        for start in range(0, self.sessions, 200):
+            await asyncio.gather(*(self.open(i) for i in range(start, min(start + 200, self.sessions))))
+        self.ticks = 0
+        began = time.perf_counter()
+        await asyncio.sleep(seconds)
+        elapsed = time.perf_counter() - began
+        self.running = False
+        for client in list(self.clients):
+            client.transport.close()
+        return self.ticks / elapsed
+
+
+async def serve(args):
+    server = GameServer(scores=HighScores(args.scores) if args.scores else None)
+    if args.unix:
+        await server.listen_unix(args.unix)
+        print(f"Serving on {args.unix}")
+    else:
+        await server.listen_tcp(args.host, args.port)
+        print(f"Serving on {args.host}:{args.port}")
+    try:
+        while True:
+            await asyncio.sleep(args.stats)
+            print(server.stats())
+    finally:
+        server.close()
+
+
+async def load(args):
+    loop = asyncio.get_running_loop()
+    if args.unix:
+        connect = lambda factory: loop.create_unix_connection(factory, args.unix)
+    else:
+        connect = lambda factory: loop.create_connection(factory, args.host, args.port)
+    generator = LoadGenerator(args.sessions, args.difficulty, connect)
+    rate = await generator.run(args.seconds)
+    expected = args.sessions * 1000.0 / DIFFICULTY_LEVELS[args.difficulty]['speed']
+    print(f"{args.sessions} sessions at {args.difficulty}: {rate:,.0f} ticks/sec received "
+          f"({rate / expected:.1%} of {expected:,.0f} expected), {generator.ended} games ended")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snake Game server and load generator")
+    parser.add_argument("mode", choices=("serve", "load"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="use a Unix socket instead of TCP")
+    parser.add_argument("--scores", metavar="FILE", help="serve: record games in this "
+                        "high-score database")
+    parser.add_argument("--stats", type=float, default=10.0, help="seconds between server stats")
+    parser.add_argument("--sessions", type=int, default=1000, help="load: concurrent games")
+    parser.add_argument("--seconds", type=float, default=10.0, help="load: measurement time")
+    parser.add_argument("--difficulty", choices=DIFFICULTY_LEVELS, default=DEFAULT_DIFFICULTY)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args) if args.mode == "serve" else load(args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -50,10 +50,13 @@ setup(
     ],
     keywords="snake, game, terminal, curses, arcade, python",
     packages=find_packages(),
-    py_modules=["snake_game"],
+    py_modules=["snake_game", "config", "engine", "rng", "scheduler", "input_queue", "render", "replay", "batch_sim", "tournament", "metrics", "world", "arena", "server", "spectate", "highscores", "autopilot", "env", "analytics", "verify"],
     python_requires=">=3.6",
     install_requires=read_requirements(),
     extras_require={
+        "batch": [
+            "numpy>=1.20",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -65,6 +68,12 @@ setup(
     entry_points={
         "console_scripts": [
             "snake-game=snake_game:main",
+            "snake-tournament=tournament:main",
+            "snake-arena=arena:main",
+            "snake-server=server:main",
+            "snake-scores=highscores:main",
+            "snake-analytics=analytics:main",
+            "snake-verify=verify:main",
         ],
     },
     include_package_data=True,
@@ -1,10 +1,201 @@
-import random
+import argparse
 import curses
+import os
+import selectors
+import signal
+import sqlite3
 import sys
+import time
 
-def main():
+from autopilot import Autopilot
+from config import (
+    DEBUG_INFO, DEBUG_MODE, DEFAULT_DIFFICULTY, DIFFICULTY_LEVELS, GAME_DESCRIPTION,
+    GAME_STATES, MIN_TERMINAL_HEIGHT, MIN_TERMINAL_WIDTH, TURBO_REFRESH_HZ,
+)
+from engine import UP, DOWN, LEFT, RIGHT
+from highscores import HighScores, default_player, game_record
+from input_queue import InputQueue
+from metrics import InstrumentedEngine, PhaseMetrics
+from render import AnsiRenderer, Camera, CursesRenderer
+from replay import Replay, ReplayError
+from rng import SEED_LIMIT, random_seed
+from scheduler import FixedTimestep, TurboPacer
+from world import WorldEngine
+
+# Arrow keys mapped to engine directions
+KEY_DIRECTIONS = {
+    curses.KEY_UP: UP,
+    curses.KEY_DOWN: DOWN,
+    curses.KEY_LEFT: LEFT,
+    curses.KEY_RIGHT: RIGHT,
+}
+
+def parse_world(text):
+    """Parse a world size such as ``10000x10000`` (width x height)."""
+    try:
+        width, height = (int(n) for n in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{text}'") from None
+    # Smaller worlds would start the snake's tail on the left wall
+    if width < MIN_TERMINAL_WIDTH or height < MIN_TERMINAL_HEIGHT:
+        raise argparse.ArgumentTypeError(
+            f"the world must be at least {MIN_TERMINAL_WIDTH}x{MIN_TERMINAL_HEIGHT}")
+    return height, width
+
+def positive(kind):
+    """argparse type for a number greater than zero."""
+    def parse(text):
+        try:
+            value = kind(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected a number, got '{text}'") from None
+        if value <= 0:
+            raise argparse.ArgumentTypeError("must be greater than zero")
+        return value
+    return parse
+
+def parse_seed(text):
+    """argparse type for a seed that fits the high-score table."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got '{text}'") from None
+    if not 0 <= seed < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {SEED_LIMIT - 1}")
+    return seed
+
+def writable_file(text):
+    """argparse type for an output file in an existing, writable folder."""
+    folder = os.path.dirname(os.path.abspath(text))
+    if not os.path.isdir(folder) or not os.access(folder, os.W_OK):
+        raise argparse.ArgumentTypeError(f"cannot write to '{text}'")
+    return text
+
+def parse_args(argv):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=GAME_DESCRIPTION)
+    parser.add_argument("--difficulty", choices=DIFFICULTY_LEVELS, default=DEFAULT_DIFFICULTY,
+                        help=f"game speed (default {DEFAULT_DIFFICULTY})")
+    parser.add_argument("--backend", choices=("curses", "ansi"), default="curses",
+                        help="terminal output backend (default curses)")
+    parser.add_argument("--seed", type=parse_seed, help="seed for food placement (default random)")
+    parser.add_argument("--record", metavar="FILE", help="save a replay of the game")
+    parser.add_argument("--replay", metavar="FILE", help="watch a recorded game")
+    parser.add_argument("--metrics", metavar="FILE", type=writable_file,
+                        help="export per-phase timings (.jsonl or Prometheus text)")
+    parser.add_argument("--player", default=default_player(),
+                        help="name for the high-score table (default: login name)")
+    parser.add_argument("--world", metavar="WxH", type=parse_world,
+                        help="play on a world larger than the screen, e.g. 10000x10000")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="let the computer play (demo and soak runs)")
+    parser.add_argument("--turbo", action="store_true",
+                        help="run the game logic as fast as possible (bot and soak runs)")
+    parser.add_argument("--render-every", metavar="N", type=positive(int),
+                        help="with --turbo, draw every N ticks")
+    parser.add_argument("--refresh", metavar="HZ", type=positive(float),
+                        help=f"with --turbo, draw HZ times a second (default {TURBO_REFRESH_HZ})")
+    args = parser.parse_args(argv)
+    if (args.render_every or args.refresh) and not args.turbo:
+        parser.error("--render-every and --refresh need --turbo")
+    if args.render_every and args.refresh:
+        parser.error("--render-every cannot be combined with --refresh")
+    if args.world and (args.record or args.replay):
+        parser.error("--world cannot be combined with --record or --replay")
+    if args.world and args.metrics:
+        parser.error("--metrics cannot be combined with --world")
+    if args.autopilot and (args.world or args.replay):
+        parser.error("--autopilot cannot be combined with --world or --replay")
+    return args
+
+def wait_for_input(w, timestep):
+    """Block until a key arrives or the next tick is due; return the key or -1."""
+    remaining = timestep.timeout()
+    if remaining >= 0.001:
+        # getch only takes whole milliseconds, so wake slightly early and
+        # finish the wait on the next call
+        w.timeout(int(remaining * 1000))
+    else:
+        if remaining > 0:
+            time.sleep(remaining)
+        w.timeout(0)
+    return w.getch()
+
+class Wakeup:
+    """Blocks until a key is typed or the terminal is resized.
+
+    Used while the game is paused instead of getch timeouts, so a parked
+    game makes no system calls at all. A resize is caught as SIGWINCH,
+    which Python turns into a byte on a pipe (``signal.set_wakeup_fd``)
+    that the same ``select()`` watches.
+    """
+
+    def __init__(self, fd=None):
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(sys.stdin.fileno() if fd is None else fd, selectors.EVENT_READ)
+        self.pipe, self.notify = os.pipe()
+        os.set_blocking(self.pipe, False)
+        os.set_blocking(self.notify, False)
+        self.selector.register(self.pipe, selectors.EVENT_READ)
+        self.previous_fd = signal.set_wakeup_fd(self.notify)
+        self.previous_handler = signal.signal(signal.SIGWINCH, self.on_resize)
+        self.resized = False
+
+    def on_resize(self, signum, frame):
+        self.resized = True
+
+    def wait(self):
+        """Block with no timeout; return True if the terminal was resized."""
+        for key, _ in self.selector.select():
+            if key.fd == self.pipe:
+                while True:
+                    try:
+                        if not os.read(self.pipe, 64):
+                            break
+                    except BlockingIOError:
+                        break
+        resized, self.resized = self.resized, False
+        return resized
+
+    def close(self):
+        signal.set_wakeup_fd(self.previous_fd)
+        # A handler installed from C (curses' own) cannot be put back
+        signal.signal(signal.SIGWINCH, self.previous_handler or signal.SIG_DFL)
+        self.selector.close()
+        os.close(self.pipe)
+        os.close(self.notify)
+
+def record_score(game, player, difficulty, seed):
+    """Add a finished game to the high-score table and report its standing."""
+    try:
+        with HighScores() as scores:
+            previous = scores.best(player)
+            top = scores.qualifies(game.score)
+            scores.record(game_record(game, player, difficulty, seed))
+    except (sqlite3.Error, OSError) as e:
+        print(f"Could not save the score: {e}")
+        return
+    if game.score and top:
+        print("New high score!")
+    if previous is not None and game.score > previous['score']:
+        print(f"New personal best (was {previous['score']})")
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    difficulty = args.difficulty
+    watching = None
+    if args.replay:
+        try:
+            watching = Replay.load(args.replay)
+        except (OSError, ReplayError) as e:
+            print(f"Could not load replay {args.replay}: {e}")
+            sys.exit(1)
+        difficulty = watching.difficulty
+    level = DIFFICULTY_LEVELS[difficulty]
+    
     # Initialize curses
     stdscr = curses.initscr()
+    curses.noecho()
     curses.curs_set(0)
     stdscr.nodelay(1)
     stdscr.timeout(100)
@@ -18,101 +209,204 @@ def main():
         print("Terminal window too small. Please resize to at least 20x10.")
         sys.exit(1)
     
+    # A replay is shown on the board size it was recorded with
+    if watching:
+        if sh < watching.height or sw < watching.width:
+            curses.endwin()
+            print(f"Terminal window too small for this replay. Please resize to at least "
+                  f"{watching.width}x{watching.height}.")
+            sys.exit(1)
+        sh, sw = watching.height, watching.width
+        replay = watching
+        turns = dict(watching.events)
+    else:
+        seed = args.seed if args.seed is not None else random_seed()
+        replay = Replay(seed, sh, sw, difficulty)
+    
     # Create game window
     w = curses.newwin(sh, sw, 0, 0)
     w.keypad(1)
-    w.timeout(100)
     
-    # Initialize snake in the center
-    snk_x = sw // 4
-    snk_y = sh // 2
-    snake = [
-        [snk_y, snk_x],
-        [snk_y, snk_x-1],
-        [snk_y, snk_x-2]
-    ]
+    # Per-phase timings, only when asked for; None keeps the loop lean.
+    # The world engine has no timed phases, so worlds are never measured
+    metrics_file = args.metrics or (DEBUG_INFO['metrics_file'] if DEBUG_MODE else None)
+    if args.world:
+        metrics_file = None
+    if metrics_file:
+        metrics = PhaseMetrics()
+        clock = metrics.clock
+        phases = metrics.phases
+        next_export = clock() + DEBUG_INFO['metrics_interval']
+    else:
+        metrics = None
     
-    # Initialize food
-    food = [sh//2, sw//2]
-    w.addch(int(food[0]), int(food[1]), '*')
+    # Initialize the game state
+    if args.world:
+        world_height, world_width = args.world
+        try:
+            game = WorldEngine(world_height, world_width, food_value=level['food_value'],
+                               seed=replay.seed)
+        except ValueError as e:
+            curses.endwin()
+            print(f"Error: {e}")
+            sys.exit(1)
+    elif metrics:
+        game = replay.new_game(InstrumentedEngine, metrics=metrics)
+    else:
+        game = replay.new_game()
+    pilot = Autopilot(game) if args.autopilot else None
+    # Clocks are looked up here so tests can run the loop on virtual time
+    if args.turbo:
+        timestep = TurboPacer(args.render_every, args.refresh or TURBO_REFRESH_HZ, time.monotonic)
+    else:
+        timestep = FixedTimestep(level['speed'], time.monotonic)
+    inputs = InputQueue(clock=time.monotonic)
+    if args.backend == "ansi":
+        # curses still handles the keyboard; clear the screen through it
+        # once, then leave all output to raw escape sequences
+        w.refresh()
+        renderer = AnsiRenderer(sys.stdout.fileno(), sh, sw, show_fps=DEBUG_INFO['show_fps'])
+    else:
+        renderer = CursesRenderer(w, show_fps=DEBUG_INFO['show_fps'], clock=time.perf_counter)
+    # A world larger than the screen is shown below the title lines
+    # through a camera that follows the head; it stops one column short
+    # of the edge, since curses cannot write the lower-right cell
+    view = Camera(renderer, 2, sh - 2, sw - 1) if args.world else renderer
+    view.draw_board(game)
     
-    # Initialize direction
-    key = curses.KEY_RIGHT
-    score = 0
-    
-    # Game title and instructions
-    w.addstr(0, 2, "SNAKE GAME - Score: 0")
-    w.addstr(1, 2, "Use arrow keys to move, 'q' to quit")
+    # Game title and instructions; both lines are the same length, so
+    # either one fully covers the other
+    if pilot:
+        instructions = "Autopilot playing, 'p' to pause, 'q' to quit"
+    else:
+        instructions = "Use arrow keys to move, 'p' to pause, 'q' to quit"
+    paused_message = "Paused, 'p' to resume, 'q' to quit".ljust(len(instructions))
+    renderer.text(0, 2, "SNAKE GAME - Score: 0")
+    renderer.text(1, 2, instructions)
+    renderer.flush()
     
+    state = GAME_STATES['RUNNING']
+    wakeup = None
     try:
-        while True:
-            # Get user input
-            next_key = w.getch()
-            
-            # Handle quit
-            if next_key == ord('q') or next_key == ord('Q'):
-                break
-                
-            # Prevent reverse direction
-            if next_key == curses.KEY_DOWN and key != curses.KEY_UP:
-                key = next_key
-            elif next_key == curses.KEY_UP and key != curses.KEY_DOWN:
-                key = next_key
-            elif next_key == curses.KEY_LEFT and key != curses.KEY_RIGHT:
-                key = next_key
-            elif next_key == curses.KEY_RIGHT and key != curses.KEY_LEFT:
-                key = next_key
-            
-            # Check for collision with walls or self
-            if (snake[0][0] in [0, sh-1] or 
-                snake[0][1] in [0, sw-1] or 
-                snake[0] in snake[1:]):
-                break
-            
-            # Calculate new head position
-            new_head = [snake[0][0], snake[0][1]]
-            
-            if key == curses.KEY_DOWN:
-                new_head[0] += 1
-            elif key == curses.KEY_UP:
-                new_head[0] -= 1
-            elif key == curses.KEY_LEFT:
-                new_head[1] -= 1
-            elif key == curses.KEY_RIGHT:
-                new_head[1] += 1
+        playing = True
+        while playing:
+            if state == GAME_STATES['PAUSED']:
+                # Nothing moves while paused: sleep until a key or a
+                # resize instead of waking up for ticks
+                if wakeup is None:
+                    wakeup = Wakeup()
+                if wakeup.wait():
+                    renderer.repaint()
+                w.timeout(0)
+                next_key = w.getch()
+            else:
+                # Wait for a key press or the next tick, whichever comes first
+                next_key = wait_for_input(w, timestep)
+            if metrics:
+                t0 = clock()
             
-            # Add new head
-            snake.insert(0, new_head)
+            # Drain every pending key without blocking
+            while next_key != -1:
+                if next_key == ord('q') or next_key == ord('Q'):
+                    playing = False
+                    break
+                if next_key == ord('p') or next_key == ord('P'):
+                    if state == GAME_STATES['PAUSED']:
+                        state = GAME_STATES['RUNNING']
+                        renderer.text(1, 2, instructions)
+                        # Carry on from now, without catching up on the pause
+                        timestep.reset()
+                    else:
+                        state = GAME_STATES['PAUSED']
+                        renderer.text(1, 2, paused_message)
+                        inputs.clear()
+                elif next_key in KEY_DIRECTIONS and not pilot and state == GAME_STATES['RUNNING']:
+                    inputs.push(KEY_DIRECTIONS[next_key], game.direction)
+                w.timeout(0)
+                next_key = w.getch()
+            if metrics:
+                phases['input'].observe(clock() - t0)
             
-            # Check if food is eaten
-            if snake[0] == food:
-                score += 1
-                w.addstr(0, 2, f"SNAKE GAME - Score: {score}")
+            # Run the game logic at a fixed rate, or a batch at a time in
+            # turbo mode
+            ticks = timestep.due() if playing and state == GAME_STATES['RUNNING'] else 0
+            for _ in range(ticks):
+                if watching:
+                    if game.ticks >= replay.end_tick:
+                        playing = False
+                        break
+                    direction = turns.get(game.ticks)
+                else:
+                    if metrics:
+                        t0 = clock()
+                    direction = pilot(game) if pilot else inputs.pop(game.direction)
+                    if direction is not None:
+                        replay.record(game.ticks, direction)
+                    if metrics:
+                        phases['direction'].observe(clock() - t0)
                 
-                # Generate new food position
-                food = None
-                while food is None:
-                    nf = [
-                        random.randint(2, sh-3),
-                        random.randint(2, sw-3)
-                    ]
-                    food = nf if nf not in snake else None
-                w.addch(food[0], food[1], '*')
-            else:
-                # Remove tail
-                tail = snake.pop()
-                w.addch(int(tail[0]), int(tail[1]), ' ')
+                # Move the snake; the engine ignores reverse turns and
+                # reports collisions with walls or itself
+                if not game.step(direction):
+                    playing = False
+                    break
+                view.draw_tick(game)
+                if game.ate:
+                    renderer.text(0, 2, f"SNAKE GAME - Score: {game.score}")
             
-            # Draw snake head
-            w.addch(int(snake[0][0]), int(snake[0][1]), '#')
+            # Render once per frame, after all due ticks; turbo mode only
+            # draws some batches, but always the last one
+            if renderer.dirty and (not args.turbo or not playing or ticks == 0
+                                   or timestep.frame_due(game.ticks)):
+                if args.turbo:
+                    # Padded to the line, so a shorter rate leaves no digits behind
+                    status = f"SNAKE GAME - Score: {game.score}  {timestep.rate:,.0f} ticks/s"
+                    renderer.text(0, 2, status[:sw - 3].ljust(sw - 3))
+                if metrics:
+                    t0 = clock()
+                renderer.flush()
+                if metrics:
+                    phases['render'].observe(clock() - t0)
+                inputs.rendered()
+            
+            if metrics and clock() >= next_export:
+                # A failed write is reported by the export at game over
+                try:
+                    metrics.export(metrics_file)
+                except OSError:
+                    pass
+                next_export += DEBUG_INFO['metrics_interval']
             
     except KeyboardInterrupt:
         pass
     finally:
         # Clean up
+        if wakeup:
+            wakeup.close()
         curses.endwin()
-        print(f"Game Over! Final Score: {score}")
+        print(f"Game Over! Final Score: {game.score}")
+        if not watching:
+            record_score(game, args.player, difficulty, replay.seed)
         print("Thanks for playing!")
+        if args.record and not watching:
+            replay.end_tick = game.ticks
+            try:
+                replay.save(args.record)
+            except OSError as e:
+                print(f"Could not save the replay: {e}")
+            else:
+                print(f"Replay saved to {args.record}")
+        if DEBUG_MODE:
+            print(timestep.jitter)
+            print(inputs.latency)
+        if metrics:
+            print(metrics.summary())
+            try:
+                metrics.export(metrics_file)
+            except OSError as e:
+                print(f"Could not write the metrics: {e}")
+            else:
+                print(f"Metrics written to {metrics_file}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Spectator stream for Snake Game
+Encodes a live game as a compact binary feed: one small delta per tick and
+a keyframe every ``KEYFRAME_INTERVAL`` ticks so late joiners can sync.
+Integers are unsigned varints (see replay.py); cells are ``y * width + x``
+and a stored cell ``c`` means ``c - 1`` so that 0 can mean none.
+
+    KEYFRAME  kind=1 tick height width score food+1 length head
+              then (length - 1) 2-bit directions from each segment to the
+              next towards the tail, four per byte
+    DELTA     kind=2 flags [food+1 if FOOD_MOVED] [score if SCORE_CHANGED]
+              flags: bits 0-1 direction the head moved, GREW (the tail
+              stayed), FOOD_MOVED, SCORE_CHANGED
+    END       kind=3 tick death (0 quit, 1 wall, 2 self)
+
+A typical tick costs two bytes. A ``Broadcaster`` hands the same bytes
+object to every subscriber.
+"""
+
+from collections import deque
+
+from engine import DEATH_WALL, DEATH_SELF, EMPTY, BODY, HEAD, FOOD
+from replay import ReplayError, read_varint, write_varint
+
+KEYFRAME = 1
+DELTA = 2
+END = 3
+
+GREW = 1 << 2
+FOOD_MOVED = 1 << 3
+SCORE_CHANGED = 1 << 4
+
+KEYFRAME_INTERVAL = 100
+
+DEATH_CODES = {None: 0, DEATH_WALL: 1, DEATH_SELF: 2}
+DEATHS = {code: death for death, code in DEATH_CODES.items()}
+
+
+def direction_offsets(width):
+    """Cell offsets of the engine directions (UP, DOWN, LEFT, RIGHT)."""
+    return (-width, width, -1, 1)
+
+
+class SpectatorEncoder:
+    """Turns the ticks of one engine into spectator frames.
+
+    Call ``frame()`` after every ``step()``; it returns a delta, or a
+    keyframe when one is due, or the END frame once the game is over.
+    """
+
+    def __init__(self, game, keyframe_interval=KEYFRAME_INTERVAL):
+        self.game = game
+        self.keyframe_interval = keyframe_interval
+        self.food = game.food
+        self.score = game.score
+        self.since_keyframe = 0
+
+    def keyframe(self):
+        game = self.game
+        body = game.body
+        buf = bytearray((KEYFRAME,))
+        for value in (game.ticks, game.height, game.width, game.score,
+                      0 if game.food is None else game.food + 1, len(body), body[0]):
+            write_varint(buf, value)
+        codes = {offset: code for code, offset in enumerate(direction_offsets(game.width))}
+        packed = 0
+        shift = 0
+        prev = None
+        for cell in body:
+            if prev is not None:
+                packed |= codes[cell - prev] << shift
+                shift += 2
+                if shift == 8:
+                    buf.append(packed)
+                    packed = shift = 0
+            prev = cell
+        if shift:
+            buf.append(packed)
+        self.food = game.food
+        self.score = game.score
+        self.since_keyframe = 0
+        return bytes(buf)
+
+    def end(self):
+        game = self.game
+        buf = bytearray((END,))
+        write_varint(buf, game.ticks)
+        buf.append(DEATH_CODES[game.death])
+        return bytes(buf)
+
+    def frame(self):
+        game = self.game
+        if not game.alive:
+            return self.end()
+        self.since_keyframe += 1
+        if self.since_keyframe >= self.keyframe_interval:
+            return self.keyframe()
+        flags = game.direction
+        if game.removed is None:
+            flags |= GREW
+        if game.food != self.food:
+            flags |= FOOD_MOVED
+        if game.score != self.score:
+            flags |= SCORE_CHANGED
+        buf = bytearray((DELTA, flags))
+        if flags & FOOD_MOVED:
+            self.food = game.food
+            write_varint(buf, 0 if game.food is None else game.food + 1)
+        if flags & SCORE_CHANGED:
+            self.score = game.score
+            write_varint(buf, game.score)
+        return bytes(buf)
+
+
+class SpectatorDecoder:
+    """Rebuilds a game's board from a spectator feed.
+
+    Deltas before the first keyframe are skipped. ``changes`` collects
+    ``(cell, content)`` pairs since it was last cleared, for a renderer.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.synced = False
+        self.height = self.width = 0
+        self.tick = 0
+        self.score = 0
+        self.food = None
+        self.body = deque()
+        self.over = False
+        self.death = None
+        self.changes = []
+
+    def feed(self, data):
+        """Add received bytes; returns the number of frames applied."""
+        buf = self.buffer
+        buf += data
+        pos = 0
+        frames = 0
+        try:
+            while pos < len(buf):
+                pos = self.apply(buf, pos)
+                frames += 1
+        except ReplayError:
+            pass
+        del buf[:pos]
+        return frames
+
+    def apply(self, buf, pos):
+        """Apply the frame at ``pos``; returns the position after it."""
+        kind = buf[pos]
+        if kind == KEYFRAME:
+            return self.apply_keyframe(buf, pos + 1)
+        if kind == DELTA:
+            if pos + 1 >= len(buf):
+                raise ReplayError("truncated frame")
+            flags = buf[pos + 1]
+            pos += 2
+            food = score = None
+            if flags & FOOD_MOVED:
+                food, pos = read_varint(buf, pos)
+            if flags & SCORE_CHANGED:
+                score, pos = read_varint(buf, pos)
+            if self.synced:
+                self.apply_delta(flags, food, score)
+            return pos
+        if kind == END:
+            tick, pos = read_varint(buf, pos + 1)
+            if pos >= len(buf):
+                raise ReplayError("truncated frame")
+            self.tick = tick
+            self.over = True
+            self.death = DEATHS.get(buf[pos])
+            return pos + 1
+        raise ValueError(f"unknown frame kind {kind}")
+
+    def apply_keyframe(self, buf, pos):
+        values = []
+        for _ in range(7):
+            value, pos = read_varint(buf, pos)
+            values.append(value)
+        tick, height, width, score, food, length, head = values
+        end = pos + (2 * (length - 1) + 7) // 8
+        if end > len(buf):
+            raise ReplayError("truncated frame")
+        offsets = direction_offsets(width)
+        body = [head]
+        cell = head
+        for i in range(length - 1):
+            cell += offsets[buf[pos + (i >> 2)] >> ((i & 3) * 2) & 3]
+            body.append(cell)
+
+        changes = self.changes
+        changes.extend((c, EMPTY) for c in self.body)
+        if self.food is not None:
+            changes.append((self.food, EMPTY))
+        self.tick, self.height, self.width, self.score = tick, height, width, score
+        self.food = food - 1 if food else None
+        self.body = deque(body)
+        changes.extend((c, BODY) for c in body[1:])
+        changes.append((head, HEAD))
+        if self.food is not None:
+            changes.append((self.food, FOOD))
+        self.synced = True
+        return end
+
+    def apply_delta(self, flags, food, score):
+        body = self.body
+        changes = self.changes
+        self.tick += 1
+        if not flags & GREW:
+            changes.append((body.pop(), EMPTY))
+        new_head = body[0] + direction_offsets(self.width)[flags & 3]
+        changes.append((body[0], BODY))
+        body.appendleft(new_head)
+        changes.append((new_head, HEAD))
+        if food is not None:
+            self.food = food - 1 if food else None
+            if self.food is not None:
+                changes.append((self.food, FOOD))
+        if score is not None:
+            self.score = score
+
+
+class Broadcaster:
+    """Fans one producer's frames out to many subscribers.
+
+    A subscriber is anything with ``write(bytes)`` and ``close()``, such as
+    an asyncio transport. Every subscriber is handed the same frame object.
+    The last keyframe and the deltas since are kept, so a new subscriber is
+    in sync right away. With ``max_buffer``, subscribers whose
+    ``get_write_buffer_size()`` grows past it are dropped.
+    """
+
+    def __init__(self, max_buffer=None):
+        self.subscribers = {}
+        self.backlog = []
+        self.max_buffer = max_buffer
+        self.frames = 0
+        self.bytes_out = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.subscribers)
+
+    def subscribe(self, sink):
+        for frame in self.backlog:
+            sink.write(frame)
+            self.bytes_out += len(frame)
+        self.subscribers[sink] = None
+
+    def unsubscribe(self, sink):
+        self.subscribers.pop(sink, None)
+
+    def publish(self, frame):
+        if frame[0] == KEYFRAME:
+            self.backlog = [frame]
+        elif self.backlog:
+            self.backlog.append(frame)
+        self.frames += 1
+        limit = self.max_buffer
+        for sink in list(self.subscribers):
+            if limit is not None and sink.get_write_buffer_size() > limit:
+                self.dropped += 1
+                self.unsubscribe(sink)
+                sink.close()
+                continue
+            sink.write(frame)
+        self.bytes_out += len(frame) * len(self.subscribers)
+
+    def close(self):
+        """Close every subscriber."""
+        for sink in list(self.subscribers):
+            sink.close()
+        self.subscribers.clear()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test suite for the replay analytics pipeline
+Builds small directories of replays and high-score records in temporary
+locations and checks the summaries against direct re-simulation.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics import (
+    Summary, analyze_replays, bounded_map, chunked, distribution, simulate,
+    summarize_scores,
+)
+from engine import DIRECTIONS
+from highscores import HighScores
+from replay import Replay, fast_forward
+from rng import GameRng
+
+
+def random_replay(seed):
+    """Play a seeded game with random turns and return its replay."""
+    replay = Replay(seed, 12, 20, 'NORMAL')
+    game = replay.new_game()
+    turns = GameRng(seed)
+    while game.ticks < 500:
+        direction = DIRECTIONS[turns.below(4)] if turns.below(3) == 0 else None
+        if direction is not None:
+            replay.record(game.ticks, direction)
+        if not game.step(direction):
+            break
+    replay.end_tick = game.ticks
+    return replay
+
+
+class TestAnalytics(unittest.TestCase):
+    """Test cases for the analytics stages."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.replays = [random_replay(seed) for seed in range(40)]
+        for i, replay in enumerate(self.replays):
+            folder = os.path.join(self.tmp.name, str(i % 3))
+            os.makedirs(folder, exist_ok=True)
+            replay.save(os.path.join(folder, f"{i}.rep"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def expected(self):
+        """The Summary of the test replays, simulated one by one."""
+        summary = Summary()
+        for replay in self.replays:
+            game = fast_forward(replay)
+            food_to_death = simulate(replay)[2]
+            summary.add(game.score, game.death, replay.difficulty, food_to_death)
+        return summary
+
+    def test_simulate_food_to_death(self):
+        """Test the outcome and ticks from last food to death of a replay."""
+        replay = Replay(1, 12, 20, 'NORMAL', end_tick=10000)
+        score, death, food_to_death = simulate(replay)
+        game = fast_forward(replay)
+        self.assertEqual((score, death), (game.score, game.death))
+        self.assertEqual(death, 'wall')
+        self.assertGreater(food_to_death, 0)
+        self.assertIsNone(simulate(Replay(1, 12, 20, 'NORMAL', end_tick=3))[2])
+
+    def test_matches_direct_simulation(self):
+        """Test that the pipeline matches direct simulation, pooled or not."""
+        expected = self.expected().to_dict()
+        self.assertEqual(analyze_replays([self.tmp.name], workers=1).to_dict(), expected)
+        merged = analyze_replays([self.tmp.name], workers=2, chunk_size=7)
+        self.assertEqual(merged.to_dict(), expected)
+        self.assertEqual(merged.games, 40)
+
+    def test_unreadable_files_are_counted(self):
+        """Test that unreadable files are counted as errors, not games."""
+        with open(os.path.join(self.tmp.name, "junk"), "wb") as fh:
+            fh.write(b"not a replay")
+        summary = analyze_replays([self.tmp.name], workers=1)
+        self.assertEqual((summary.games, summary.errors), (40, 1))
+
+    def test_scores(self):
+        """Test the summary of a high-score database, quits included."""
+        path = os.path.join(self.tmp.name, "scores.db")
+        with HighScores(path) as scores:
+            scores.record_many([
+                {'player': 'a', 'score': s, 'length': 3, 'ticks': 10, 'difficulty': 'HARD',
+                 'death': 'wall' if s % 2 else None}
+                for s in range(10)
+            ])
+            summary = summarize_scores(scores.games())
+        self.assertEqual(summary.games, 10)
+        self.assertEqual(summary.deaths, {'wall': 5, 'quit': 5})
+        self.assertEqual(distribution(summary.scores)['max'], 9)
+
+
+class TestStages(unittest.TestCase):
+    """Test cases for the generic streaming helpers."""
+
+    def test_chunked(self):
+        """Test that items are grouped into chunks with a short last one."""
+        self.assertEqual(list(chunked(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_bounded_map_limits_reads(self):
+        """Test that the input is only read a bounded amount ahead."""
+        read = []
+
+        def items():
+            for i in range(100):
+                read.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = bounded_map(pool, lambda x: x * 2, items(), 4)
+            self.assertEqual(next(results), 0)
+            self.assertLessEqual(len(read), 5)
+            self.assertEqual(list(results), [x * 2 for x in range(1, 100)])
+
+    def test_distribution(self):
+        """Test percentiles and mean of a score histogram, and an empty one."""
+        d = distribution({1: 50, 2: 40, 10: 10})
+        self.assertEqual((d['p50'], d['p90'], d['p99'], d['max']), (1, 2, 10, 10))
+        self.assertAlmostEqual(d['mean'], 2.3)
+        self.assertIsNone(distribution({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
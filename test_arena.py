@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test suite for the multi-snake arena
+Checks simultaneous moves, inter-snake collisions and food competition.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from arena import Arena, battle, cautious_policy, DEATH_HEAD, DEATH_BODY
+from engine import UP, DOWN, LEFT, RIGHT, EMPTY, BODY, HEAD, FOOD
+
+
+class TestArena(unittest.TestCase):
+    """Test cases for Arena."""
+
+    def setUp(self):
+        self.arena = Arena(20, 30, food=0, seed=1)
+        self.c = self.arena.cell
+
+    def horizontal(self, y, x, direction, length=3):
+        """Cells of a straight snake with its head at (y, x)."""
+        back = 1 if direction == LEFT else -1
+        return [self.c(y, x + i * back) for i in range(length)]
+
+    def test_placement(self):
+        """Test that snakes and food are placed and every body cell is owned."""
+        arena = Arena(50, 80, snakes=100, seed=3)
+        self.assertEqual(len(arena.living), 100)
+        self.assertEqual(len(arena.foods), 50)
+        heads = sum(1 for v in arena.grid if v == HEAD)
+        self.assertEqual(heads, 100)
+        for snake in arena.snakes:
+            for cell in snake.body:
+                self.assertEqual(arena.owner[cell], snake.id)
+
+    def test_head_to_head(self):
+        """Test that two heads entering the same cell both die and are cleared."""
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake(self.horizontal(5, 12, LEFT), LEFT)
+        self.assertEqual(self.arena.step(), 0)
+        self.assertEqual((a.death, b.death), (DEATH_HEAD, DEATH_HEAD))
+        self.assertEqual(sum(self.arena.grid[c] != EMPTY for c in range(self.c(5, 5), self.c(5, 20))), 0)
+
+    def test_contested_food(self):
+        """Test that food fought over head to head stays on the board."""
+        self.arena.place_food(self.c(5, 11))
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake(self.horizontal(5, 12, LEFT), LEFT)
+        self.arena.step()
+        self.assertEqual((a.death, b.death), (DEATH_HEAD, DEATH_HEAD))
+        self.assertEqual(self.arena.grid[self.c(5, 11)], FOOD)
+
+    def test_head_into_body(self):
+        """Test that running into another body kills only the runner."""
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake([self.c(4, 9), self.c(4, 10), self.c(4, 11)], LEFT)
+        self.arena.step({b.id: DOWN})
+        self.assertFalse(b.alive)
+        self.assertEqual(b.death, DEATH_BODY)
+        self.assertTrue(a.alive)
+        self.assertEqual(self.arena.grid[self.c(4, 10)], EMPTY)
+        self.assertEqual(self.arena.owner[self.c(4, 10)], -1)
+
+    def test_follow_tail(self):
+        """Test that a head may follow another snake's moving tail."""
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake(self.horizontal(5, 13, RIGHT), RIGHT)
+        self.assertEqual(self.arena.step(), 2)
+        self.assertEqual(a.head, self.c(5, 11))
+        self.assertEqual(b.head, self.c(5, 14))
+        self.assertEqual(self.arena.owner[a.head], a.id)
+
+    def test_tail_stays_when_eating(self):
+        """Test that an eating snake's tail stays put and blocks followers."""
+        self.arena.place_food(self.c(5, 14))
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake(self.horizontal(5, 13, RIGHT), RIGHT)
+        self.arena.step()
+        self.assertEqual(a.death, DEATH_BODY)
+        self.assertTrue(b.alive)
+        self.assertEqual((b.score, len(b)), (1, 4))
+        self.assertNotIn(self.c(5, 14), self.arena.foods)
+
+    def test_swap_heads(self):
+        """Test that two snakes swapping head cells both die."""
+        a = self.arena.add_snake(self.horizontal(5, 10, RIGHT), RIGHT)
+        b = self.arena.add_snake(self.horizontal(5, 11, LEFT), LEFT)
+        self.arena.step()
+        self.assertFalse(a.alive or b.alive)
+
+    def test_self_and_wall(self):
+        """Test wall and self deaths in the arena."""
+        a = self.arena.add_snake(self.horizontal(1, 10, RIGHT), RIGHT)
+        self.arena.step({a.id: UP})
+        self.assertEqual(a.death, 'wall')
+        cells = [self.c(8, 8), self.c(8, 9), self.c(9, 9), self.c(9, 8), self.c(9, 7)]
+        b = self.arena.add_snake(cells, LEFT)
+        self.arena.step({b.id: DOWN})
+        self.assertEqual(b.death, 'self')
+
+    def test_food_is_topped_up(self):
+        """Test that eaten food is replaced every tick."""
+        arena = Arena(30, 30, snakes=10, food=5, seed=2)
+        for _ in range(200):
+            arena.step([cautious_policy(arena, s) for s in arena.snakes])
+            self.assertEqual(len(arena.foods), 5)
+            self.assertEqual(sum(1 for v in arena.grid if v == FOOD), 5)
+
+    def test_battle_is_deterministic(self):
+        """Test that a seeded battle replays identically."""
+        def run():
+            rng = random.Random(4)
+            arena = Arena(60, 80, snakes=200, seed=9)
+            battle(arena, lambda a, s: cautious_policy(a, s, rng), 300)
+            return [(s.score, s.death, list(s.body)) for s in arena.snakes]
+        self.assertEqual(run(), run())
+
+    def test_grid_matches_bodies(self):
+        """Test that grid and owner map match the living bodies after a battle."""
+        arena = Arena(60, 80, snakes=300, seed=5)
+        rng = random.Random(1)
+        battle(arena, lambda a, s: cautious_policy(a, s, rng), 200)
+        cells = {}
+        for snake in arena.living:
+            for cell in snake.body:
+                cells[cell] = snake.id
+        for cell, value in enumerate(arena.grid):
+            if value in (BODY, HEAD):
+                self.assertEqual(cells.get(cell), arena.owner[cell])
+        self.assertEqual(len(cells), sum(1 for v in arena.grid if v in (BODY, HEAD)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test suite for the autopilot
+Plays headless games and checks the cycles it relies on.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from autopilot import Autopilot, autopilot_policy, board_cycle, hamiltonian_cycle
+from engine import SnakeEngine, WALL
+import tournament
+
+
+def play(game, pilot, max_ticks):
+    """Step the game with the pilot until it ends, the board fills or ``max_ticks``."""
+    while game.ticks < max_ticks and game.food is not None and game.step(pilot(game)):
+        pass
+
+
+class TestCycles(unittest.TestCase):
+    """Test cases for the Hamiltonian cycles."""
+
+    def check_cycle(self, height, width, cycle):
+        """Assert that a cycle visits every playable cell once, in adjacent steps."""
+        game = SnakeEngine(height, width)
+        playable = [c for c in range(height * width) if game.grid[c] != WALL]
+        self.assertEqual(sorted(cycle), playable)
+        for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertIn(b - a, (-width, width, -1, 1))
+
+    def test_board_cycles(self):
+        """Test cycles on even and odd boards, and none when both sides are odd."""
+        for height, width in [(10, 12), (11, 12), (24, 80), (25, 80)]:
+            self.check_cycle(height, width, board_cycle(height, width))
+        self.assertIsNone(board_cycle(11, 13))
+
+    def test_odd_rows_need_transpose(self):
+        """Test that the plain cycle refuses an odd number of interior rows."""
+        with self.assertRaises(ValueError):
+            hamiltonian_cycle(11, 12)
+
+
+class TestAutopilot(unittest.TestCase):
+    """Test cases for Autopilot."""
+
+    def test_fills_small_boards(self):
+        """Test that cycle mode eats until no food can spawn, never dying."""
+        for height, width in [(10, 12), (11, 12)]:
+            for seed in range(3):
+                game = SnakeEngine(height, width, seed=seed)
+                pilot = Autopilot(game)
+                self.assertIsNotNone(pilot.order)
+                play(game, pilot, 20000)
+                self.assertTrue(game.alive)
+                self.assertIsNone(game.food)
+
+    def test_small_budget_still_safe(self):
+        """Test that spreading the search over many ticks stays safe."""
+        game = SnakeEngine(10, 12, seed=4)
+        play(game, Autopilot(game, budget=2), 20000)
+        self.assertTrue(game.alive)
+        self.assertIsNone(game.food)
+
+    def test_search_respects_budget(self):
+        """Test that one call expands no more than the search budget."""
+        game = SnakeEngine(60, 200, seed=1)
+        pilot = Autopilot(game, budget=10)
+        pilot(game)
+        self.assertLessEqual(len(pilot.dist), 1 + 10 * 4)
+
+    def test_survives_terminal_board(self):
+        """Test that the pilot survives long on a terminal-sized board."""
+        game = SnakeEngine(24, 80, seed=7)
+        play(game, Autopilot(game), 20000)
+        self.assertTrue(game.alive)
+        self.assertGreater(game.score, 100)
+
+    def test_board_without_cycle(self):
+        """Test path mode on a board whose sides are both odd."""
+        game = SnakeEngine(11, 13, seed=0)
+        pilot = Autopilot(game)
+        self.assertIsNone(pilot.order)
+        play(game, pilot, 5000)
+        self.assertGreater(game.score, 5)
+
+    def test_straight_on_is_none(self):
+        """Test that carrying straight on is returned as None."""
+        game = SnakeEngine(24, 80, seed=0)
+        pilot = Autopilot(game)
+        # The food starts straight ahead of the snake
+        self.assertIsNone(pilot(game))
+
+    def test_tournament_policy(self):
+        """Test the autopilot tournament policy and its per-game pilot."""
+        results = tournament.run_tournament(['autopilot'], range(3), 10, 12,
+                                            max_ticks=20000, workers=1)
+        for record in results['autopilot']:
+            self.assertIsNone(record['death'])
+        game = SnakeEngine(10, 12, seed=0)
+        self.assertIsNone(autopilot_policy(game))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test suite for the vectorized batch simulator
+Checks that BatchSnakeSim follows the same rules as SnakeEngine.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import batch_sim
+from engine import SnakeEngine, EMPTY, DEATH_WALL, DEATH_SELF
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatchSnakeSim(unittest.TestCase):
+    """Test cases for BatchSnakeSim."""
+
+    def test_initial_state_matches_engine(self):
+        """Test that fresh batch games look like a fresh engine."""
+        sim = batch_sim.BatchSnakeSim(4, 12, 24, seed=0)
+        game = SnakeEngine(12, 24)
+        for i in range(4):
+            self.assertEqual(list(sim.snake(i)), list(game.body))
+            self.assertEqual(sim.food[i], game.food)
+            self.assertEqual(bytes(sim.grid[i]), bytes(game.grid))
+
+    def test_matches_engine_under_random_play(self):
+        """Test lockstep play against SnakeEngine with the same food."""
+        n, height, width = 64, 12, 16
+        sim = batch_sim.BatchSnakeSim(n, height, width, seed=1)
+        games = [SnakeEngine(height, width, seed=i) for i in range(n)]
+        rng = random.Random(2)
+        deaths = {DEATH_WALL: batch_sim.DIED_WALL, DEATH_SELF: batch_sim.DIED_SELF}
+        for _ in range(300):
+            actions = [rng.choice((-1, -1, 0, 1, 2, 3)) for _ in range(n)]
+            sim.step(np.array(actions))
+            for i, game in enumerate(games):
+                game.step(None if actions[i] < 0 else actions[i])
+                if game.ate and sim.food[i] >= 0:
+                    # Follow the batch simulator's food choice
+                    game.grid[game.food] = EMPTY
+                    game.free.add(game.food)
+                    game.place_food(int(sim.food[i]))
+                self.assertEqual(bool(sim.alive[i]), game.alive)
+                self.assertEqual(sim.score[i], game.score)
+                if game.alive:
+                    self.assertEqual(list(sim.snake(i)), list(game.body))
+                    self.assertEqual(bytes(sim.grid[i]), bytes(game.grid))
+                else:
+                    self.assertEqual(sim.death[i], deaths[game.death])
+        self.assertFalse(sim.alive.all())
+
+    def test_reset_restarts_dead_games(self):
+        """Test that reset() only restarts the selected games."""
+        sim = batch_sim.BatchSnakeSim(3, 12, 24, seed=0)
+        while sim.alive.any():
+            sim.step(np.array([0, -1, -1]))
+        sim.reset(np.array([True, False, False]))
+        self.assertEqual(list(sim.alive), [True, False, False])
+        self.assertEqual(sim.ticks[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test suite for the headless Snake Game engine
+Checks movement, growth and collision rules without curses.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import (
+    FreeCells, SnakeEngine, UP, DOWN, LEFT, RIGHT,
+    EMPTY, BODY, HEAD, FOOD, WALL, DEATH_WALL, DEATH_SELF,
+)
+
+
+class TestSnakeEngine(unittest.TestCase):
+    """Test cases for SnakeEngine."""
+
+    def setUp(self):
+        """Create a 20x40 board like a small terminal."""
+        self.game = SnakeEngine(20, 40)
+
+    def test_initial_state(self):
+        """Test the starting snake, food and walls."""
+        game = self.game
+        self.assertEqual([game.pos(c) for c in game.body], [(10, 10), (10, 9), (10, 8)])
+        self.assertEqual(game.pos(game.food), (10, 20))
+        self.assertEqual(game.grid[game.head], HEAD)
+        self.assertEqual(game.grid[game.food], FOOD)
+        self.assertEqual(game.grid[game.cell(0, 5)], WALL)
+        self.assertEqual(game.grid[game.cell(19, 39)], WALL)
+        self.assertTrue(game.alive)
+
+    def test_move_keeps_length(self):
+        """Test that a plain move shifts the snake by one cell."""
+        game = self.game
+        self.assertTrue(game.step())
+        self.assertEqual(game.pos(game.head), (10, 11))
+        self.assertEqual(game.pos(game.removed), (10, 8))
+        self.assertEqual(game.grid[game.removed], EMPTY)
+        self.assertEqual(game.grid[game.body[1]], BODY)
+        self.assertEqual(len(game), 3)
+
+    def test_reverse_direction_ignored(self):
+        """Test that turning back onto the body is ignored."""
+        game = self.game
+        game.step(LEFT)
+        self.assertEqual(game.direction, RIGHT)
+        game.step(UP)
+        self.assertEqual(game.direction, UP)
+        game.step(DOWN)
+        self.assertEqual(game.direction, UP)
+
+    def test_eating_food_grows_snake(self):
+        """Test growth and scoring when the head reaches the food."""
+        game = self.game
+        for _ in range(10):
+            game.step()
+        self.assertTrue(game.ate)
+        self.assertIsNone(game.removed)
+        self.assertEqual(game.score, 1)
+        self.assertEqual(len(game), 4)
+        self.assertIsNotNone(game.food)
+        self.assertEqual(game.grid[game.food], FOOD)
+
+    def test_wall_collision(self):
+        """Test that running into the border ends the game."""
+        game = self.game
+        alive = True
+        steps = 0
+        while alive:
+            alive = game.step(UP)
+            steps += 1
+        self.assertEqual(steps, 10)
+        self.assertEqual(game.death, DEATH_WALL)
+        self.assertFalse(game.step())
+
+    def set_body(self, game, positions, direction):
+        """Replace the snake with the given (y, x) positions, head first."""
+        for cell in game.body:
+            game.grid[cell] = EMPTY
+        game.body.clear()
+        for y, x in positions:
+            game.body.append(game.cell(y, x))
+            game.grid[game.cell(y, x)] = BODY
+        game.grid[game.head] = HEAD
+        game.direction = direction
+
+    def test_self_collision(self):
+        """Test that turning into the body ends the game."""
+        game = self.game
+        self.set_body(game, [(10, 10), (11, 10), (11, 11), (10, 11), (9, 11)], UP)
+        self.assertFalse(game.step(RIGHT))
+        self.assertEqual(game.death, DEATH_SELF)
+        self.assertEqual(len(game), 5)
+        self.assertEqual(game.grid[game.cell(9, 11)], BODY)
+
+    def test_follow_tail_is_allowed(self):
+        """Test that the head may move into the cell the tail just left."""
+        game = self.game
+        self.set_body(game, [(10, 10), (10, 9), (11, 9), (11, 10)], RIGHT)
+        self.assertTrue(game.step(DOWN))
+        self.assertEqual(game.pos(game.head), (11, 10))
+        self.assertEqual(game.grid[game.head], HEAD)
+
+    def test_food_never_spawns_on_snake(self):
+        """Test that food only lands on empty cells inside the margin."""
+        game = SnakeEngine(12, 22, seed=3)
+        for _ in range(200):
+            cell = game.spawn_food()
+            y, x = game.pos(cell)
+            self.assertTrue(2 <= y <= 9 and 2 <= x <= 19)
+            self.assertNotIn(cell, game.body)
+            game.grid[cell] = EMPTY
+            game.free.add(cell)
+
+    def test_full_board_has_no_food(self):
+        """Test that spawning on a board without free cells returns None."""
+        game = SnakeEngine(12, 22)
+        for cell in list(game.free.cells):
+            game.free.discard(cell)
+        self.assertIsNone(game.spawn_food())
+
+
+class TestSnapshots(unittest.TestCase):
+    """Test cases for advance()/undo() and clone()."""
+
+    def state(self, game):
+        return (bytes(game.grid), list(game.body), list(game.free.cells), list(game.free.index),
+                game.direction, game.food, game.score, game.ticks, game.alive, game.death,
+                game.ate, game.removed, game.rng.getstate())
+
+    def test_undo_restores_exact_state(self):
+        """Test random walks of advances undone in reverse order."""
+        rng = random.Random(3)
+        game = SnakeEngine(8, 10, seed=5)
+        for _ in range(300):
+            before = self.state(game)
+            records = []
+            for _ in range(rng.randrange(1, 30)):
+                records.append(game.advance(rng.choice((None, UP, DOWN, LEFT, RIGHT)))[1])
+            for record in reversed(records):
+                game.undo(record)
+            self.assertEqual(self.state(game), before)
+            # Keep playing so the walks start from varied positions
+            if not game.step(rng.choice((None, UP, DOWN, LEFT, RIGHT))):
+                game = SnakeEngine(8, 10, seed=rng.randrange(100))
+
+    def test_undo_then_replay_is_deterministic(self):
+        """Test that futures explored from a snapshot repeat exactly."""
+        game = SnakeEngine(20, 40, seed=1)
+        records = [game.advance()[1] for _ in range(40)]
+        after = self.state(game)
+        for record in reversed(records):
+            game.undo(record)
+        for _ in range(40):
+            game.step()
+        self.assertEqual(self.state(game), after)
+
+    def test_clone_is_independent(self):
+        """Test that a clone plays on without touching the original."""
+        game = SnakeEngine(20, 40, seed=2)
+        for _ in range(15):
+            game.step()
+        before = self.state(game)
+        other = game.clone()
+        self.assertEqual(self.state(other), before)
+        while other.step(UP):
+            pass
+        self.assertEqual(self.state(game), before)
+        game.step(UP)
+        self.assertNotEqual(self.state(game), self.state(other))
+
+
+class TestFreeCells(unittest.TestCase):
+    """Test cases for the free-cell index."""
+
+    def test_add_discard_keeps_index_consistent(self):
+        """Test swap-remove bookkeeping over random operations."""
+        rng = random.Random(7)
+        free = FreeCells(100, range(10, 90))
+        expected = set(range(10, 90))
+        for _ in range(2000):
+            cell = rng.randrange(100)
+            if rng.random() < 0.5:
+                free.discard(cell)
+                expected.discard(cell)
+            else:
+                free.add(cell)
+                if 10 <= cell < 90:
+                    expected.add(cell)
+            self.assertEqual(len(free), len(expected))
+        self.assertEqual(set(free.cells), expected)
+        for i, cell in enumerate(free.cells):
+            self.assertEqual(free.index[cell], i)
+        self.assertNotIn(5, free)
+
+    def test_sample_is_uniform(self):
+        """Test that every free cell gets picked."""
+        free = FreeCells(10, [1, 2, 3])
+        rng = random.Random(0)
+        self.assertEqual({free.sample(rng) for _ in range(200)}, {1, 2, 3})
+        self.assertIsNone(FreeCells(10, []).sample(rng))
+
+
+if __name__ == '__main__':
+    unittest.main()
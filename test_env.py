@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test suite for the reinforcement-learning environments
+Checks that observations are live views of the engine grids.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine, UP, HEAD, FOOD, DEATH_WALL
+from env import SnakeEnv, VectorSnakeEnv
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSnakeEnv(unittest.TestCase):
+    """Test cases for SnakeEnv."""
+
+    def test_observation_is_a_live_view(self):
+        """Test that the observation is a view of the engine grid, not a copy."""
+        env = SnakeEnv(12, 20)
+        obs = env.reset(seed=3)
+        self.assertEqual(obs.shape, (12, 20))
+        self.assertTrue(np.shares_memory(obs, np.frombuffer(env.game.grid, dtype=np.uint8)))
+        same, _, _, _ = env.step(None)
+        self.assertIs(same, obs)
+        y, x = env.game.pos(env.game.head)
+        self.assertEqual(obs[y, x], HEAD)
+        self.assertEqual(bytes(obs), bytes(env.game.grid))
+
+    def test_matches_engine(self):
+        """Test that rewards and info follow the plain engine game."""
+        env = SnakeEnv(12, 20)
+        env.reset(seed=5)
+        game = SnakeEngine(12, 20, seed=5)
+        total = 0.0
+        done = False
+        while not done:
+            _, reward, done, info = env.step(-1)
+            game.step()
+            total += reward
+        self.assertEqual(info['death'], DEATH_WALL)
+        self.assertEqual((info['score'], info['ticks']), (game.score, game.ticks))
+        self.assertEqual(total, game.score - 1.0)
+
+    def test_truncation(self):
+        """Test that an episode ends after max_ticks steps."""
+        env = SnakeEnv(24, 80, max_ticks=3)
+        env.reset(seed=1)
+        dones = [env.step(None)[2] for _ in range(3)]
+        self.assertEqual(dones, [False, False, True])
+        self.assertTrue(env.step(None)[3]['truncated'])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorSnakeEnv(unittest.TestCase):
+    """Test cases for VectorSnakeEnv."""
+
+    def test_view_and_auto_reset(self):
+        """Test that observations view the batch grids and finished games restart."""
+        env = VectorSnakeEnv(8, 12, 20)
+        obs = env.reset(seed=0)
+        self.assertEqual(obs.shape, (8, 12, 20))
+        self.assertTrue(np.shares_memory(obs, env.sim.grid))
+        actions = np.full(8, -1)
+        actions[:4] = UP
+        finished = np.zeros(8, dtype=bool)
+        for _ in range(12):
+            same, rewards, dones, infos = env.step(actions)
+            self.assertIs(same, obs)
+            finished |= dones
+            self.assertTrue((rewards[dones] < 0).all())
+            self.assertTrue((infos['ticks'][dones] > 0).all())
+        self.assertTrue(finished[:4].all())
+        # Restarted games are back on a fresh board
+        self.assertTrue(env.sim.alive.all())
+        self.assertTrue((obs == FOOD).sum(axis=(1, 2)).max() == 1)
+
+    def test_truncation(self):
+        """Test that every game ends and restarts after max_ticks steps."""
+        env = VectorSnakeEnv(4, 24, 80, max_ticks=2)
+        env.reset(seed=0)
+        self.assertFalse(env.step(None)[2].any())
+        _, _, dones, infos = env.step(None)
+        self.assertTrue(dones.all())
+        self.assertTrue(infos['truncated'].all())
+        self.assertTrue((env.sim.ticks == 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
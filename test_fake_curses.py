@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for the fake curses terminal
+Checks key timing on the virtual clock and the curses behaviour the game
+relies on; full games through main() are in test_snake_game.py.
+"""
+
+import curses
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import render
+import snake_game
+from fake_curses import FakeTerminal
+
+
+class TestFakeTerminal(unittest.TestCase):
+    """Test cases for FakeTerminal and FakeWindow."""
+
+    def test_getch_waits_on_the_virtual_clock(self):
+        """Test that getch timeouts advance virtual time to the next key."""
+        term = FakeTerminal()
+        w = term.initscr()
+        term.press('a', at=0.25)
+        w.timeout(100)
+        self.assertEqual(w.getch(), -1)
+        self.assertAlmostEqual(term.now, 0.1)
+        w.timeout(0)
+        self.assertEqual(w.getch(), -1)
+        w.timeout(500)
+        self.assertEqual(w.getch(), ord('a'))
+        self.assertAlmostEqual(term.now, 0.25)
+
+    def test_blocking_without_keys_is_an_error(self):
+        """Test that a blocking getch with no keys left raises."""
+        w = FakeTerminal().initscr()
+        w.timeout(-1)
+        with self.assertRaises(RuntimeError):
+            w.getch()
+
+    def test_time_limit_interrupts(self):
+        """Test that reading past the time limit raises KeyboardInterrupt."""
+        term = FakeTerminal(time_limit=1.0)
+        w = term.initscr()
+        w.timeout(600)
+        w.getch()
+        w.getch()
+        with self.assertRaises(KeyboardInterrupt):
+            w.getch()
+
+    def test_keys_at_the_same_time_keep_their_order(self):
+        """Test that keys pressed at one instant arrive in order."""
+        term = FakeTerminal()
+        w = term.initscr()
+        for key in (curses.KEY_UP, curses.KEY_LEFT, 'q'):
+            term.press(key, at=0.5)
+        w.timeout(1000)
+        self.assertEqual([w.getch() for _ in range(3)], [curses.KEY_UP, curses.KEY_LEFT, ord('q')])
+
+    def test_writes_outside_the_window_fail(self):
+        """Test that off-window and lower-right writes raise curses.error."""
+        w = FakeTerminal(10, 20).newwin(10, 20, 0, 0)
+        with self.assertRaises(curses.error):
+            w.addch(10, 0, '#')
+        with self.assertRaises(curses.error):
+            w.addch(9, 19, '#')
+        with self.assertRaises(curses.error):
+            w.addstr(9, 15, "too long")
+
+    def test_screen_shows_refreshed_windows(self):
+        """Test that the screen shows windows only once refreshed."""
+        term = FakeTerminal(4, 10)
+        w = term.newwin(3, 8, 1, 2)
+        w.addstr(0, 0, "abc")
+        w.addch(2, 6, ord('*'))
+        self.assertEqual(term.screen()[1], ' ' * 10)
+        w.noutrefresh()
+        term.doupdate()
+        self.assertEqual(term.screen(), [' ' * 10, '  abc     ', ' ' * 10, '        * '])
+        self.assertEqual(term.frames, 1)
+
+    def test_install_restores_modules(self):
+        """Test that install() swaps curses in and restores it afterwards."""
+        term = FakeTerminal()
+        with term.install():
+            self.assertIs(snake_game.curses, term)
+            self.assertIs(render.curses, term)
+        self.assertIs(snake_game.curses, curses)
+        self.assertIs(render.curses, curses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for the high-score store
+Uses temporary SQLite databases, including several writer processes.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine
+from highscores import HighScores, game_record, signed_seed
+from rng import GameRng
+from server import GameServer, MessageReader, MSG_END
+
+
+def record(player, score, difficulty='NORMAL'):
+    """A minimal game record for ``record()``."""
+    return {'player': player, 'score': score, 'length': score + 3, 'ticks': 10 * score,
+            'difficulty': difficulty}
+
+
+def write_scores(path, player, count):
+    """Writer process: record ``count`` games one transaction at a time."""
+    with HighScores(path) as scores:
+        for i in range(count):
+            scores.record(record(player, i))
+    return count
+
+
+class TestHighScores(unittest.TestCase):
+    """Test cases for HighScores."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "scores.db")
+        self.scores = HighScores(self.path)
+
+    def tearDown(self):
+        self.scores.close()
+        self.tmp.cleanup()
+
+    def test_top_and_best(self):
+        """Test top-N by score and difficulty and per-player bests."""
+        self.scores.record_many([record('ann', 5), record('bob', 9), record('ann', 7),
+                                 record('cy', 9), record('bob', 1, 'HARD')])
+        top = self.scores.top(3)
+        self.assertEqual([(r['player'], r['score']) for r in top],
+                         [('bob', 9), ('cy', 9), ('ann', 7)])
+        self.assertEqual([r['score'] for r in self.scores.top(5, 'HARD')], [1])
+        self.assertEqual(self.scores.best('ann')['score'], 7)
+        self.assertIsNone(self.scores.best('dee'))
+        self.assertEqual(len(self.scores), 5)
+
+    def test_qualifies(self):
+        """Test whether a score would enter a top-N table."""
+        self.assertTrue(self.scores.qualifies(0, n=2))
+        self.scores.record_many([record('a', 5), record('b', 3)])
+        self.assertFalse(self.scores.qualifies(3, n=2))
+        self.assertTrue(self.scores.qualifies(4, n=2))
+
+    def test_game_record(self):
+        """Test that a finished engine is stored with its score, ticks and death."""
+        game = SnakeEngine(10, 20, seed=1)
+        while game.step():
+            pass
+        game_id = self.scores.record(game_record(game, 'eve', 'EXPERT', 1))
+        best = self.scores.best('eve')
+        self.assertEqual(best['id'], game_id)
+        self.assertEqual((best['score'], best['ticks'], best['death'], best['seed']),
+                         (game.score, game.ticks, game.death, 1))
+
+    def test_large_seeds_stored_signed(self):
+        """Test that seeds of 2**63 and above are stored as signed 64-bit values."""
+        self.scores.record_many([dict(record('a', 1), seed=2 ** 64 - 1),
+                                 dict(record('b', 2), seed=2 ** 63 - 1)])
+        self.assertEqual(self.scores.best('a')['seed'], -1)
+        self.assertEqual(self.scores.best('b')['seed'], 2 ** 63 - 1)
+        self.assertEqual(GameRng(signed_seed(2 ** 63)).next64(), GameRng(2 ** 63).next64())
+
+    def test_failed_transaction_rolls_back(self):
+        """Test that a failing batch leaves no rows behind."""
+        with self.assertRaises(KeyError):
+            self.scores.record_many([record('a', 1), {'player': 'broken'}])
+        self.assertEqual(len(self.scores), 0)
+        self.scores.record(record('a', 2))
+        self.assertEqual(len(self.scores), 1)
+
+    def test_lookups_use_indexes(self):
+        """Test that the top and best queries use indexes, not sorts."""
+        db = self.scores.db
+        queries = [
+            ("SELECT * FROM games ORDER BY score DESC, id LIMIT 10", ()),
+            ("SELECT * FROM games WHERE difficulty = ? ORDER BY score DESC, id LIMIT 10",
+             ('HARD',)),
+            ("SELECT * FROM games WHERE player = ? ORDER BY score DESC, id LIMIT 1", ('a',)),
+        ]
+        for query, params in queries:
+            plan = " ".join(row[-1] for row in db.execute("EXPLAIN QUERY PLAN " + query, params))
+            self.assertIn("INDEX", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_concurrent_writers(self):
+        """Test that writer processes can record at the same time."""
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(write_scores, [self.path] * 4,
+                                   ['p0', 'p1', 'p2', 'p3'], [100] * 4))
+        self.assertEqual(sum(counts), 400)
+        self.assertEqual(len(self.scores), 400)
+        for player in ('p0', 'p1', 'p2', 'p3'):
+            self.assertEqual(self.scores.best(player)['score'], 99)
+
+    def test_server_records_games(self):
+        """Test that the game server records every finished session."""
+        levels = {'NORMAL': {'speed': 2, 'food_value': 1}}
+
+        async def main():
+            server = GameServer(levels=levels, scores=self.scores)
+            listener = await server.listen_tcp('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+
+            async def play(i):
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(f'NORMAL {i} player{i % 3}\n'.encode())
+                parser = MessageReader()
+                messages = []
+                while not messages or messages[-1][0] != MSG_END:
+                    messages += parser.feed(await asyncio.wait_for(reader.read(4096), 5))
+                writer.close()
+
+            try:
+                await asyncio.gather(*(play(i) for i in range(12)))
+                await asyncio.sleep(0.01)
+            finally:
+                server.close()
+
+        asyncio.run(main())
+        self.assertEqual(len(self.scores), 12)
+        self.assertEqual({r['player'] for r in self.scores.top(12)},
+                         {'player0', 'player1', 'player2'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test suite for buffered input
+Checks that quick key sequences are applied in order, one turn per tick.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import UP, DOWN, LEFT, RIGHT
+from input_queue import InputQueue
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInputQueue(unittest.TestCase):
+    """Test cases for InputQueue."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.inputs = InputQueue(size=3, clock=self.clock)
+
+    def test_quick_turn_sequence_kept(self):
+        """Test that DOWN then LEFT within one tick become two turns."""
+        self.assertTrue(self.inputs.push(DOWN, RIGHT))
+        self.assertTrue(self.inputs.push(LEFT, RIGHT))
+        self.assertEqual(self.inputs.pop(RIGHT), DOWN)
+        self.assertEqual(self.inputs.pop(DOWN), LEFT)
+        self.assertIsNone(self.inputs.pop(LEFT))
+
+    def test_reverse_checked_against_queued_turn(self):
+        """Test that the reverse guard uses the last queued direction."""
+        self.inputs.push(UP, RIGHT)
+        self.assertFalse(self.inputs.push(DOWN, RIGHT))
+        self.assertTrue(self.inputs.push(LEFT, RIGHT))
+
+    def test_repeats_dropped(self):
+        """Test that repeating the current direction is ignored."""
+        self.assertFalse(self.inputs.push(RIGHT, RIGHT))
+        self.assertFalse(self.inputs.push(LEFT, RIGHT))
+        self.assertEqual(len(self.inputs), 0)
+
+    def test_queue_is_bounded(self):
+        """Test that turns beyond the buffer size are dropped."""
+        for direction in (UP, LEFT, DOWN, RIGHT, UP):
+            self.inputs.push(direction, RIGHT)
+        self.assertEqual(len(self.inputs), 3)
+        self.assertEqual([d for d, _ in self.inputs.pending], [UP, LEFT, DOWN])
+
+    def test_latency_recorded_on_render(self):
+        """Test input-to-render latency measurement."""
+        self.inputs.push(UP, RIGHT)
+        self.clock.now = 0.03
+        self.inputs.pop(RIGHT)
+        self.clock.now = 0.05
+        self.inputs.rendered()
+        self.assertEqual(self.inputs.latency.count, 1)
+        self.assertAlmostEqual(self.inputs.latency.max, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test suite for the game loop metrics
+Checks the histograms, the exports and that the instrumented engine plays
+exactly like the plain one.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine, DIRECTIONS
+from metrics import BUCKETS, PHASES, Histogram, InstrumentedEngine, PhaseMetrics
+from rng import GameRng
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for Histogram."""
+
+    def test_observe_buckets(self):
+        """Test that durations land in the right buckets, overflow included."""
+        h = Histogram()
+        h.observe(0.5e-6)
+        h.observe(1e-6)
+        h.observe(3e-6)
+        h.observe(10.0)
+        self.assertEqual(h.count, 4)
+        self.assertEqual(h.counts[0], 2)
+        self.assertEqual(h.counts[2], 1)
+        self.assertEqual(h.counts[len(BUCKETS)], 1)
+        self.assertAlmostEqual(h.sum, 10.0000045)
+
+    def test_cumulative_and_quantile(self):
+        """Test cumulative counts and bucket-bound quantiles."""
+        h = Histogram()
+        for _ in range(99):
+            h.observe(1.5e-6)
+        h.observe(0.3)
+        pairs = h.cumulative()
+        self.assertEqual(pairs[-1], (float('inf'), 100))
+        self.assertEqual(h.quantile(0.5), 2e-6)
+        self.assertEqual(h.quantile(1.0), 0.5)
+        self.assertEqual(Histogram().quantile(0.5), 0.0)
+
+
+class TestPhaseMetrics(unittest.TestCase):
+    """Test cases for PhaseMetrics exports."""
+
+    def setUp(self):
+        self.metrics = PhaseMetrics()
+        self.metrics.observe('render', 0.002)
+        self.metrics.observe('input', 4e-6)
+
+    def test_prometheus_text(self):
+        """Test the Prometheus histogram text, empty phases included."""
+        text = self.metrics.to_prometheus()
+        self.assertIn("# TYPE snake_phase_seconds histogram", text)
+        self.assertIn('snake_phase_seconds_bucket{phase="render",le="0.002"} 1', text)
+        self.assertIn('snake_phase_seconds_bucket{phase="render",le="+Inf"} 1', text)
+        self.assertIn('snake_phase_seconds_count{phase="input"} 1', text)
+        self.assertIn('snake_phase_seconds_count{phase="food"} 0', text)
+
+    def test_json_line(self):
+        """Test that a snapshot is one JSON line covering every phase."""
+        line = self.metrics.to_json_line()
+        self.assertNotIn("\n", line)
+        data = json.loads(line)
+        self.assertEqual(set(data['phases']), set(PHASES))
+        self.assertEqual(data['phases']['render']['count'], 1)
+
+    def test_export_files(self):
+        """Test that .jsonl exports append and other files are replaced."""
+        with tempfile.TemporaryDirectory() as tmp:
+            jsonl = os.path.join(tmp, "m.jsonl")
+            self.metrics.export(jsonl)
+            self.metrics.export(jsonl)
+            with open(jsonl, encoding="utf-8") as fh:
+                self.assertEqual(len(fh.readlines()), 2)
+
+            prom = os.path.join(tmp, "m.prom")
+            self.metrics.export(prom)
+            self.metrics.export(prom)
+            with open(prom, encoding="utf-8") as fh:
+                self.assertEqual(fh.read(), self.metrics.to_prometheus())
+            self.assertEqual(sorted(os.listdir(tmp)), ["m.jsonl", "m.prom"])
+
+
+class TestInstrumentedEngine(unittest.TestCase):
+    """The instrumented engine must follow the plain engine's rules."""
+
+    def test_same_games_as_plain_engine(self):
+        """Test that timed games match plain ones and every phase is counted."""
+        for seed in range(20):
+            plain = SnakeEngine(12, 20, seed=seed)
+            timed = InstrumentedEngine(12, 20, seed=seed)
+            turns = GameRng(seed + 1000)
+            while plain.alive and plain.ticks < 500:
+                direction = DIRECTIONS[turns.below(4)] if turns.below(3) == 0 else None
+                self.assertEqual(plain.step(direction), timed.step(direction))
+                self.assertEqual(plain.grid, timed.grid)
+                self.assertEqual(list(plain.body), list(timed.body))
+                self.assertEqual((plain.food, plain.score, plain.ate, plain.removed, plain.death),
+                                 (timed.food, timed.score, timed.ate, timed.removed, timed.death))
+            phases = timed.metrics.phases
+            self.assertEqual(phases['collision'].count, timed.ticks)
+            self.assertEqual(phases['move'].count, timed.ticks - (0 if timed.alive else 1))
+            self.assertEqual(phases['food'].count, timed.score)
+
+    def test_rules_not_duplicated(self):
+        """Test that the instrumented engine reuses SnakeEngine.step."""
+        self.assertIs(InstrumentedEngine.step, SnakeEngine.step)
+
+    def test_shared_metrics(self):
+        """Test that several engines can record into one PhaseMetrics."""
+        metrics = PhaseMetrics()
+        game = InstrumentedEngine(10, 20, metrics=metrics, seed=1)
+        game.step()
+        self.assertIs(game.metrics, metrics)
+        self.assertEqual(metrics.phases['collision'].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test suite for the dirty-cell renderer
+Uses a mocked curses window to check what gets drawn per frame.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine
+from render import AnsiRenderer, CursesRenderer, cursor_move
+
+
+class TestCursesRenderer(unittest.TestCase):
+    """Test cases for CursesRenderer."""
+
+    def setUp(self):
+        self.window = MagicMock()
+        self.window.getmaxyx.return_value = (20, 40)
+        self.renderer = CursesRenderer(self.window)
+        self.game = SnakeEngine(20, 40)
+
+    def flush(self):
+        with patch('render.curses.doupdate') as doupdate:
+            self.renderer.flush()
+            self.assertEqual(doupdate.call_count, 1)
+        self.window.noutrefresh.assert_called_once()
+
+    def test_tick_draws_only_changes(self):
+        """Test that one tick touches the tail, neck and head only."""
+        self.game.step()
+        self.renderer.draw_tick(self.game)
+        self.flush()
+        drawn = {call.args[:2]: call.args[2] for call in self.window.addch.call_args_list}
+        self.assertEqual(drawn, {(10, 8): ' ', (10, 10): '#', (10, 11): '#'})
+
+    def test_ticks_in_one_frame_collapse(self):
+        """Test that cells changed by several ticks are written once."""
+        for _ in range(3):
+            self.game.step()
+            self.renderer.draw_tick(self.game)
+        self.assertEqual(len(self.renderer.cells), 6)
+        self.flush()
+        self.assertEqual(self.window.addch.call_count, 6)
+        self.assertFalse(self.renderer.dirty)
+
+    def test_fps_overlay(self):
+        """Test that the overlay is drawn on the bottom row when enabled."""
+        self.renderer.show_fps = True
+        self.renderer.text(0, 2, "SNAKE GAME - Score: 0")
+        self.flush()
+        rows = [call.args[0] for call in self.window.addstr.call_args_list]
+        self.assertEqual(rows, [0, 19])
+        self.assertGreater(self.renderer.stats.frame_bytes, 21)
+        self.assertEqual(self.renderer.stats.fps, 1)
+
+    def test_repaint(self):
+        """Test that a repaint sends the whole window without new drawing."""
+        with patch('render.curses.doupdate') as doupdate:
+            self.renderer.repaint()
+            doupdate.assert_called_once()
+        self.window.redrawwin.assert_called_once()
+        self.window.addch.assert_not_called()
+
+
+class TestAnsiRenderer(unittest.TestCase):
+    """Test cases for AnsiRenderer."""
+
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.renderer = AnsiRenderer(self.write_fd, 20, 40)
+        self.game = SnakeEngine(20, 40)
+
+    def tearDown(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+    def frame(self):
+        self.renderer.flush()
+        return os.read(self.read_fd, 1 << 16)
+
+    def test_cursor_move(self):
+        """Test that the shortest cursor movement is chosen."""
+        self.assertEqual(cursor_move(None, 4, 9), b'\x1b[5;10H')
+        self.assertEqual(cursor_move((4, 9), 4, 9), b'')
+        self.assertEqual(cursor_move((4, 9), 4, 10), b'\x1b[C')
+        self.assertEqual(cursor_move((4, 9), 4, 7), b'\b\b')
+        self.assertEqual(cursor_move((4, 9), 4, 2), b'\x1b[7D')
+        self.assertEqual(cursor_move((4, 9), 2, 9), b'\x1b[2A')
+        self.assertEqual(cursor_move((4, 9), 5, 3), b'\x1b[6;4H')
+
+    def test_one_write_per_frame(self):
+        """Test that a frame is sent with one write of cursor moves and glyphs."""
+        self.renderer.draw_board(self.game)
+        self.renderer.text(0, 2, "Score: 0")
+        data = self.frame()
+        self.assertEqual(self.renderer.writes, 1)
+        self.assertEqual(data, b'\x1b[11;9H###\x1b[9C*\x1b[1;3HScore: 0')
+        self.assertEqual(self.renderer.stats.frame_bytes, len(data))
+
+    def test_tick_reuses_cursor_and_screen(self):
+        """Test that a straight move costs a few bytes once the cursor is known."""
+        self.renderer.draw_board(self.game)
+        self.frame()
+        self.game.step()
+        self.renderer.draw_tick(self.game)
+        self.frame()
+        self.game.step()
+        self.renderer.draw_tick(self.game)
+        self.assertEqual(self.frame(), b'\b\b\b ###')
+
+    def test_repaint_from_shadow(self):
+        """Test that a repaint clears the screen and resends what is on it."""
+        self.renderer.draw_board(self.game)
+        self.renderer.text(0, 2, "Score: 0")
+        self.frame()
+        self.game.step()
+        self.renderer.draw_tick(self.game)
+        self.frame()
+        self.renderer.repaint()
+        self.assertEqual(os.read(self.read_fd, 1 << 16),
+                         b'\x1b[2J\x1b[1;3HScore: 0\x1b[11;10H###\x1b[8C*')
+        self.game.step()
+        self.renderer.draw_tick(self.game)
+        self.assertEqual(self.frame(), b'\x1b[12D ###')
+
+
+if __name__ == '__main__':
+    unittest.main()
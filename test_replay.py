@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test suite for replays
+Checks the binary format and that replays re-simulate the recorded game.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine, UP, LEFT, RIGHT
+from replay import Replay, ReplayError, fast_forward, playback, read_varint, write_varint
+from tournament import greedy_policy
+
+
+def record_game(seed, height=16, width=30, max_ticks=10000):
+    """Play a greedy game and return (replay, final engine)."""
+    replay = Replay(seed, height, width, 'NORMAL')
+    game = SnakeEngine(height, width, seed=seed)
+    while game.ticks < max_ticks:
+        direction = greedy_policy(game)
+        if direction is not None and direction != game.direction:
+            replay.record(game.ticks, direction)
+        if not game.step(direction):
+            break
+    replay.end_tick = game.ticks
+    return replay, game
+
+
+class TestReplay(unittest.TestCase):
+    """Test cases for Replay."""
+
+    def test_varint_roundtrip(self):
+        """Test varint encoding of small and large values."""
+        for value in (0, 1, 127, 128, 300, 2 ** 32, 2 ** 63):
+            buf = bytearray()
+            write_varint(buf, value)
+            self.assertEqual(read_varint(buf, 0), (value, len(buf)))
+        self.assertEqual(len(buf), 10)
+
+    def test_encode_decode_roundtrip(self):
+        """Test that a replay survives encoding unchanged."""
+        replay = Replay(12345, 24, 80, 'EXPERT', [(3, UP), (7, LEFT), (400, RIGHT)], 512)
+        data = replay.encode()
+        self.assertEqual(Replay.decode(data), replay)
+        self.assertLess(len(data), 24)
+
+    def test_bad_data_rejected(self):
+        """Test that invalid or truncated data raises ReplayError."""
+        with self.assertRaises(ReplayError):
+            Replay.decode(b'nope')
+        data = Replay(1, 24, 80, events=[(1, UP)], end_tick=5).encode()
+        with self.assertRaises(ReplayError):
+            Replay.decode(data[:-1])
+        with self.assertRaises(ReplayError):
+            Replay.decode(Replay(1, 5, 5).encode())
+
+    def test_negative_values_not_encoded(self):
+        """Test that a negative seed or tick raises ReplayError on encode."""
+        with self.assertRaises(ReplayError):
+            Replay(-1, 24, 80).encode()
+        with self.assertRaises(ReplayError):
+            Replay(1, 24, 80, events=[(5, UP), (3, LEFT)], end_tick=9).encode()
+
+    def test_fast_forward_reproduces_game(self):
+        """Test that re-simulation reaches the recorded end state."""
+        for seed in range(5):
+            replay, game = record_game(seed)
+            end = fast_forward(Replay.decode(replay.encode()))
+            self.assertEqual((end.score, end.ticks, end.death), (game.score, game.ticks, game.death))
+            self.assertEqual(list(end.body), list(game.body))
+
+    def test_fast_forward_stops_at_quit(self):
+        """Test that a game quit before dying stops at its end tick."""
+        replay, game = record_game(1, max_ticks=50)
+        end = fast_forward(replay)
+        self.assertTrue(end.alive)
+        self.assertEqual(end.ticks, 50)
+
+    def test_realtime_playback_paces_ticks(self):
+        """Test that real-time playback sleeps one tick length per tick."""
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        replay, _ = record_game(2, max_ticks=5)
+        ticks = [g.ticks for g in playback(replay, True, lambda: now[0], sleep)]
+        self.assertEqual(ticks, [1, 2, 3, 4, 5])
+        self.assertAlmostEqual(now[0], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test suite for per-game random numbers
+Checks determinism of GameRng and that bulk draws match single draws.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rng
+from rng import GameRng
+from engine import SnakeEngine
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestGameRng(unittest.TestCase):
+    """Test cases for GameRng."""
+
+    def test_splitmix64_reference_values(self):
+        """Test against the published SplitMix64 sequence for seed 0."""
+        g = GameRng(0)
+        self.assertEqual(g.next64(), 0xE220A8397B1DCDAF)
+        self.assertEqual(g.next64(), 0x6E789E6AA1B965F4)
+
+    def test_same_seed_same_draws(self):
+        """Test that equal seeds give equal streams."""
+        a, b = GameRng(42), GameRng(42)
+        self.assertEqual([a.below(100) for _ in range(50)], [b.below(100) for _ in range(50)])
+        self.assertNotEqual(GameRng(1).next64(), GameRng(2).next64())
+
+    def test_below_range(self):
+        """Test that below(n) and randint stay in range."""
+        g = GameRng(7)
+        values = {g.below(5) for _ in range(500)}
+        self.assertEqual(values, {0, 1, 2, 3, 4})
+        self.assertTrue(all(3 <= g.randint(3, 6) <= 6 for _ in range(100)))
+
+    def test_random_seed_fits_sqlite_integer(self):
+        """Test that fresh seeds fit a signed 64-bit database column."""
+        with patch.object(rng.os, 'urandom', lambda n: b'\xff' * n):
+            self.assertEqual(rng.random_seed(), 2 ** 63 - 1)
+
+    def test_state_roundtrip(self):
+        """Test that restoring the state replays the same draws."""
+        g = GameRng(9)
+        state = g.getstate()
+        first = [g.next64() for _ in range(3)]
+        g.setstate(state)
+        self.assertEqual([g.next64() for _ in range(3)], first)
+
+    def test_fill_matches_single_draws(self):
+        """Test bulk generation, with and without NumPy."""
+        expected_rng = GameRng(5)
+        expected = [expected_rng.next64() for _ in range(20)]
+        with patch.object(rng, 'np', None):
+            g = GameRng(5)
+            self.assertEqual(list(g.fill(10)), expected[:10])
+            self.assertEqual(g.next64(), expected[10])
+        if np is not None:
+            g = GameRng(5)
+            self.assertEqual([int(v) for v in g.fill(20)], expected)
+            self.assertEqual(g.state, expected_rng.state)
+
+    def test_engine_games_reproducible(self):
+        """Test that two engines with the same seed place food identically."""
+        a, b = SnakeEngine(12, 24, seed=3), SnakeEngine(12, 24, seed=3)
+        self.assertEqual([a.spawn_food() for _ in range(20)], [b.spawn_food() for _ in range(20)])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatchRng(unittest.TestCase):
+    """Test cases for BatchRng."""
+
+    def test_streams_match_game_rng(self):
+        """Test that each game's stream equals GameRng with its seed."""
+        seeds = [11, 22, 33, 44]
+        batch = rng.BatchRng(seeds)
+        singles = [GameRng(s) for s in seeds]
+        for games in ([0, 1, 2, 3], [1, 3], [2], [0, 2, 3]):
+            draws = batch.below(np.array(games), 1000)
+            self.assertEqual(list(draws), [singles[g].below(1000) for g in games])
+
+    def test_batch_game_independent_of_batch(self):
+        """Test that a game's outcome does not depend on its neighbours."""
+        import batch_sim
+        actions = np.random.default_rng(0).integers(-4, 4, size=(200, 1)).clip(-1)
+        small = batch_sim.BatchSnakeSim(1, 12, 24, seeds=[99])
+        large = batch_sim.BatchSnakeSim(5, 12, 24, seeds=[1, 2, 99, 3, 4])
+        for row in actions:
+            small.step(row)
+            large.step(np.array([0, 1, row[0], 2, 3]))
+        self.assertEqual(small.score[0], large.score[2])
+        self.assertEqual(list(small.snake(0)), list(large.snake(2)))
+        self.assertEqual(bytes(small.grid[0]), bytes(large.grid[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
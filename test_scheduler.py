@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test suite for the fixed-timestep scheduler
+Drives FixedTimestep with a fake clock.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scheduler import FixedTimestep, TurboPacer, MAX_CATCHUP_TICKS, TURBO_BATCH
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Test cases for FixedTimestep."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timestep = FixedTimestep(50, clock=self.clock)
+
+    def test_no_tick_before_step(self):
+        """Test that nothing is due before a full step has elapsed."""
+        self.clock.now += 0.049
+        self.assertEqual(self.timestep.due(), 0)
+        self.assertAlmostEqual(self.timestep.timeout(), 0.001)
+
+    def test_ticks_independent_of_wakeups(self):
+        """Test that frequent wake-ups (e.g. key presses) do not speed up ticks."""
+        ticks = 0
+        for _ in range(1000):
+            self.clock.now += 0.001
+            ticks += self.timestep.due()
+        self.assertEqual(ticks, 20)
+
+    def test_catch_up_and_jitter(self):
+        """Test catching up on missed ticks and recording lateness."""
+        self.clock.now += 0.1203
+        self.assertEqual(self.timestep.due(), 2)
+        self.assertAlmostEqual(self.timestep.jitter.max, 0.0203)
+        self.assertAlmostEqual(self.timestep.timeout(), 0.0297)
+
+    def test_stall_is_capped(self):
+        """Test that a long stall does not replay the whole backlog."""
+        self.clock.now += 10.02
+        self.assertEqual(self.timestep.due(), MAX_CATCHUP_TICKS)
+        self.clock.now += 0.01
+        self.assertEqual(self.timestep.due(), 0)
+
+    def test_reset(self):
+        """Test that reset() discards the backlog."""
+        self.clock.now += 0.3
+        self.timestep.reset()
+        self.assertEqual(self.timestep.due(), 0)
+        self.assertAlmostEqual(self.timestep.timeout(), 0.05)
+
+
+class TestTurboPacer(unittest.TestCase):
+    """Test cases for TurboPacer."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_never_waits(self):
+        """Test that ticks come in batches without any timeout."""
+        pacer = TurboPacer(clock=self.clock)
+        self.assertEqual(pacer.timeout(), 0.0)
+        self.assertEqual(pacer.due(), TURBO_BATCH)
+        self.assertEqual(TurboPacer(render_every=500, clock=self.clock).due(), 500)
+
+    def test_render_every(self):
+        """Test that every batch ends with a frame when counting ticks."""
+        pacer = TurboPacer(render_every=10, clock=self.clock)
+        self.assertTrue(all(pacer.frame_due(10 * i) for i in range(1, 50)))
+
+    def test_refresh_rate(self):
+        """Test that frames follow the wall clock, not the tick count."""
+        pacer = TurboPacer(refresh_hz=20, clock=self.clock)
+        frames = 0
+        for i in range(1000):
+            self.clock.now += 0.001
+            frames += pacer.frame_due(i * TURBO_BATCH)
+        self.assertEqual(frames, 20)
+
+    def test_stall_does_not_burst(self):
+        """Test that a long stall is followed by one frame, not a backlog."""
+        pacer = TurboPacer(refresh_hz=20, clock=self.clock)
+        self.clock.now += 2.0
+        self.assertTrue(pacer.frame_due(0))
+        self.assertFalse(pacer.frame_due(0))
+        self.assertAlmostEqual(pacer.jitter.max, 1.95)
+
+    def test_rate(self):
+        """Test the measured ticks per second."""
+        pacer = TurboPacer(render_every=1000, clock=self.clock)
+        for i in range(1, 11):
+            self.clock.now += 0.1
+            pacer.frame_due(1000 * i)
+        self.assertAlmostEqual(pacer.rate, 10000)
+
+
+if __name__ == '__main__':
+    unittest.main()
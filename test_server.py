@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test suite for the game server
+Runs the server and real socket clients in one event loop at a fast tick.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine
+from server import (
+    GameServer, LoadGenerator, MessageReader, TICK, END,
+    MSG_START, MSG_TICK, MSG_END, encode_start,
+)
+
+# Fast levels so games finish in well under a second
+LEVELS = {
+    'NORMAL': {'speed': 5, 'food_value': 1},
+    'HARD': {'speed': 4, 'food_value': 2},
+}
+
+
+async def play(connect, hello, commands=b'', after=0):
+    """Connect, send ``commands`` after ``after`` ticks, read until the end."""
+    reader, writer = await connect()
+    writer.write(hello)
+    parser = MessageReader()
+    messages = []
+    sent = False
+    while not messages or messages[-1][0] != MSG_END:
+        data = await asyncio.wait_for(reader.read(4096), 5)
+        if not data:
+            break
+        messages += parser.feed(data)
+        ticks = sum(1 for m in messages if m[0] == MSG_TICK)
+        if commands and not sent and ticks >= after:
+            writer.write(commands)
+            sent = True
+    writer.close()
+    return messages
+
+
+class TestMessageReader(unittest.TestCase):
+    """Test cases for the client-side message parser."""
+
+    def test_split_messages(self):
+        """Test that messages fed one byte at a time are reassembled."""
+        game = SnakeEngine(24, 80, seed=3)
+        data = (encode_start(game) + TICK.pack(MSG_TICK, 1, 5, 6, -1, 0)
+                + END.pack(MSG_END, 1, 0, 1))
+        parser = MessageReader()
+        messages = []
+        for i in range(len(data)):
+            messages += parser.feed(data[i:i + 1])
+        self.assertEqual([m[0] for m in messages], [MSG_START, MSG_TICK, MSG_END])
+        self.assertEqual(messages[0][-1], tuple(game.body))
+        self.assertEqual(messages[1], (MSG_TICK, 1, 5, 6, -1, 0))
+
+    def test_unknown_kind(self):
+        """Test that an unknown message kind raises ValueError."""
+        with self.assertRaises(ValueError):
+            MessageReader().feed(b'\x09')
+
+
+class TestGameServer(unittest.TestCase):
+    """Test cases for GameServer sessions."""
+
+    def run_server(self, scenario):
+        """Run ``scenario(server, connect)`` against a fresh server on a free port."""
+        async def main():
+            server = GameServer(levels=LEVELS)
+            listener = await server.listen_tcp('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                return await scenario(server, lambda: asyncio.open_connection('127.0.0.1', port))
+            finally:
+                server.close()
+        return asyncio.run(main())
+
+    def test_game_matches_engine(self):
+        """Test that every message matches a local engine with the same seed."""
+        async def scenario(server, connect):
+            return await play(connect, b'NORMAL 42\n')
+        messages = self.run_server(scenario)
+        game = SnakeEngine(24, 80, seed=42)
+        start = messages[0]
+        self.assertEqual(start[:4], (MSG_START, 24, 80, 42))
+        self.assertEqual(start[-1], tuple(game.body))
+        for message in messages[1:-1]:
+            self.assertTrue(game.step())
+            removed = -1 if game.removed is None else game.removed
+            food = -1 if game.food is None else game.food
+            self.assertEqual(message, (MSG_TICK, game.ticks, game.head, removed, food, game.score))
+        self.assertFalse(game.step())
+        self.assertEqual(messages[-1], (MSG_END, game.ticks, game.score, 1))
+
+    def test_turn(self):
+        """Test that a turn command changes the head's direction."""
+        async def scenario(server, connect):
+            return await play(connect, b'\n', b'd', after=2)
+        messages = self.run_server(scenario)
+        heads = [m[2] for m in messages if m[0] == MSG_TICK]
+        steps = {b - a for a, b in zip(heads, heads[1:])}
+        self.assertEqual(steps, {1, 80})
+        self.assertEqual(messages[-1][3], 1)
+
+    def test_quit(self):
+        """Test that 'q' ends the game early as a quit."""
+        async def scenario(server, connect):
+            return await play(connect, b'\n', b'q', after=1)
+        messages = self.run_server(scenario)
+        self.assertEqual(messages[-1][0], MSG_END)
+        self.assertEqual(messages[-1][3], 0)
+        self.assertLess(messages[-1][1], 50)
+
+    def test_sessions_share_scheduler(self):
+        """Test that sessions at the same speed share one scheduler."""
+        async def scenario(server, connect):
+            results = await asyncio.gather(*(play(connect, f'NORMAL {i}\n'.encode())
+                                             for i in range(20)),
+                                           play(connect, b'HARD 1\n'))
+            return server, results
+        server, results = self.run_server(scenario)
+        self.assertEqual(sorted(server.schedulers), [4, 5])
+        self.assertEqual(server.games, 21)
+        self.assertEqual(server.schedulers[5].ticks,
+                         max(r[-1][1] for r in results[:20]))
+        self.assertTrue(all(r[-1][0] == MSG_END for r in results))
+
+    def test_bad_hello(self):
+        """Test that an unknown difficulty closes the connection."""
+        async def scenario(server, connect):
+            return await play(connect, b'IMPOSSIBLE\n')
+        self.assertEqual(self.run_server(scenario), [])
+
+    def test_seed_out_of_range(self):
+        """Test that a hello seed outside 0..2**63 - 1 closes the connection."""
+        async def scenario(server, connect):
+            return [await play(connect, hello)
+                    for hello in (b'NORMAL -1 mallory\n', f'NORMAL {2 ** 63}\n'.encode())]
+        self.assertEqual(self.run_server(scenario), [[], []])
+
+    def test_load_generator(self):
+        """Test that the load generator completes games against the server."""
+        async def scenario(server, connect):
+            loop = asyncio.get_running_loop()
+            port = server.servers[0].sockets[0].getsockname()[1]
+            load = LoadGenerator(50, 'NORMAL',
+                                 lambda f: loop.create_connection(f, '127.0.0.1', port))
+            rate = await load.run(0.3)
+            await asyncio.sleep(0.05)
+            return rate
+        self.assertGreater(self.run_server(scenario), 0)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets not available")
+    def test_unix_socket(self):
+        """Test a full game over a Unix domain socket."""
+        async def main():
+            server = GameServer(levels=LEVELS)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "snake.sock")
+                await server.listen_unix(path)
+                try:
+                    return await play(lambda: asyncio.open_unix_connection(path), b'NORMAL 7\n')
+                finally:
+                    server.close()
+        messages = asyncio.run(main())
+        self.assertEqual(messages[0][0], MSG_START)
+        self.assertEqual(messages[-1][0], MSG_END)
+
+
+if __name__ == "__main__":
+    unittest.main()
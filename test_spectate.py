@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Test suite for the spectator stream
+Checks that decoders rebuild the game exactly from deltas and keyframes,
+and that broadcasting shares frames between subscribers.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine, DIRECTIONS, EMPTY, BODY, HEAD, FOOD
+from rng import GameRng
+from server import GameServer, MessageReader, MSG_END
+from spectate import (
+    Broadcaster, SpectatorDecoder, SpectatorEncoder, KEYFRAME, DELTA, END,
+)
+
+
+def random_turn(rng):
+    """A random direction one tick in four, else None."""
+    return DIRECTIONS[rng.below(4)] if rng.below(4) == 0 else None
+
+
+class Sink:
+    """Subscriber that records what it was sent."""
+
+    def __init__(self, buffered=0):
+        self.frames = []
+        self.closed = False
+        self.buffered = buffered
+
+    def write(self, frame):
+        self.frames.append(frame)
+
+    def close(self):
+        self.closed = True
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+
+class TestEncoding(unittest.TestCase):
+    """Round trips through SpectatorEncoder and SpectatorDecoder."""
+
+    def check_same(self, decoder, game):
+        """Assert that the decoder's view matches the game."""
+        self.assertEqual(list(decoder.body), list(game.body))
+        self.assertEqual((decoder.food, decoder.score, decoder.tick),
+                         (game.food, game.score, game.ticks))
+
+    def test_round_trip(self):
+        """Test that a decoder follows whole games frame by frame."""
+        for seed in range(10):
+            game = SnakeEngine(12, 20, seed=seed)
+            encoder = SpectatorEncoder(game, keyframe_interval=25)
+            decoder = SpectatorDecoder()
+            decoder.feed(encoder.keyframe())
+            self.check_same(decoder, game)
+            turns = GameRng(seed)
+            while game.step(random_turn(turns)):
+                decoder.feed(encoder.frame())
+                self.check_same(decoder, game)
+            decoder.feed(encoder.frame())
+            self.assertTrue(decoder.over)
+            self.assertEqual(decoder.death, game.death)
+
+    def test_deltas_are_small(self):
+        """Test that a plain move is two bytes and eating stays under six."""
+        game = SnakeEngine(24, 80, seed=1)
+        encoder = SpectatorEncoder(game)
+        game.step()
+        frame = encoder.frame()
+        self.assertEqual(frame, bytes((DELTA, game.direction)))
+        # Eating moves the food and changes the score
+        game.place_food(game.head + 1)
+        game.step()
+        frame = encoder.frame()
+        self.assertEqual(frame[0], DELTA)
+        self.assertLessEqual(len(frame), 5)
+
+    def test_keyframe_interval(self):
+        """Test that a keyframe is sent every keyframe_interval ticks."""
+        game = SnakeEngine(24, 80, seed=1)
+        encoder = SpectatorEncoder(game, keyframe_interval=10)
+        kinds = []
+        for _ in range(30):
+            game.step()
+            kinds.append(encoder.frame()[0])
+        self.assertEqual([i for i, k in enumerate(kinds) if k == KEYFRAME], [9, 19, 29])
+
+    def test_late_join_and_byte_by_byte(self):
+        """Test that a late decoder syncs on a keyframe from single bytes."""
+        game = SnakeEngine(24, 80, seed=4)
+        encoder = SpectatorEncoder(game, keyframe_interval=7)
+        stream = b''
+        while game.ticks < 40 and game.step():
+            stream += encoder.frame()
+        decoder = SpectatorDecoder()
+        for i in range(len(stream)):
+            decoder.feed(stream[i:i + 1])
+        self.assertTrue(decoder.synced)
+        self.check_same(decoder, game)
+
+    def test_changes(self):
+        """Test that the decoder's cell changes rebuild the board."""
+        game = SnakeEngine(24, 80, seed=4)
+        encoder = SpectatorEncoder(game)
+        decoder = SpectatorDecoder()
+        decoder.feed(encoder.keyframe())
+        screen = {}
+        for _ in range(20):
+            game.step()
+            decoder.feed(encoder.frame())
+        for cell, content in decoder.changes:
+            screen[cell] = content
+        for cell, content in screen.items():
+            self.assertEqual(content, game.grid[cell])
+        self.assertIn(HEAD, screen.values())
+        self.assertIn(FOOD, screen.values())
+        self.assertIn(EMPTY, screen.values())
+        self.assertIn(BODY, screen.values())
+
+
+class TestBroadcaster(unittest.TestCase):
+    """Test cases for Broadcaster."""
+
+    def test_shares_frames(self):
+        """Test that every subscriber gets the same frame objects."""
+        game = SnakeEngine(24, 80, seed=2)
+        encoder = SpectatorEncoder(game)
+        broadcaster = Broadcaster()
+        sinks = [Sink() for _ in range(3)]
+        for sink in sinks:
+            broadcaster.subscribe(sink)
+        broadcaster.publish(encoder.keyframe())
+        game.step()
+        broadcaster.publish(encoder.frame())
+        for sink in sinks[1:]:
+            for mine, theirs in zip(sink.frames, sinks[0].frames):
+                self.assertIs(mine, theirs)
+        broadcaster.close()
+        self.assertTrue(all(sink.closed for sink in sinks))
+
+    def test_backlog_syncs_late_subscriber(self):
+        """Test that a late subscriber gets the frames since the last keyframe."""
+        game = SnakeEngine(24, 80, seed=2)
+        encoder = SpectatorEncoder(game, keyframe_interval=5)
+        broadcaster = Broadcaster()
+        broadcaster.publish(encoder.frame())  # no keyframe yet: not kept
+        broadcaster.publish(encoder.keyframe())
+        for _ in range(12):
+            game.step()
+            broadcaster.publish(encoder.frame())
+        self.assertEqual(broadcaster.backlog[0][0], KEYFRAME)
+        self.assertEqual(len(broadcaster.backlog), 3)
+        sink = Sink()
+        broadcaster.subscribe(sink)
+        decoder = SpectatorDecoder()
+        decoder.feed(b''.join(sink.frames))
+        self.assertEqual(list(decoder.body), list(game.body))
+
+    def test_drops_slow_subscriber(self):
+        """Test that a subscriber with a full buffer is dropped."""
+        broadcaster = Broadcaster(max_buffer=100)
+        fast, slow = Sink(), Sink(buffered=1000)
+        broadcaster.subscribe(fast)
+        broadcaster.subscribe(slow)
+        broadcaster.publish(bytes((END, 0, 0)))
+        self.assertTrue(slow.closed)
+        self.assertEqual(len(broadcaster), 1)
+        self.assertEqual(broadcaster.dropped, 1)
+
+
+class TestServerSpectators(unittest.TestCase):
+    """Spectators watching a game hosted by GameServer."""
+
+    def test_watch(self):
+        """Test that several spectators see the game end as the player did."""
+        levels = {'NORMAL': {'speed': 5, 'food_value': 1}}
+
+        async def main():
+            server = GameServer(levels=levels)
+            listener = await server.listen_tcp('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(b'NORMAL 5\n')
+                parser = MessageReader()
+                start = []
+                while not start:
+                    start = parser.feed(await reader.read(4096))
+                game_id = start[0][4]
+
+                async def watch():
+                    r, w = await asyncio.open_connection('127.0.0.1', port)
+                    w.write(f'WATCH {game_id}\n'.encode())
+                    decoder = SpectatorDecoder()
+                    while not decoder.over:
+                        data = await asyncio.wait_for(r.read(4096), 5)
+                        if not data:
+                            break
+                        decoder.feed(data)
+                    w.close()
+                    return decoder
+
+                watchers = [asyncio.ensure_future(watch()) for _ in range(3)]
+                messages = start
+                while messages[-1][0] != MSG_END:
+                    messages += parser.feed(await asyncio.wait_for(reader.read(4096), 5))
+                writer.close()
+                return messages, await asyncio.gather(*watchers)
+            finally:
+                server.close()
+
+        messages, decoders = asyncio.run(main())
+        game = SnakeEngine(24, 80, seed=5)
+        while game.step():
+            pass
+        for decoder in decoders:
+            self.assertTrue(decoder.over)
+            self.assertEqual(decoder.death, game.death)
+            self.assertEqual(decoder.tick, game.ticks)
+            self.assertEqual(decoder.score, game.score)
+            self.assertEqual(list(decoder.body), list(game.body))
+
+
+if __name__ == "__main__":
+    unittest.main()
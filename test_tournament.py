@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test suite for the tournament runner
+Checks policy resolution, determinism and aggregation.
+"""
+
+import argparse
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import tournament
+
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the tournament runner."""
+
+    def test_resolve_policy(self):
+        """Test built-in names, module:function specs and bad specs."""
+        self.assertIs(tournament.resolve_policy('greedy'), tournament.greedy_policy)
+        self.assertIs(tournament.resolve_policy('tournament:straight_policy'),
+                      tournament.straight_policy)
+        with self.assertRaises(ValueError):
+            tournament.resolve_policy('nope')
+
+    def test_results_independent_of_workers(self):
+        """Test that per-seed results do not depend on the worker count."""
+        args = (['greedy', 'straight'], range(12))
+        serial = tournament.run_tournament(*args, height=12, width=24, workers=1, chunk_size=5)
+        pooled = tournament.run_tournament(*args, height=12, width=24, workers=2, chunk_size=3)
+        self.assertEqual(serial, pooled)
+        self.assertEqual([r['seed'] for r in serial['greedy']], list(range(12)))
+
+    def test_max_ticks_caps_games(self):
+        """Test that games stop at the tick limit."""
+        result = tournament.play_game(tournament.greedy_policy, 0, 12, 24, 5)
+        self.assertEqual(result['ticks'], 5)
+        self.assertIsNone(result['death'])
+
+    def test_summarize(self):
+        """Test aggregated statistics."""
+        records = [
+            {'seed': 0, 'score': 2, 'length': 5, 'ticks': 10, 'death': 'wall'},
+            {'seed': 1, 'score': 4, 'length': 7, 'ticks': 30, 'death': 'self'},
+            {'seed': 2, 'score': 0, 'length': 3, 'ticks': 20, 'death': None},
+        ]
+        summary = tournament.summarize(records)
+        self.assertEqual(summary['games'], 3)
+        self.assertEqual(summary['score_mean'], 2)
+        self.assertEqual(summary['score_max'], 4)
+        self.assertEqual(summary['ticks_total'], 60)
+        self.assertEqual(summary['deaths'], {'wall': 1, 'self': 1, 'timeout': 1})
+
+    def test_parse_seeds(self):
+        """Test seed range parsing."""
+        self.assertEqual(tournament.parse_seeds('3:6'), range(3, 6))
+        self.assertEqual(tournament.parse_seeds('7'), range(7, 8))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            tournament.parse_seeds('5:5')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test suite for leaderboard replay verification
+Plays seeded games with random turns, submits honest and tampered claims
+and checks which are accepted and where the rejected ones diverged.
+"""
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import DIRECTIONS, DEATH_WALL, DEATH_SELF
+from highscores import HighScores
+from replay import Replay, fast_forward
+from rng import GameRng
+from verify import verify, verify_many, verify_submission, accept, read_submissions
+
+
+def random_replay(seed, max_ticks=500):
+    """Play a seeded game with random turns and return its replay."""
+    replay = Replay(seed, 12, 20, 'NORMAL')
+    game = replay.new_game()
+    turns = GameRng(seed)
+    while game.ticks < max_ticks:
+        direction = DIRECTIONS[turns.below(4)] if turns.below(3) == 0 else None
+        if direction is not None:
+            replay.record(game.ticks, direction)
+        if not game.step(direction):
+            break
+    replay.end_tick = game.ticks
+    return replay
+
+
+def honest_submission(seed, max_ticks=500):
+    """A submission dict with truthful claims for a random game."""
+    replay = random_replay(seed, max_ticks)
+    game = fast_forward(replay)
+    return {'player': f"p{seed}", 'score': game.score, 'death': game.death,
+            'ticks': game.ticks, 'replay': replay.encode()}
+
+
+class TestVerify(unittest.TestCase):
+    """Test cases for verify()."""
+
+    def test_honest_games_are_accepted(self):
+        """Test that truthful claims are accepted with the final tick and length."""
+        for seed in range(30):
+            replay = random_replay(seed)
+            game = fast_forward(replay)
+            verdict = verify(replay, game.score, game.death, game.ticks)
+            self.assertTrue(verdict.ok, verdict.reason)
+            self.assertEqual(verdict.tick, game.ticks)
+            self.assertEqual(verdict.length, len(game))
+
+    def test_quit_games_are_accepted(self):
+        """Test that a game quit while alive is accepted with death None."""
+        replay = random_replay(1, max_ticks=3)
+        game = fast_forward(replay)
+        self.assertTrue(game.alive)
+        self.assertTrue(verify(replay, game.score, None).ok)
+        self.assertFalse(verify(replay, game.score, DEATH_WALL).ok)
+
+    def test_wrong_score_is_rejected(self):
+        """Test that a score that differs from the replay is rejected."""
+        replay = random_replay(2)
+        game = fast_forward(replay)
+        verdict = verify(replay, game.score + 1, game.death)
+        self.assertFalse(verdict.ok)
+        if game.score:
+            self.assertFalse(verify(replay, game.score - 1, game.death).ok)
+
+    def test_wrong_death_is_rejected(self):
+        """Test that a wrong cause of death is rejected."""
+        replay = random_replay(3)
+        game = fast_forward(replay)
+        self.assertIsNotNone(game.death)
+        other = DEATH_SELF if game.death == DEATH_WALL else DEATH_WALL
+        self.assertFalse(verify(replay, game.score, other).ok)
+        self.assertFalse(verify(replay, game.score, None).ok)
+
+    def test_early_death_aborts_at_the_death_tick(self):
+        """Test that a claim past the snake's death stops at the death tick."""
+        replay = random_replay(4)
+        died_at = fast_forward(replay).ticks
+        score = fast_forward(replay).score
+        replay.end_tick = died_at + 1000
+        verdict = verify(replay, score, DEATH_WALL)
+        self.assertFalse(verdict.ok)
+        self.assertEqual(verdict.tick, died_at)
+
+    def test_unreachable_score_aborts_at_once(self):
+        """Test that an impossible score is rejected before simulating."""
+        replay = Replay(5, 12, 20, 'NORMAL', [], end_tick=100)
+        verdict = verify(replay, 1000, DEATH_WALL)
+        self.assertFalse(verdict.ok)
+        self.assertEqual(verdict.tick, 0)
+        self.assertIn("out of reach", verdict.reason)
+
+    def test_malformed_turn_logs_are_rejected(self):
+        """Test that unordered, late or miscounted turns are rejected."""
+        self.assertFalse(verify(Replay(6, 12, 20, 'NORMAL', [(5, 0), (3, 2)], 10), 0, None).ok)
+        self.assertFalse(verify(Replay(6, 12, 20, 'NORMAL', [(5, 0), (5, 2)], 10), 0, None).ok)
+        self.assertFalse(verify(Replay(6, 12, 20, 'NORMAL', [(10, 0)], 10), 0, None).ok)
+        self.assertFalse(verify(Replay(6, 12, 20, 'NORMAL', [], 10), 0, None, ticks=11).ok)
+
+    def test_boards_smaller_than_a_terminal_are_rejected(self):
+        """Test that boards the game cannot produce are rejected."""
+        verdict = verify(Replay(1, 5, 6, 'NORMAL', [], 1), 0, None)
+        self.assertEqual(verdict.reason, "board size out of range")
+        self.assertFalse(verify(Replay(1, 10, 19, 'NORMAL', [], 1), 0, None).ok)
+
+    def test_bad_replay_bytes_are_rejected(self):
+        """Test that undecodable replay bytes are rejected."""
+        verdict = verify_submission({'score': 0, 'death': None, 'replay': b"junk"})
+        self.assertFalse(verdict.ok)
+        self.assertIn("bad replay", verdict.reason)
+
+    def test_malformed_submissions_are_rejected(self):
+        """Test that bad fields give a rejection instead of an exception."""
+        good = honest_submission(3)
+        huge_seed = Replay(2 ** 64 - 1, 12, 20, 'NORMAL', [], 1).encode()
+        bad = [
+            dict(good, score=-1), dict(good, score='7'), dict(good, score=True),
+            dict(good, score=None), {k: v for k, v in good.items() if k != 'score'},
+            dict(good, death='lava'), dict(good, death=['wall']), dict(good, ticks=1.5),
+            {k: v for k, v in good.items() if k != 'player'},
+            dict(good, replay=huge_seed, score=0, death=None, ticks=1),
+            ['not', 'a', 'dict'],
+        ]
+        verdicts = list(verify_many(bad + [good], workers=1))
+        self.assertEqual([v.ok for v in verdicts], [False] * len(bad) + [True])
+        self.assertIn("seed out of range", verdicts[len(bad) - 2].reason)
+
+    def test_lines_that_are_not_json_are_rejected(self):
+        """Test that a line that is not JSON is rejected with its line number."""
+        good = honest_submission(3)
+        line = json.dumps(dict(good, replay=base64.b64encode(good['replay']).decode()))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "submissions.jsonl")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(f'{{"player": "a"}}\nnot json\n\n{line}\n')
+            verdicts = list(verify_many(read_submissions(path), workers=1))
+        self.assertEqual([v.ok for v in verdicts], [False, False, True])
+        self.assertTrue(verdicts[1].reason.startswith("line 2 is not JSON"))
+
+
+class TestBatches(unittest.TestCase):
+    """Test cases for batch verification and recording."""
+
+    def setUp(self):
+        self.submissions = [honest_submission(seed) for seed in range(20)]
+        for submission in self.submissions[::4]:
+            submission['score'] += 5
+
+    def test_parallel_matches_serial(self):
+        """Test that pooled verification gives the serial verdicts in order."""
+        serial = list(verify_many(self.submissions, workers=1, chunk_size=3))
+        parallel = list(verify_many(self.submissions, workers=2, chunk_size=3))
+        self.assertEqual(serial, parallel)
+        self.assertEqual([v.ok for v in serial], [i % 4 != 0 for i in range(20)])
+
+    def test_accept_records_only_verified_games(self):
+        """Test that only accepted submissions are recorded."""
+        verdicts = list(verify_many(self.submissions, workers=1))
+        with tempfile.TemporaryDirectory() as folder:
+            with HighScores(os.path.join(folder, "scores.db")) as scores:
+                ids = accept(scores, self.submissions, verdicts)
+                self.assertEqual(len(ids), 15)
+                players = {row['player'] for row in scores.games()}
+        self.assertEqual(players, {f"p{i}" for i in range(20) if i % 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
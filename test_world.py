@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test suite for the huge-world engine and the camera
+Checks WorldEngine against SnakeEngine's rules and the scrolling view.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engine import SnakeEngine, DIRECTIONS, UP, DOWN, LEFT, RIGHT, EMPTY, BODY, HEAD, FOOD, WALL
+from render import Camera, Renderer
+from rng import GameRng
+from world import CellRing, WorldEngine
+
+
+class TestCellRing(unittest.TestCase):
+    """Test cases for CellRing."""
+
+    def test_deque_operations(self):
+        """Test appends, pops and indexing from both ends."""
+        ring = CellRing(capacity=4)
+        for cell in (1, 2, 3):
+            ring.append(cell)
+        ring.appendleft(0)
+        self.assertEqual(list(ring), [0, 1, 2, 3])
+        self.assertEqual(ring[0], 0)
+        self.assertEqual(ring[-1], 3)
+        self.assertEqual(ring.pop(), 3)
+        ring.appendleft(9)
+        self.assertEqual(list(ring), [9, 0, 1, 2])
+        with self.assertRaises(IndexError):
+            ring[4]
+
+    def test_grows_when_full(self):
+        """Test that the ring doubles its capacity and keeps its order."""
+        ring = CellRing(capacity=2)
+        for cell in range(100):
+            ring.appendleft(cell)
+            if cell % 3 == 0:
+                ring.pop()
+                ring.append(cell + 1000)
+        self.assertEqual(len(ring), 100)
+        self.assertEqual(ring[0], 99)
+        self.assertEqual(ring.nbytes(), 128 * 4)
+
+    def test_million_segments_fit_in_megabytes(self):
+        """Test that a million-cell body takes under 10 MB."""
+        ring = CellRing()
+        for cell in range(1000000):
+            ring.appendleft(cell)
+        self.assertLess(ring.nbytes(), 10 * 1024 * 1024)
+
+
+class TestWorldEngine(unittest.TestCase):
+    """Test cases for WorldEngine."""
+
+    def test_same_rules_as_snake_engine(self):
+        """Test that moves, scores and deaths match SnakeEngine."""
+        for seed in range(20):
+            plain = SnakeEngine(12, 20, seed=seed)
+            world = WorldEngine(12, 20, seed=seed)
+            turns = GameRng(seed + 1000)
+            while plain.alive and plain.ticks < 500:
+                direction = DIRECTIONS[turns.below(4)] if turns.below(3) == 0 else None
+                self.assertEqual(plain.step(direction), world.step(direction))
+                self.assertEqual(list(plain.body), list(world.body))
+                self.assertEqual((plain.score, plain.ate, plain.removed, plain.death),
+                                 (world.score, world.ate, world.removed, world.death))
+                if world.ate and world.food is not None:
+                    # Food placement differs by design; follow the world's
+                    if plain.food is not None:
+                        plain.grid[plain.food] = EMPTY
+                        plain.free.add(plain.food)
+                    plain.place_food(world.food)
+                for cell in range(12 * 20):
+                    self.assertEqual(plain.grid[cell], world.content(cell))
+
+    def test_wall_death(self):
+        """Test that running into the border is a wall death."""
+        game = WorldEngine(10, 10, seed=1)
+        while game.step(UP):
+            pass
+        self.assertEqual(game.death, 'wall')
+        self.assertEqual(game.pos(game.head)[0], 1)
+
+    def test_follows_tail(self):
+        """Test that the head may move into the cell the tail is leaving."""
+        game = WorldEngine(20, 20, seed=1)
+        # Grow to four cells, then circle so the head enters the tail's cell
+        game.food = game.head + 1
+        game.step(RIGHT)
+        for direction in (DOWN, LEFT, UP, RIGHT, DOWN, LEFT, UP):
+            self.assertTrue(game.step(direction))
+
+    def test_huge_world(self):
+        """Test a 10,000 x 10,000 world's memory use, moves and food."""
+        game = WorldEngine(10000, 10000, seed=7)
+        self.assertEqual(len(game.bits), 10000 * 10000 // 8)
+        for _ in range(1000):
+            game.step()
+        self.assertTrue(game.alive)
+        cell = game.spawn_food()
+        self.assertEqual(game.content(cell), FOOD)
+
+    def test_spawn_food_fallback(self):
+        """Test that a nearly full world still finds the last free cell."""
+        game = WorldEngine(10, 10, seed=3)
+        # Fill all but one eligible cell
+        cells = list(game.free_cells())
+        last = cells.pop()
+        for cell in cells:
+            game.set(cell)
+        self.assertEqual(game.spawn_food(), last)
+        game.set(last)
+        self.assertIsNone(game.spawn_food())
+
+    def test_rejects_oversized_world(self):
+        """Test that worlds beyond 32-bit cell indices are refused."""
+        with self.assertRaises(ValueError):
+            WorldEngine(70000, 70000)
+
+
+class RecordingRenderer(Renderer):
+    """Renderer that keeps the whole screen instead of writing it."""
+
+    def __init__(self, height, width):
+        super().__init__(height, width)
+        self.screen = [[' '] * width for _ in range(height)]
+
+    def flush(self):
+        for (y, x), ch in self.cells.items():
+            self.screen[y][x] = ch
+        self.cells.clear()
+        self.texts.clear()
+
+
+class TestCamera(unittest.TestCase):
+    """Test cases for the scrolling Camera."""
+
+    def setUp(self):
+        self.game = WorldEngine(200, 300, seed=5)
+        self.renderer = RecordingRenderer(12, 40)
+        self.camera = Camera(self.renderer, 2, 10, 40)
+
+    def check_screen(self):
+        """Assert that the visible screen matches the world under the camera."""
+        camera, game = self.camera, self.game
+        glyphs = Camera.GLYPHS
+        for sy in range(camera.height):
+            for sx in range(camera.width):
+                expected = glyphs[game.content(game.cell(camera.y + sy, camera.x + sx))]
+                self.assertEqual(self.renderer.screen[camera.top + sy][sx], expected)
+
+    def test_follows_head(self):
+        """Test that the camera keeps the head in view as it jumps."""
+        self.camera.draw_board(self.game)
+        self.renderer.flush()
+        self.check_screen()
+        for _ in range(150):
+            self.game.step()
+            self.camera.draw_tick(self.game)
+            self.renderer.flush()
+            hy, hx = self.game.pos(self.game.head)
+            self.assertTrue(0 <= hx - self.camera.x < self.camera.width)
+            self.assertTrue(0 <= hy - self.camera.y < self.camera.height)
+        self.check_screen()
+        self.assertGreater(self.camera.jumps, 3)
+
+    def test_jump_redraws_changed_cells_only(self):
+        """Test that a jump redraws only the cells whose glyph changed."""
+        self.camera.draw_board(self.game)
+        self.renderer.flush()
+        jumps = self.camera.jumps
+        while True:
+            self.renderer.flush()
+            self.game.step()
+            self.camera.draw_tick(self.game)
+            if self.camera.jumps != jumps:
+                break
+        # Only the snake moving across the screen changes on an empty world
+        self.assertLess(len(self.renderer.cells), 10)
+        self.renderer.flush()
+        self.check_screen()
+
+    def test_world_edge(self):
+        """Test that the camera stops at the world's edge and shows its walls."""
+        game = WorldEngine(30, 30, seed=1)
+        camera = Camera(self.renderer, 2, 10, 40)
+        camera.draw_board(game)
+        self.renderer.flush()
+        self.assertEqual(camera.x, 0)
+        self.assertEqual(self.renderer.screen[2 + game.pos(game.head)[0] - camera.y][0], '+')
+        self.assertEqual(self.renderer.screen[2][35], ' ')
+        self.assertEqual(Camera.GLYPHS[WALL], '+')
+        self.assertIn(HEAD, Camera.GLYPHS)
+        self.assertIn(BODY, Camera.GLYPHS)
+
+
+if __name__ == "__main__":
+    unittest.main()
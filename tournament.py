@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tournament runner for Snake Game autopilot policies
+Plays every policy over a range of seeds on all CPU cores and prints
+aggregated score, length and tick statistics.
+
+A policy is any callable taking a SnakeEngine and returning a direction
+(or None to keep going). Policies are given either as a built-in name or
+as ``module:function``. Results depend only on the seed, never on the
+number of workers: food placement uses the game's own seeded generator.
+
+Usage: python tournament.py greedy mybot:policy --seeds 0:1000 --workers 8
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from autopilot import autopilot_policy
+from engine import SnakeEngine, DIRECTIONS, OPPOSITE, EMPTY, FOOD
+
+DEFAULT_HEIGHT = 24
+DEFAULT_WIDTH = 80
+DEFAULT_MAX_TICKS = 100000
+DEFAULT_CHUNK_SIZE = 64
+
+
+def straight_policy(game):
+    """Never turn."""
+    return None
+
+
+def greedy_policy(game):
+    """Head for the food, avoiding moves that die on the next tick."""
+    tail = game.body[-1]
+    best = None
+    best_distance = None
+    for direction in DIRECTIONS:
+        if direction == OPPOSITE[game.direction]:
+            continue
+        cell = game.head + game.offsets[direction]
+        if game.grid[cell] not in (EMPTY, FOOD) and cell != tail:
+            continue
+        if game.food is None:
+            return direction
+        y, x = game.pos(cell)
+        food_y, food_x = game.pos(game.food)
+        distance = abs(food_y - y) + abs(food_x - x)
+        if best is None or distance < best_distance:
+            best, best_distance = direction, distance
+    return best
+
+
+POLICIES = {
+    'straight': straight_policy,
+    'greedy': greedy_policy,
+    'autopilot': autopilot_policy,
+}
+
+
+def resolve_policy(spec):
+    """Return the policy callable for a built-in name or ``module:function``."""
+    if spec in POLICIES:
+        return POLICIES[spec]
+    module_name, _, attr = spec.partition(':')
+    if not attr:
+        raise ValueError(f"Unknown policy '{spec}' (expected a built-in name or module:function)")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def play_game(policy, seed, height, width, max_ticks):
+    """Play one seeded game to the end and return its result record."""
+    game = SnakeEngine(height, width, seed=seed)
+    step = game.step
+    while game.ticks < max_ticks and step(policy(game)):
+        pass
+    return {
+        'seed': seed,
+        'score': game.score,
+        'length': len(game),
+        'ticks': game.ticks,
+        'death': game.death,
+    }
+
+
+def run_chunk(spec, seeds, height, width, max_ticks):
+    """Worker entry point: play one policy over a chunk of seeds."""
+    policy = resolve_policy(spec)
+    return spec, [play_game(policy, seed, height, width, max_ticks) for seed in seeds]
+
+
+def run_tournament(specs, seeds, height=DEFAULT_HEIGHT, width=DEFAULT_WIDTH,
+                   max_ticks=DEFAULT_MAX_TICKS, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Play every policy over every seed and return {spec: [results by seed]}."""
+    seeds = list(seeds)
+    for spec in specs:
+        resolve_policy(spec)
+    chunks = [
+        (spec, seeds[i:i + chunk_size])
+        for spec in specs
+        for i in range(0, len(seeds), chunk_size)
+    ]
+    results = {spec: [] for spec in specs}
+    if workers == 1:
+        done = (run_chunk(spec, chunk, height, width, max_ticks) for spec, chunk in chunks)
+        for spec, records in done:
+            results[spec].extend(records)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(run_chunk, spec, chunk, height, width, max_ticks)
+                for spec, chunk in chunks
+            ]
+            for future in futures:
+                spec, records = future.result()
+                results[spec].extend(records)
+    return results
+
+
+def summarize(records):
+    """Aggregate a list of game records into summary statistics."""
+    scores = [r['score'] for r in records]
+    deaths = {}
+    for r in records:
+        deaths[r['death'] or 'timeout'] = deaths.get(r['death'] or 'timeout', 0) + 1
+    return {
+        'games': len(records),
+        'score_mean': statistics.mean(scores),
+        'score_median': statistics.median(scores),
+        'score_stdev': statistics.pstdev(scores),
+        'score_min': min(scores),
+        'score_max': max(scores),
+        'length_mean': statistics.mean(r['length'] for r in records),
+        'ticks_mean': statistics.mean(r['ticks'] for r in records),
+        'ticks_total': sum(r['ticks'] for r in records),
+        'deaths': deaths,
+    }
+
+
+def parse_seeds(text):
+    """Parse a seed range such as ``0:1000`` (end exclusive) or ``42``."""
+    if ':' in text:
+        start, end = text.split(':', 1)
+        seeds = range(int(start), int(end))
+    else:
+        seeds = range(int(text), int(text) + 1)
+    if not seeds:
+        raise argparse.ArgumentTypeError(f"empty seed range '{text}'")
+    return seeds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Snake Game policy tournament")
+    parser.add_argument("policies", nargs="+",
+                        help=f"built-in policy ({', '.join(POLICIES)}) or module:function")
+    parser.add_argument("--seeds", type=parse_seeds, default=parse_seeds("0:100"),
+                        help="seed range START:END (default 0:100)")
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="seeds per work unit")
+    parser.add_argument("--json", metavar="FILE", help="also write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_tournament(args.policies, args.seeds, args.height, args.width,
+                                 args.max_ticks, args.workers, args.chunk_size)
+    except (ValueError, ImportError, AttributeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    summary = {spec: summarize(records) for spec, records in results.items()}
+    print(f"{'policy':<20} {'games':>6} {'mean':>8} {'median':>7} {'max':>5} "
+          f"{'length':>7} {'ticks':>8}  deaths")
+    for spec, s in summary.items():
+        deaths = ", ".join(f"{k}={v}" for k, v in sorted(s['deaths'].items()))
+        print(f"{spec:<20} {s['games']:>6} {s['score_mean']:>8.2f} {s['score_median']:>7} "
+              f"{s['score_max']:>5} {s['length_mean']:>7.1f} {s['ticks_mean']:>8.1f}  {deaths}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Replay verification for Snake Game leaderboards
+Re-simulates a submitted game (seed, board, difficulty and turn log, as in
+a replay file) through the headless engine, following the same
+``step(direction)`` calls as ``snake_game.main``, and accepts the claimed
+score only if the simulation reproduces it.
+
+Verification stops at the first tick that cannot match the claim: a turn
+log that is out of order, a snake that dies before the claimed end, or a
+claimed score that the remaining ticks can no longer reach. Batches are
+verified on a process pool, and accepted games can be written straight to
+the high-score store.
+
+A submission is a dict with 'player', 'score', 'death' (None if the
+player quit), optional 'ticks', and 'replay' (the encoded replay bytes).
+On the command line, submissions are JSON lines with the replay in base64.
+
+Usage: python verify.py SUBMISSIONS.jsonl [--scores DB] [--workers N]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from analytics import bounded_map, chunked
+from config import DIFFICULTY_LEVELS, MIN_TERMINAL_HEIGHT, MIN_TERMINAL_WIDTH
+from engine import DEATH_SELF, DEATH_WALL
+from highscores import HighScores
+from replay import Replay, ReplayError
+from rng import SEED_LIMIT
+
+DEFAULT_CHUNK_SIZE = 64
+
+# Largest accepted board and game; anything bigger is rejected unplayed
+MAX_BOARD_CELLS = 1000 * 1000
+MAX_TICKS = 10000000
+
+# Accepted values of a submission's 'death'; None means the player quit
+DEATHS = (None, DEATH_WALL, DEATH_SELF)
+
+Verdict = namedtuple('Verdict', 'ok reason tick length')
+
+# Stands in for a line of a submissions file that is not JSON
+BadLine = namedtuple('BadLine', 'reason')
+
+
+def reject(reason, tick=None):
+    return Verdict(False, reason, tick, None)
+
+
+def verify(replay, score, death, ticks=None):
+    """Re-simulate ``replay`` and check it ends with ``score`` and ``death``.
+
+    Returns a Verdict; ``tick`` is where a rejected game diverged (None
+    when it was rejected before simulating).
+    """
+    end_tick = replay.end_tick
+    if ticks is not None and ticks != end_tick:
+        return reject("tick count does not match the replay")
+    if (replay.height < MIN_TERMINAL_HEIGHT or replay.width < MIN_TERMINAL_WIDTH
+            or replay.height * replay.width > MAX_BOARD_CELLS):
+        return reject("board size out of range")
+    if end_tick > MAX_TICKS:
+        return reject("game too long")
+    last = -1
+    for tick, _ in replay.events:
+        if tick <= last:
+            return reject("turn log out of order", tick)
+        if tick >= end_tick:
+            return reject("turn after the end of the game", tick)
+        last = tick
+
+    food_value = DIFFICULTY_LEVELS[replay.difficulty]['food_value']
+    if score > end_tick * food_value:
+        return reject("claimed score out of reach", 0)
+    game = replay.new_game()
+    step = game.step
+    # The claim is checked at every turn and at the end; a death is only
+    # allowed on the last tick
+    for tick, direction in replay.events + [(end_tick, None)]:
+        while game.ticks < tick and step():
+            pass
+        if not game.alive:
+            break
+        if game.score > score:
+            return reject("score above the claim", game.ticks)
+        if (score - game.score) > (end_tick - game.ticks) * food_value:
+            return reject("claimed score out of reach", game.ticks)
+        if tick < end_tick and not step(direction):
+            break
+    if game.ticks < end_tick:
+        return reject("snake died before the claimed end", game.ticks)
+
+    if game.score != score:
+        return reject("score does not match", game.ticks)
+    if death is None:
+        if not game.alive:
+            return reject("snake died, but the game was claimed as quit", game.ticks)
+    elif game.death != death:
+        return reject(f"death does not match ({game.death or 'alive'})", game.ticks)
+    return Verdict(True, None, game.ticks, len(game))
+
+
+def verify_submission(submission):
+    """Decode and verify one submission dict.
+
+    Never raises: a malformed submission gets a rejecting Verdict, so one
+    bad entry cannot stop a batch.
+    """
+    if isinstance(submission, BadLine):
+        return reject(submission.reason)
+    if not isinstance(submission, dict):
+        return reject("not a submission")
+    try:
+        replay = Replay.decode(submission['replay'])
+    except (ReplayError, KeyError, TypeError) as e:
+        return reject(f"bad replay: {e}")
+    if not isinstance(submission.get('player'), str):
+        return reject("missing player name")
+    # bool is an int subclass, but True is no score
+    score = submission.get('score')
+    if type(score) is not int or score < 0:
+        return reject("score must be a non-negative integer")
+    ticks = submission.get('ticks')
+    if ticks is not None and type(ticks) is not int:
+        return reject("ticks must be an integer")
+    death = submission.get('death')
+    if death not in DEATHS:
+        return reject(f"unknown death {death!r}")
+    if not 0 <= replay.seed < SEED_LIMIT:
+        return reject("seed out of range")
+    return verify(replay, score, death, ticks)
+
+
+def verify_chunk(submissions):
+    """Worker entry point: verify a list of submissions."""
+    return [verify_submission(s) for s in submissions]
+
+
+def verify_many(submissions, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield a Verdict for every submission, in order.
+
+    Submissions may be any iterable, including an endless generator; only
+    a bounded number of chunks is in flight at a time.
+    """
+    chunks = chunked(submissions, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from verify_chunk(chunk)
+        return
+    limit = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for verdicts in bounded_map(pool, verify_chunk, chunks, limit):
+            yield from verdicts
+
+
+def accept(scores, submissions, verdicts):
+    """Record the submissions whose verdicts passed; returns their ids."""
+    records = []
+    for submission, verdict in zip(submissions, verdicts):
+        if not verdict.ok:
+            continue
+        replay = Replay.decode(submission['replay'])
+        records.append({
+            'player': submission['player'],
+            'score': submission['score'],
+            'length': verdict.length,
+            'ticks': verdict.tick,
+            'difficulty': replay.difficulty,
+            'seed': replay.seed,
+            'death': submission.get('death'),
+        })
+    return scores.record_many(records) if records else []
+
+
+def read_submissions(path):
+    """Yield submissions from a JSON-lines file, decoding the replays.
+
+    Entries that are not valid submissions are passed on as they are, and
+    lines that are not JSON as a BadLine, for ``verify_submission()`` to
+    reject.
+    """
+    with open(path, encoding="utf-8") as fh:
+        for number, line in enumerate(fh, 1):
+            if line.strip():
+                try:
+                    submission = json.loads(line)
+                except ValueError as e:
+                    yield BadLine(f"line {number} is not JSON: {e}")
+                    continue
+                if isinstance(submission, dict) and isinstance(submission.get('replay'), str):
+                    try:
+                        submission['replay'] = base64.b64decode(submission['replay'])
+                    except ValueError:
+                        pass
+                yield submission
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify Snake Game score submissions")
+    parser.add_argument("submissions", help="JSON lines: player, score, death, replay (base64)")
+    parser.add_argument("--scores", metavar="DB", help="record accepted games in this database")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    try:
+        submissions = list(read_submissions(args.submissions))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    start = time.perf_counter()
+    verdicts = list(verify_many(submissions, args.workers))
+    elapsed = time.perf_counter() - start
+
+    reasons = Counter(v.reason for v in verdicts if not v.ok)
+    accepted = len(verdicts) - sum(reasons.values())
+    print(f"{len(verdicts)} submissions verified in {elapsed:.2f} s "
+          f"({len(verdicts) / max(elapsed, 1e-9):,.0f}/sec): {accepted} accepted")
+    for reason, count in reasons.most_common():
+        print(f"  rejected, {reason}: {count}")
+    if args.scores:
+        try:
+            with HighScores(args.scores) as scores:
+                ids = accept(scores, submissions, verdicts)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not save the scores: {e}")
+            sys.exit(1)
+        print(f"{len(ids)} games recorded in {args.scores}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Huge-world engine for Snake Game
+Plays the regular rules on boards far larger than the terminal, such as
+10,000 x 10,000, shown through a scrolling camera (see render.Camera).
+
+Occupancy is one bit per cell and the body is a ring buffer of 32-bit
+cell indices, so a million-segment snake needs about 4 MB. Food is placed
+by rejection sampling, which stays cheap as long as the world is mostly
+empty; a full scan takes over once sampling keeps failing.
+"""
+
+from array import array
+
+from config import (
+    FOOD_MARGIN,
+    INITIAL_SNAKE_LENGTH,
+    SCORE_INCREMENT,
+    SNAKE_START_X_RATIO,
+    SNAKE_START_Y_RATIO,
+)
+from engine import (
+    UP, DOWN, LEFT, RIGHT, OPPOSITE,
+    EMPTY, BODY, HEAD, FOOD, WALL,
+    DEATH_WALL, DEATH_SELF,
+)
+from rng import GameRng
+
+# Random draws tried before falling back to scanning for a free cell
+FOOD_RETRIES = 64
+
+# Cell indices are stored as 32-bit unsigned integers
+MAX_CELLS = 1 << 32
+
+
+class CellRing:
+    """Deque of cell indices in a circular ``array('I')``, head first.
+
+    Supports the deque operations the engine and renderers use. The
+    capacity is a power of two and doubles when the ring is full.
+    """
+
+    def __init__(self, capacity=64):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.data = array('I', bytes(4 * size))
+        self.mask = size - 1
+        self.start = 0
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("ring index out of range")
+        return self.data[(self.start + i) & self.mask]
+
+    def __iter__(self):
+        data, mask, start = self.data, self.mask, self.start
+        for i in range(self.length):
+            yield data[(start + i) & mask]
+
+    def grow(self):
+        """Double the capacity, unrolling the ring to the front."""
+        data = array('I', self)
+        data.extend(array('I', bytes(4 * len(self.data))))
+        self.data = data
+        self.mask = len(data) - 1
+        self.start = 0
+
+    def appendleft(self, cell):
+        """Add a new head."""
+        if self.length > self.mask:
+            self.grow()
+        self.start = (self.start - 1) & self.mask
+        self.data[self.start] = cell
+        self.length += 1
+
+    def append(self, cell):
+        """Add a cell behind the tail."""
+        if self.length > self.mask:
+            self.grow()
+        self.data[(self.start + self.length) & self.mask] = cell
+        self.length += 1
+
+    def pop(self):
+        """Remove and return the tail."""
+        if not self.length:
+            raise IndexError("pop from an empty ring")
+        self.length -= 1
+        return self.data[(self.start + self.length) & self.mask]
+
+    def nbytes(self):
+        return len(self.data) * self.data.itemsize
+
+
+class WorldEngine:
+    """Snake game state for worlds much larger than the screen.
+
+    Same rules, attributes and ``step()`` contract as ``SnakeEngine``,
+    except that there is no byte-per-cell ``grid``: ``bits`` holds one
+    occupancy bit per cell (snake body and border walls) and ``content()``
+    reports what a cell holds. Food placement uses the game's ``GameRng``
+    but a different algorithm, so a seed gives different food positions
+    than in ``SnakeEngine``.
+    """
+
+    def __init__(self, height, width, rng=None, food_value=SCORE_INCREMENT, seed=None):
+        if height * width >= MAX_CELLS:
+            raise ValueError(f"world too large: {width}x{height} exceeds {MAX_CELLS - 1} cells")
+        self.height = height
+        self.width = width
+        self.rng = rng if rng is not None else GameRng(seed)
+        self.food_value = food_value
+        self.offsets = {UP: -width, DOWN: width, LEFT: -1, RIGHT: 1}
+
+        # Border cells are walls
+        self.bits = bytearray((height * width + 7) >> 3)
+        for x in range(width):
+            self.set(x)
+            self.set((height - 1) * width + x)
+        for y in range(height):
+            self.set(y * width)
+            self.set(y * width + width - 1)
+
+        # Initialize snake heading right, head at the start position
+        start_y = height // SNAKE_START_Y_RATIO
+        start_x = width // SNAKE_START_X_RATIO
+        self.body = CellRing()
+        for i in range(INITIAL_SNAKE_LENGTH):
+            cell = self.cell(start_y, start_x - i)
+            self.body.append(cell)
+            self.set(cell)
+        self.direction = RIGHT
+
+        self.score = 0
+        self.ticks = 0
+        self.alive = True
+        self.death = None
+        self.ate = False
+        self.removed = None
+
+        # Initial food sits in the middle of the world
+        self.food = None
+        middle = self.cell(height // 2, width // 2)
+        if not self.occupied(middle):
+            self.food = middle
+        else:
+            self.spawn_food()
+
+    def cell(self, y, x):
+        """Return the cell index of a world position."""
+        return y * self.width + x
+
+    def pos(self, cell):
+        """Return the (y, x) world position of a cell index."""
+        return divmod(cell, self.width)
+
+    @property
+    def head(self):
+        """Cell index of the snake's head."""
+        return self.body[0]
+
+    def __len__(self):
+        return len(self.body)
+
+    def occupied(self, cell):
+        return self.bits[cell >> 3] >> (cell & 7) & 1
+
+    def set(self, cell):
+        self.bits[cell >> 3] |= 1 << (cell & 7)
+
+    def clear(self, cell):
+        self.bits[cell >> 3] &= ~(1 << (cell & 7))
+
+    def is_border(self, cell):
+        y, x = divmod(cell, self.width)
+        return y == 0 or x == 0 or y == self.height - 1 or x == self.width - 1
+
+    def content(self, cell):
+        """Return the engine cell code (EMPTY, BODY, ...) of a cell."""
+        if cell == self.food:
+            return FOOD
+        if not self.occupied(cell):
+            return EMPTY
+        if self.is_border(cell):
+            return WALL
+        return HEAD if cell == self.body[0] else BODY
+
+    def spawn_food(self):
+        """Place food on a random empty cell inside the food margin.
+
+        Returns the chosen cell, or None when no eligible cell is left.
+        """
+        rows = self.height - 2 * FOOD_MARGIN
+        cols = self.width - 2 * FOOD_MARGIN
+        if rows <= 0 or cols <= 0:
+            return None
+        below = self.rng.below
+        for _ in range(FOOD_RETRIES):
+            cell = (FOOD_MARGIN + below(rows)) * self.width + FOOD_MARGIN + below(cols)
+            if not self.occupied(cell):
+                self.food = cell
+                return cell
+
+        # Nearly full: pick uniformly among the free cells that are left
+        free = self.free_cells()
+        count = sum(1 for _ in free)
+        if not count:
+            return None
+        pick = below(count)
+        for i, cell in enumerate(self.free_cells()):
+            if i == pick:
+                self.food = cell
+                return cell
+
+    def free_cells(self):
+        """Iterate over the empty cells inside the food margin."""
+        width = self.width
+        for y in range(FOOD_MARGIN, self.height - FOOD_MARGIN):
+            row = y * width
+            for cell in range(row + FOOD_MARGIN, row + width - FOOD_MARGIN):
+                if not self.occupied(cell):
+                    yield cell
+
+    def step(self, direction=None):
+        """Advance the game by one tick; see ``SnakeEngine.step``."""
+        if not self.alive:
+            return False
+        if direction is not None and direction != OPPOSITE[self.direction]:
+            self.direction = direction
+
+        bits = self.bits
+        body = self.body
+        new_head = body[0] + self.offsets[self.direction]
+        self.removed = None
+        self.ate = False
+        self.ticks += 1
+
+        if bits[new_head >> 3] >> (new_head & 7) & 1 and self.is_border(new_head):
+            self.alive = False
+            self.death = DEATH_WALL
+            return False
+
+        if new_head == self.food:
+            self.ate = True
+            self.score += self.food_value
+        else:
+            # Free the tail first so the head may follow it into its cell
+            tail = body.pop()
+            bits[tail >> 3] &= ~(1 << (tail & 7))
+            if bits[new_head >> 3] >> (new_head & 7) & 1:
+                body.append(tail)
+                bits[tail >> 3] |= 1 << (tail & 7)
+                self.alive = False
+                self.death = DEATH_SELF
+                return False
+            self.removed = tail
+
+        body.appendleft(new_head)
+        bits[new_head >> 3] |= 1 << (new_head & 7)
+
+        if self.ate:
+            self.food = None
+            self.spawn_food()
+        return True
+
+    def nbytes(self):
+        """Bytes used by the occupancy bits and the body ring."""
+        return len(self.bits) + self.body.nbytes()